@@ -422,10 +422,10 @@ Examples:
         from app.orchestrator.config import get_default_config
         from scripts.process_ocr_backlog import process_ocr_backlog
         from pathlib import Path
+        from dataclasses import replace
         
         async def run_orchestrator():
-            config = get_default_config()
-            config.enable_monitoring = not args.no_monitoring
+            config = replace(get_default_config(), enable_monitoring=not args.no_monitoring)
             
             orchestrator = MultiSiteOrchestrator(config)
             
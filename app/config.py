@@ -73,6 +73,19 @@ OCR_ENABLE_MORPH_CLEANUP = os.getenv("OCR_ENABLE_MORPH_CLEANUP", "false").lower(
 # Pages with more than this many boxes will be skipped to avoid excessive recognition work
 # Default: 300 (increased from 100 to reduce skipped pages)
 OCR_MAX_BBOXES_PER_PAGE = int(os.getenv("OCR_MAX_BBOXES_PER_PAGE", "300"))
+# Images per Surya detection/recognition batch; size to GPU memory
+# Default: 0 (use Surya's per-device default)
+OCR_BATCH_SIZE = int(os.getenv("OCR_BATCH_SIZE", "0"))
+# Processes rendering PDF pages for OCR while the GPU runs detection
+# Default: 0 (one per CPU core)
+OCR_RASTERIZE_WORKERS = int(os.getenv("OCR_RASTERIZE_WORKERS", "0"))
+# Surya inference precision on GPU: fp16, bf16 or fp32 (CPU always runs fp32)
+OCR_PRECISION = os.getenv("OCR_PRECISION", "fp16").lower()
+# Run a dummy detection pass when the Surya models are loaded
+OCR_WARMUP = os.getenv("OCR_WARMUP", "true").lower() == "true"
+# Skip detection for pages whose thumbnail Laplacian variance exceeds this
+# (speckled/noisy scans). Default: 0 (disabled); tune on your own corpus
+OCR_NOISE_MAX_LAPLACIAN_VAR = float(os.getenv("OCR_NOISE_MAX_LAPLACIAN_VAR", "0"))
 
 # ============== PDF Processing Configuration ==============
 # Skip processing for PDFs larger than this size (in MB) - just download and store
@@ -108,6 +121,12 @@ SEMANTIC_SIMILARITY_THRESHOLD = float(os.getenv("SEMANTIC_SIMILARITY_THRESHOLD",
 DEDUP_ENABLED = os.getenv("DEDUP_ENABLED", "true").lower() == "true"
 DEDUP_SIMILARITY_THRESHOLD = float(os.getenv("DEDUP_SIMILARITY_THRESHOLD", "0.92"))  # 92% similarity
 
+# ============== Language Detection ==============
+# Path to a fastText language-ID model (lid.176.bin). When set and the fasttext
+# package is installed, the language filter batches detection through it;
+# otherwise it falls back to langdetect.
+LANGUAGE_MODEL_PATH = os.getenv("LANGUAGE_MODEL_PATH", "")
+
 # ============== MongoDB Configuration ==============
 MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
 MONGODB_DATABASE = os.getenv("MONGODB_DATABASE", "crawl")
@@ -119,6 +138,10 @@ DATA_DIR = BASE_DIR / "data"
 OUTPUT_DIR = BASE_DIR / "outputs"
 UPLOAD_DIR = os.getenv("UPLOAD_DIR", str(BASE_DIR / "uploads"))
 exported_images = os.getenv("EXPORTED_IMAGES_DIR", str(OUTPUT_DIR / "images"))
+# Format for exported document images: png or webp (lossless)
+EXPORTED_IMAGE_FORMAT = os.getenv("EXPORTED_IMAGE_FORMAT", "png").lower()
+# PNG zlib level 0-9; 1 encodes several times faster than PIL's default 6
+EXPORTED_IMAGE_COMPRESS_LEVEL = int(os.getenv("EXPORTED_IMAGE_COMPRESS_LEVEL", "1"))
 
 
 # ============== Validation ==============
@@ -299,6 +322,8 @@ class AppConfig:
     RAG_TOP_K = RAG_TOP_K
     UPLOAD_DIR = UPLOAD_DIR
     exported_images = exported_images
+    EXPORTED_IMAGE_FORMAT = EXPORTED_IMAGE_FORMAT
+    EXPORTED_IMAGE_COMPRESS_LEVEL = EXPORTED_IMAGE_COMPRESS_LEVEL
     BASE_DIR = BASE_DIR
     OUTPUT_DIR = OUTPUT_DIR
     DATA_DIR = DATA_DIR
@@ -7,6 +7,8 @@ Ensures all connections, executors, and resources are properly initialized and c
 
 import logging
 import asyncio
+import sys
+import time
 from typing import Optional
 
 from app.core.database import db_manager, startup_database, shutdown_database
@@ -14,6 +16,12 @@ from app.core.executor import executor_manager, shutdown_executor
 
 logger = logging.getLogger("app_lifecycle")
 
+# (module, shutdown function) for the pipeline process pools
+_PROCESS_POOL_SHUTDOWNS = (
+    ("app.crawling.stages.chunker", "shutdown_chunk_pool"),
+    ("app.crawling.stages.ocr_processor", "shutdown_rasterize_pool"),
+)
+
 
 class ApplicationLifecycle:
     """
@@ -27,6 +35,25 @@ class ApplicationLifecycle:
     
     _initialized = False
     _shutdown_called = False
+    # Serializes startup/shutdown so concurrent callers can't double-initialize;
+    # created lazily, once per event loop (a lock is bound to its loop)
+    _lock: Optional[asyncio.Lock] = None
+    _lock_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    # Short-lived health snapshot for frequently polled health endpoints:
+    # (db connected, executor active, executor references, initialized)
+    _HEALTH_CACHE_TTL = 0.1  # seconds
+    _health_cache: Optional[tuple] = None
+    _health_cache_time = 0.0
+    
+    @classmethod
+    def _get_lock(cls) -> asyncio.Lock:
+        """Get the startup/shutdown lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if cls._lock is None or cls._lock_loop is not loop:
+            cls._lock = asyncio.Lock()
+            cls._lock_loop = loop
+        return cls._lock
     
     @classmethod
     async def startup(cls):
@@ -34,33 +61,35 @@ class ApplicationLifecycle:
         Initialize all application resources.
         Call this once at application startup.
         """
-        if cls._initialized:
-            logger.warning("Application already initialized")
-            return
-        
-        try:
-            logger.info("=" * 60)
-            logger.info("Starting application initialization...")
-            logger.info("=" * 60)
-            
-            # 1. Initialize MongoDB connections
-            logger.info("1/2 Initializing database connections...")
-            await startup_database()
+        async with cls._get_lock():
+            if cls._initialized:
+                logger.warning("Application already initialized")
+                return
             
-            # 2. Pre-create thread pool executor (optional)
-            logger.info("2/2 Initializing thread pool executor...")
-            await executor_manager.acquire()
-            
-            cls._initialized = True
-            logger.info("=" * 60)
-            logger.info("✓ Application initialized successfully")
-            logger.info("=" * 60)
-            
-        except Exception as e:
-            logger.error(f"❌ Application startup failed: {e}", exc_info=True)
-            # Attempt cleanup on failed startup
-            await cls.shutdown()
-            raise
+            try:
+                logger.info("=" * 60)
+                logger.info("Starting application initialization...")
+                logger.info("=" * 60)
+                
+                # 1. Initialize MongoDB connections
+                logger.info("1/2 Initializing database connections...")
+                await startup_database()
+                
+                # 2. Pre-create thread pool executor (optional)
+                logger.info("2/2 Initializing thread pool executor...")
+                await executor_manager.acquire()
+                
+                cls._initialized = True
+                cls._health_cache = None
+                logger.info("=" * 60)
+                logger.info("✓ Application initialized successfully")
+                logger.info("=" * 60)
+                
+            except Exception as e:
+                logger.error(f"❌ Application startup failed: {e}", exc_info=True)
+                # Attempt cleanup on failed startup (lock already held)
+                await cls._shutdown()
+                raise
     
     @classmethod
     async def shutdown(cls):
@@ -68,31 +97,62 @@ class ApplicationLifecycle:
         Cleanup all application resources.
         Call this once at application shutdown.
         """
+        async with cls._get_lock():
+            await cls._shutdown()
+    
+    @classmethod
+    async def _shutdown(cls):
+        """Shutdown body; caller must hold cls._lock."""
         if cls._shutdown_called:
             logger.warning("Shutdown already called")
             return
         
         cls._shutdown_called = True
+        cls._health_cache = None
+        
+        logger.info("=" * 60)
+        logger.info("Starting application shutdown...")
+        logger.info("=" * 60)
         
+        # Each step runs even if an earlier one failed, so the database
+        # connections are always closed
+        ok = True
+        
+        # 1. Shutdown thread pool executor
+        logger.info("1/3 Shutting down thread pool executor...")
         try:
-            logger.info("=" * 60)
-            logger.info("Starting application shutdown...")
-            logger.info("=" * 60)
-            
-            # 1. Shutdown thread pool executor
-            logger.info("1/2 Shutting down thread pool executor...")
             await shutdown_executor()
-            
-            # 2. Close MongoDB connections
-            logger.info("2/2 Closing database connections...")
+        except Exception as e:
+            ok = False
+            logger.error(f"Error shutting down thread pool executor: {e}", exc_info=True)
+        
+        # 2. Shutdown pipeline process pools; a pool can only exist if its
+        # module was imported, so nothing is imported here
+        logger.info("2/3 Shutting down process pools...")
+        for module_name, shutdown_name in _PROCESS_POOL_SHUTDOWNS:
+            module = sys.modules.get(module_name)
+            if module is None:
+                continue
+            try:
+                await asyncio.to_thread(getattr(module, shutdown_name))
+            except Exception as e:
+                ok = False
+                logger.error(f"Error shutting down {module_name} process pool: {e}", exc_info=True)
+        
+        # 3. Close MongoDB connections
+        logger.info("3/3 Closing database connections...")
+        try:
             await shutdown_database()
-            
-            logger.info("=" * 60)
-            logger.info("✓ Application shutdown complete")
-            logger.info("=" * 60)
-            
         except Exception as e:
-            logger.error(f"Error during application shutdown: {e}", exc_info=True)
+            ok = False
+            logger.error(f"Error closing database connections: {e}", exc_info=True)
+        
+        logger.info("=" * 60)
+        if ok:
+            logger.info("✓ Application shutdown complete")
+        else:
+            logger.warning("Application shutdown completed with errors")
+        logger.info("=" * 60)
     
     @classmethod
     def is_initialized(cls) -> bool:
@@ -104,34 +164,42 @@ class ApplicationLifecycle:
         """
         Check health status of all resources.
         
+        The component states are cached for _HEALTH_CACHE_TTL seconds;
+        each call gets a freshly built dict, so callers may modify it.
+        
         Returns:
             Dict with health status of each component
         """
-        health = {
+        now = time.monotonic()
+        if cls._health_cache is None or now - cls._health_cache_time >= cls._HEALTH_CACHE_TTL:
+            # Read each property once
+            cls._health_cache = (
+                db_manager.is_connected,
+                executor_manager.is_active,
+                executor_manager.reference_count,
+                cls._initialized,
+            )
+            cls._health_cache_time = now
+        
+        db_connected, executor_active, executor_refs, initialized = cls._health_cache
+        all_healthy = db_connected and executor_active and initialized
+        
+        return {
             "database": {
-                "connected": db_manager.is_connected,
-                "status": "healthy" if db_manager.is_connected else "disconnected"
+                "connected": db_connected,
+                "status": "healthy" if db_connected else "disconnected"
             },
             "executor": {
-                "active": executor_manager.is_active,
-                "references": executor_manager.reference_count,
-                "status": "healthy" if executor_manager.is_active else "inactive"
+                "active": executor_active,
+                "references": executor_refs,
+                "status": "healthy" if executor_active else "inactive"
             },
             "application": {
-                "initialized": cls._initialized,
-                "status": "healthy" if cls._initialized else "not_initialized"
-            }
+                "initialized": initialized,
+                "status": "healthy" if initialized else "not_initialized"
+            },
+            "overall": "healthy" if all_healthy else "degraded",
         }
-        
-        # Overall health check
-        all_healthy = (
-            db_manager.is_connected and
-            executor_manager.is_active and
-            cls._initialized
-        )
-        health["overall"] = "healthy" if all_healthy else "degraded"
-        
-        return health
 
 
 # Convenience functions
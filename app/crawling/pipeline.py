@@ -5,8 +5,11 @@ Chains pipeline stages together for end-to-end web scraping.
 """
 
 import time
-import json
+import logging
+import itertools
+import zlib
 import aiofiles
+import orjson
 from pathlib import Path
 from typing import Optional
 
@@ -23,6 +26,33 @@ from app.config import get_logger
 
 logger = get_logger(__name__)
 
+# Number of chunks serialized per write when streaming results
+RESULTS_WRITE_BATCH = 500
+
+# Buffer size for output files so small writes coalesce into few syscalls
+WRITE_BUFFER_SIZE = 64 * 1024
+
+# gzip level for all_chunks.json.gz (low levels are fast and still ~5x smaller)
+RESULTS_COMPRESS_LEVEL = 3
+
+
+class _GzipStreamWriter:
+    """Async file wrapper that gzip-compresses everything written through it."""
+    
+    def __init__(self, f, level: int = RESULTS_COMPRESS_LEVEL):
+        self._f = f
+        # wbits=31 selects the gzip container so standard tools can read it
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    
+    async def write(self, data: bytes) -> None:
+        compressed = self._compressor.compress(data)
+        if compressed:
+            await self._f.write(compressed)
+    
+    async def finish(self) -> None:
+        """Flush remaining compressed data and the gzip trailer."""
+        await self._f.write(self._compressor.flush())
+
 
 class WebScrapingPipeline:
     """
@@ -41,6 +71,7 @@ class WebScrapingPipeline:
             .add_stage(OCRDecisionStage())
             .add_stage(OCRProcessorStage())
             .add_stage(ChunkerStage())
+            .build()
         )
         
         result = await pipeline.run("https://example.com")
@@ -55,7 +86,8 @@ class WebScrapingPipeline:
             config: Pipeline configuration (uses defaults if not provided)
         """
         self.config = config or PipelineConfig()
-        self.stages: list[PipelineStage] = []
+        self.stages: list[PipelineStage] | tuple[PipelineStage, ...] = []
+        self._intermediate_fp = None  # Open append handle for intermediate/pipeline.jsonl
     
     def add_stage(self, stage: PipelineStage) -> "WebScrapingPipeline":
         """
@@ -68,9 +100,22 @@ class WebScrapingPipeline:
             Self for fluent chaining
         """
         stage.config = self.config
+        if isinstance(self.stages, tuple):
+            # Already built; reopen the stage list to extend it
+            self.stages = list(self.stages)
         self.stages.append(stage)
         return self
     
+    def build(self) -> "WebScrapingPipeline":
+        """
+        Freeze the stage list once all stages are added.
+        
+        Returns:
+            Self for fluent chaining
+        """
+        self.stages = tuple(self.stages)
+        return self
+    
     async def run(self, start_url: str) -> Document:
         """
         Execute the pipeline on a URL.
@@ -81,10 +126,11 @@ class WebScrapingPipeline:
         Returns:
             Document with all processed data
         """
-        logger.info(f"Starting pipeline for {start_url}")
-        logger.info(f"Stages: {[s.name for s in self.stages]}")
+        logger.info("Starting pipeline for %s", start_url)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Stages: %s", [s.name for s in self.stages])
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Initialize document
         document = Document(
@@ -94,24 +140,35 @@ class WebScrapingPipeline:
             max_pages=self.config.crawl.max_pages,
         )
         
+        # Resolve once; config does not change while the pipeline runs
+        save_intermediate = self.config.save_intermediate
+        
+        # Create output directories once up front for both save paths
+        self.config.output_dir.mkdir(parents=True, exist_ok=True)
+        if save_intermediate:
+            (self.config.output_dir / "intermediate").mkdir(exist_ok=True)
+        
         # Execute each stage
         for stage in self.stages:
             try:
                 document = await stage.run(document)
                 
                 # Save intermediate results if configured
-                if self.config.save_intermediate:
+                if save_intermediate:
                     await self._save_intermediate(document, stage.name)
                     
             except Exception as e:
-                logger.error(f"Pipeline failed at stage {stage.name}: {e}")
+                logger.error("Pipeline failed at stage %s: %s", stage.name, e)
+                await self._close_intermediate()
                 raise
         
-        elapsed = time.time() - start_time
-        logger.info(f"Pipeline complete in {elapsed:.1f}s")
+        await self._close_intermediate()
+        
+        elapsed_s = (time.perf_counter_ns() - start_ns) / 1e9
+        logger.info("Pipeline complete in %.1fs", elapsed_s)
         logger.info(
-            f"Results: {document.total_pages} pages, "
-            f"{document.total_chunks} chunks"
+            "Results: %d pages, %d chunks",
+            document.total_pages, document.total_chunks,
         )
         
         # Save final results
@@ -120,48 +177,98 @@ class WebScrapingPipeline:
         return document
     
     async def _save_intermediate(self, document: Document, stage_name: str) -> None:
-        """Save intermediate results after each stage."""
-        output_dir = self.config.output_dir
-        intermediate_dir = output_dir / "intermediate"
-        intermediate_dir.mkdir(parents=True, exist_ok=True)
+        """
+        Record intermediate state after a stage.
+        
+        Each state is appended as one JSON line to intermediate/pipeline.jsonl.
+        The file is opened once per run with a large buffer and closed by
+        _close_intermediate(), so stages cost a buffered append, not a file.
+        """
+        if self._intermediate_fp is None:
+            state_file = self.config.output_dir / "intermediate" / "pipeline.jsonl"
+            self._intermediate_fp = await aiofiles.open(
+                state_file, 'ab', buffering=WRITE_BUFFER_SIZE
+            )
         
         state = {
+            "start_url": document.start_url,
             "stage": stage_name,
             "pages_count": len(document.pages),
             "pages_scraped": document.pages_scraped,
             "pdfs_downloaded": document.pdfs_downloaded,
             "pages_failed": document.pages_failed,
         }
+        await self._intermediate_fp.write(orjson.dumps(state, default=str) + b"\n")
+    
+    async def _close_intermediate(self) -> None:
+        """Flush and close the intermediate state log, if open."""
+        if self._intermediate_fp is None:
+            return
         
-        state_file = intermediate_dir / f"after_{stage_name}.json"
-        async with aiofiles.open(state_file, 'w') as f:
-            await f.write(json.dumps(state, indent=2))
+        try:
+            await self._intermediate_fp.close()
+        finally:
+            self._intermediate_fp = None
     
     async def _save_results(self, document: Document) -> None:
-        """Save final pipeline results."""
+        """
+        Save final pipeline results.
+        
+        Chunks are serialized and written in batches so the whole
+        corpus never exists as a single JSON string in memory, and
+        gzip-compressed on the way out (all_chunks.json.gz).
+        """
         output_dir = self.config.output_dir
-        output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Save chunks
-        parents, children = document.get_all_chunks()
+        # Count chunks per page instead of concatenating them into new lists
+        total_parents = sum(len(page.parent_chunks) for page in document.pages)
+        total_children = sum(len(page.child_chunks) for page in document.pages)
+        
+        metadata = {
+            "start_url": document.start_url,
+            "total_pages": document.total_pages,
+            "total_parents": total_parents,
+            "total_children": total_children,
+            "duration_seconds": document.duration_seconds,
+        }
         
-        chunks_file = output_dir / "all_chunks.json"
-        chunks_data = json.dumps({
-            "parents": parents,
-            "children": children,
-            "metadata": {
-                "start_url": document.start_url,
-                "total_pages": document.total_pages,
-                "total_parents": len(parents),
-                "total_children": len(children),
-                "duration_seconds": document.duration_seconds,
-            }
-        }, indent=2)
+        chunks_file = output_dir / "all_chunks.json.gz"
+        async with aiofiles.open(chunks_file, 'wb', buffering=WRITE_BUFFER_SIZE) as raw:
+            f = _GzipStreamWriter(raw)
+            await f.write(b'{"parents": ')
+            await self._write_json_array(f, self._iter_chunks(document, "parent_chunks"))
+            await f.write(b', "children": ')
+            await self._write_json_array(f, self._iter_chunks(document, "child_chunks"))
+            await f.write(b', "metadata": ')
+            await f.write(orjson.dumps(metadata, default=str))
+            await f.write(b'}')
+            await f.finish()
+        
+        logger.info("Saved %d parent chunks, %d child chunks", total_parents, total_children)
+    
+    @staticmethod
+    def _iter_chunks(document: Document, attr: str):
+        """Yield chunks stored under `attr` on each page, in page order."""
+        for page in document.pages:
+            yield from getattr(page, attr)
+    
+    @staticmethod
+    async def _write_json_array(f, items) -> None:
+        """Stream an iterable of JSON-serializable items as a JSON array (binary mode)."""
+        items = iter(items)
+        await f.write(b'[')
         
-        async with aiofiles.open(chunks_file, 'w') as f:
-            await f.write(chunks_data)
+        first = True
+        while True:
+            batch = list(itertools.islice(items, RESULTS_WRITE_BATCH))
+            if not batch:
+                break
+            if not first:
+                await f.write(b', ')
+            await f.write(b', '.join(orjson.dumps(item, default=str) for item in batch))
+            first = False
         
-        logger.info(f"Saved {len(parents)} parent chunks, {len(children)} child chunks")
+        await f.write(b']')
     
     @classmethod
     def create_default(
@@ -195,6 +302,7 @@ class WebScrapingPipeline:
             .add_stage(OCRProcessorStage())
             .add_stage(LanguageFilterStage())
             .add_stage(ChunkerStage())
+            .build()
         )
     
     def __repr__(self) -> str:
@@ -6,6 +6,8 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 import time
 
+from app.core.logging import get_logger
+
 if TYPE_CHECKING:
     from app.crawling.models.document import Document
     from app.crawling.models.config import PipelineConfig
@@ -78,7 +80,6 @@ class PipelineStage(ABC):
     def logger(self):
         """Get logger for this stage."""
         if self._logger is None:
-            from app.config import get_logger
             self._logger = get_logger(f"pipeline.{self.name}")
         return self._logger
     
@@ -113,22 +114,22 @@ class PipelineStage(ABC):
         Returns:
             Processed document
         """
-        self.logger.info(f"Starting stage: {self.name}")
-        start_time = time.time()
+        self.logger.info("Starting stage: %s", self.name)
+        start_ns = time.perf_counter_ns()
         
         try:
             await self.setup()
             result = await self.process(document)
             await self.teardown()
             
-            elapsed = (time.time() - start_time) * 1000
-            self.logger.info(f"Completed stage: {self.name} ({elapsed:.1f}ms)")
+            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
+            self.logger.info("Completed stage: %s (%.1fms)", self.name, elapsed_ms)
             
             return result
             
         except Exception as e:
-            elapsed = (time.time() - start_time) * 1000
-            self.logger.error(f"Stage {self.name} failed after {elapsed:.1f}ms: {e}")
+            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
+            self.logger.error("Stage %s failed after %.1fms: %s", self.name, elapsed_ms, e)
             raise
     
     def __repr__(self) -> str:
@@ -2,16 +2,58 @@
 Chunker stage - splits text into chunks for embeddings.
 """
 
+import asyncio
+import os
 import re
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional, Sequence
+from urllib.parse import urlparse
 
 from app.crawling.stages.base import PipelineStage
-from app.crawling.models.document import Document, Page
+from app.crawling.models.document import Document
 
 from app.config import get_logger
 
 logger = get_logger(__name__)
 
+# Sentence boundary: whitespace after . ! or ?, unless the period ends a
+# common abbreviation. One fixed-width lookbehind per abbreviation because
+# stdlib re does not support variable-width lookbehind.
+_ABBREVIATIONS = ("Dr", "Mr", "Mrs", "Ms", "Prof", "Inc", "Ltd", "Jr", "Sr")
+_SENT_SPLIT_RE = re.compile(
+    "".join(rf"(?<!\b{abbr}\.)" for abbr in _ABBREVIATIONS) + r"(?<=[.!?])\s+"
+)
+
+# Dedicated process pool for CPU-bound chunking (created on first use)
+_chunk_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_chunk_pool() -> ProcessPoolExecutor:
+    """
+    Get or create the process pool used for chunking.
+    
+    Kept separate from the shared thread pool in app.core.executor:
+    chunking is pure Python and would serialize on the GIL there.
+    """
+    global _chunk_pool
+    
+    if _chunk_pool is None:
+        max_workers = os.cpu_count() or 1
+        _chunk_pool = ProcessPoolExecutor(max_workers=max_workers)
+        logger.info(f"Created chunking process pool with {max_workers} workers")
+    
+    return _chunk_pool
+
+
+def shutdown_chunk_pool() -> None:
+    """Shutdown the chunking process pool. Call on application shutdown."""
+    global _chunk_pool
+    
+    if _chunk_pool is not None:
+        _chunk_pool.shutdown(wait=True)
+        _chunk_pool = None
+
 
 class ChunkerStage(PipelineStage):
     """
@@ -25,6 +67,7 @@ class ChunkerStage(PipelineStage):
     - Semantic break detection
     - Configurable chunk sizes
     - Parent/child hierarchy
+    - Pages chunked in parallel on a process pool
     """
     
     @property
@@ -37,7 +80,7 @@ class ChunkerStage(PipelineStage):
         
         Args:
             document: Document with extracted text
-            
+        
         Returns:
             Document with chunks populated
         """
@@ -46,150 +89,193 @@ class ChunkerStage(PipelineStage):
         max_words = config.dom_chunk_max_words if config else 300
         overlap = config.chunk_overlap_words if config else 30
         
+        pages = [
+            page for page in document.pages
+            if page.content and page.content.text
+        ]
+        
+        # Chunk pages in parallel off the event loop
+        loop = asyncio.get_running_loop()
+        pool = get_chunk_pool()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    pool,
+                    chunk_page_text,
+                    page.content.text,
+                    page.url,
+                    page.content.source.value,
+                    min_words,
+                    max_words,
+                    overlap,
+                )
+                for page in pages
+            ),
+            return_exceptions=True,
+        )
+        
         total_parents = 0
         total_children = 0
         
-        for page in document.pages:
-            if not page.content or not page.content.text:
+        for page, result in zip(pages, results):
+            if isinstance(result, Exception):
+                logger.error(f"Chunking failed for {page.url}: {result}")
                 continue
             
-            try:
-                parents, children = self._chunk_page(
-                    page, min_words, max_words, overlap
-                )
-                page.parent_chunks = parents
-                page.child_chunks = children
-                
-                total_parents += len(parents)
-                total_children += len(children)
-                
-            except Exception as e:
-                logger.error(f"Chunking failed for {page.url}: {e}")
+            parents, children = result
+            page.parent_chunks = parents
+            page.child_chunks = children
+            
+            total_parents += len(parents)
+            total_children += len(children)
         
         logger.info(f"Created {total_parents} parent, {total_children} child chunks")
         
         return document
+
+
+def chunk_page_text(
+    text: str,
+    url: str,
+    source: str,
+    min_words: int,
+    max_words: int,
+    overlap: int,
+) -> tuple[list[dict], list[dict]]:
+    """
+    Chunk a single page's text into parent/child chunks.
     
-    def _chunk_page(
-        self, page: Page, min_words: int, max_words: int, overlap: int
-    ) -> tuple[list[dict], list[dict]]:
-        """Chunk a single page."""
-        text = page.content.text
-        doc_id = self._get_doc_id(page)
-        
-        # Split into sentences
-        sentences = self._split_into_sentences(text)
-        
-        # Group into chunks
-        chunks = self._group_sentences(sentences, min_words, max_words, overlap)
-        
-        # Create parent/child structure
-        parents = []
-        children = []
-        
-        for i, chunk_text in enumerate(chunks):
-            chunk_id = f"{doc_id}_chunk_{i}"
-            
-            parent = {
-                "id": chunk_id,
-                "text": chunk_text,
-                "doc_id": doc_id,
-                "url": page.url,
-                "chunk_index": i,
-                "type": "parent",
-                "word_count": len(chunk_text.split()),
-                "source": page.content.source.value,
-            }
-            parents.append(parent)
-            
-            # Create child chunks (smaller overlapping segments)
-            child_sentences = self._split_into_sentences(chunk_text)
-            for j, sent in enumerate(child_sentences):
-                if len(sent.split()) >= 10:  # Minimum 10 words
-                    child = {
-                        "id": f"{chunk_id}_child_{j}",
-                        "text": sent,
-                        "parent_id": chunk_id,
-                        "doc_id": doc_id,
-                        "url": page.url,
-                        "type": "child",
-                        "word_count": len(sent.split()),
-                        "source": page.content.source.value,
-                    }
-                    children.append(child)
-        
-        return parents, children
+    Depends only on its arguments so it can run in a worker process.
     
-    def _split_into_sentences(self, text: str) -> list[str]:
-        """Split text into sentences."""
-        # Handle common abbreviations
-        text = re.sub(r'\b(Dr|Mr|Mrs|Ms|Prof|Inc|Ltd|Jr|Sr)\.',
-                      r'\1<PERIOD>', text)
-        
-        # Split on sentence endings
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        
-        # Restore abbreviations
-        sentences = [s.replace('<PERIOD>', '.') for s in sentences]
+    Args:
+        text: Page text
+        url: Page URL
+        source: Content source value (dom, ocr, hybrid)
+        min_words: Minimum words per parent chunk
+        max_words: Maximum words per parent chunk
+        overlap: Overlap words between consecutive parent chunks
+    
+    Returns:
+        Tuple of (parent_chunks, child_chunks)
+    """
+    doc_id = _get_doc_id(url)
+    
+    # Split into sentences and count words once
+    sentences = split_into_sentences(text)
+    word_counts = [len(s.split()) for s in sentences]
+    
+    # Group into chunks
+    chunks = _group_sentences(
+        sentences, word_counts, min_words, max_words, overlap
+    )
+    
+    # Create parent/child structure
+    parents = []
+    children = []
+    
+    for i, (chunk_sentences, chunk_counts) in enumerate(chunks):
+        chunk_id = f"{doc_id}_chunk_{i}"
         
-        return [s.strip() for s in sentences if s.strip()]
-    
-    def _group_sentences(
-        self,
-        sentences: list[str],
-        min_words: int,
-        max_words: int,
-        overlap: int,
-    ) -> list[str]:
-        """Group sentences into chunks."""
-        chunks = []
-        current_chunk = []
-        current_words = 0
+        parent = {
+            "id": chunk_id,
+            "text": " ".join(chunk_sentences),
+            "doc_id": doc_id,
+            "url": url,
+            "chunk_index": i,
+            "type": "parent",
+            "word_count": sum(chunk_counts),
+            "source": source,
+        }
+        parents.append(parent)
         
-        for sentence in sentences:
-            sentence_words = len(sentence.split())
-            
-            # Check if adding this sentence exceeds max
-            if current_words + sentence_words > max_words and current_words >= min_words:
-                # Save current chunk
-                chunks.append(" ".join(current_chunk))
-                
-                # Start new chunk with overlap
-                overlap_text = self._get_overlap(current_chunk, overlap)
-                current_chunk = [overlap_text] if overlap_text else []
-                current_words = len(overlap_text.split()) if overlap_text else 0
+        # Create child chunks from the chunk's own sentences
+        for j, (sent, sent_words) in enumerate(zip(chunk_sentences, chunk_counts)):
+            if sent_words >= 10:  # Minimum 10 words
+                child = {
+                    "id": f"{chunk_id}_child_{j}",
+                    "text": sent,
+                    "parent_id": chunk_id,
+                    "doc_id": doc_id,
+                    "url": url,
+                    "type": "child",
+                    "word_count": sent_words,
+                    "source": source,
+                }
+                children.append(child)
+    
+    return parents, children
+
+
+def split_into_sentences(text: str) -> list[str]:
+    """Split text into sentences."""
+    # The split consumes all inter-sentence whitespace, so only the
+    # ends of the whole text need stripping
+    return [s for s in _SENT_SPLIT_RE.split(text.strip()) if s]
+
+
+def _group_sentences(
+    sentences: Sequence[str],
+    word_counts: list[int],
+    min_words: int,
+    max_words: int,
+    overlap: int,
+) -> list[tuple[list[str], list[int]]]:
+    """
+    Group sentences into chunks.
+    
+    Returns:
+        List of (sentences, word_counts) pairs, one per chunk
+    """
+    chunks = []
+    current_chunk = []
+    current_counts = []
+    current_words = 0
+    
+    for sentence, sentence_words in zip(sentences, word_counts):
+        # Check if adding this sentence exceeds max
+        if current_words + sentence_words > max_words and current_words >= min_words:
+            # Save current chunk
+            chunks.append((current_chunk, current_counts))
             
-            current_chunk.append(sentence)
-            current_words += sentence_words
-        
-        # Don't forget the last chunk
-        if current_chunk and current_words >= min_words // 2:
-            chunks.append(" ".join(current_chunk))
+            # Start new chunk with overlap
+            current_chunk, current_counts = _get_overlap(
+                current_chunk, current_counts, overlap
+            )
+            current_words = sum(current_counts)
         
-        return chunks
+        current_chunk.append(sentence)
+        current_counts.append(sentence_words)
+        current_words += sentence_words
     
-    def _get_overlap(self, sentences: list[str], target_words: int) -> str:
-        """Get overlap text from end of sentences."""
-        if not sentences:
-            return ""
-        
-        overlap_sentences = []
-        word_count = 0
-        
-        for sentence in reversed(sentences):
-            words = len(sentence.split())
-            if word_count + words <= target_words:
-                overlap_sentences.insert(0, sentence)
-                word_count += words
-            else:
-                break
-        
-        return " ".join(overlap_sentences)
+    # Don't forget the last chunk
+    if current_chunk and current_words >= min_words // 2:
+        chunks.append((current_chunk, current_counts))
     
-    def _get_doc_id(self, page: Page) -> str:
-        """Generate document ID from page."""
-        from urllib.parse import urlparse
-        
-        parsed = urlparse(page.url)
-        path = parsed.path.replace("/", "_").strip("_")
-        return f"{parsed.netloc}_{path}"[:100]  # Limit length
+    return chunks
+
+
+def _get_overlap(
+    sentences: list[str], word_counts: list[int], target_words: int
+) -> tuple[list[str], list[int]]:
+    """Get overlap sentences and their word counts from end of sentences."""
+    overlap_sentences = []
+    overlap_counts = []
+    word_count = 0
+    
+    for sentence, words in zip(reversed(sentences), reversed(word_counts)):
+        if word_count + words <= target_words:
+            overlap_sentences.insert(0, sentence)
+            overlap_counts.insert(0, words)
+            word_count += words
+        else:
+            break
+    
+    return overlap_sentences, overlap_counts
+
+
+@lru_cache(maxsize=4096)
+def _get_doc_id(url: str) -> str:
+    """Generate document ID from page URL."""
+    parsed = urlparse(url)
+    path = parsed.path.replace("/", "_").strip("_")
+    return f"{parsed.netloc}_{path}"[:100]  # Limit length
@@ -7,11 +7,21 @@ import aiohttp
 import aiofiles
 import uuid
 import asyncio
+import contextlib
 import hashlib
+import os
+import shutil
 import time
+from collections import deque
 from pathlib import Path
-from typing import Optional, Set, TYPE_CHECKING
-from urllib.parse import urlparse, urljoin
+from typing import AsyncIterator, Awaitable, Callable, Optional, Set, TYPE_CHECKING
+from urllib.parse import ParseResult, urlparse, urljoin
+
+try:
+    import blake3  # type: ignore
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
 
 if TYPE_CHECKING:
     from playwright.async_api import Browser, BrowserContext
@@ -21,11 +31,50 @@ from app.crawling.models.document import Document, Page
 from app.crawling.utils.rate_limiter import RateLimiter
 from app.crawling.utils.content_filter import ContentFilter
 from app.crawling.utils.robots import RobotsRules, parse_robots_txt, parse_sitemap
+from app.crawling.utils.bloom_filter import BloomFilter
 
 from app.config import get_logger
 
 logger = get_logger(__name__)
 
+# Read size when streaming PDF downloads to disk
+PDF_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Pages crawled at once per crawl (one browser context each)
+CRAWL_CONCURRENCY = 4
+
+# Maximum PDFs downloaded at once per crawl
+PDF_DOWNLOAD_CONCURRENCY = 8
+
+# Pages buffered by stream() before the crawl waits for the caller
+STREAM_BUFFER_SIZE = 64
+
+# How long to wait for rendered text before falling back to networkidle
+PAGE_TEXT_WAIT_MS = 5000
+MIN_PAGE_TEXT_CHARS = 100
+
+# Requests aborted in crawl contexts: fonts and media don't affect the
+# extracted text, images or printed PDF
+BLOCKED_RESOURCES_GLOB = "**/*.{woff,woff2,ttf,otf,eot,mp4,webm,ogg,mp3,wav}"
+
+# PDF metadata records buffered before one bulk MongoDB write
+PDF_RECORD_BATCH_SIZE = 100
+
+# Random file ids generated per os.urandom() call
+ID_BATCH_SIZE = 256
+
+# URL path extensions that are assets rather than pages (image, css, js, fonts)
+_INVALID_EXTENSIONS = frozenset({
+    "css", "js", "png", "jpg", "jpeg", "gif", "svg", "ico",
+    "woff", "woff2", "ttf", "eot",
+})
+
+
+def _path_extension(path: str) -> str:
+    """Lowercased extension of a URL path ("" if none)."""
+    dot = path.rfind(".")
+    return path[dot + 1:].lower() if dot >= 0 else ""
+
 
 class CrawlerStage(PipelineStage):
     """
@@ -45,10 +94,16 @@ class CrawlerStage(PipelineStage):
     def __init__(self, config=None):
         super().__init__(config)
         self._browser: Optional[Browser] = None
-        self._context: Optional[BrowserContext] = None
         self._rate_limiter: Optional[RateLimiter] = None
         self._content_filter: Optional[ContentFilter] = None
         self._robots: Optional[RobotsRules] = None
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._id_pool: deque[str] = deque()
+        self._pending_pdfs: list[tuple] = []  # (website_url, session_id, visited_url, depth, PdfDocument)
+        self._flush_lock = asyncio.Lock()
+        # Per-host robots.txt / sitemap results, reused across crawls of the same site
+        self._robots_cache: dict[str, RobotsRules] = {}
+        self._sitemap_cache: dict[str, Set[str]] = {}
     
     @property
     def name(self) -> str:
@@ -72,15 +127,46 @@ class CrawlerStage(PipelineStage):
             include_patterns=crawl_config.include_patterns if crawl_config else [],
             exclude_patterns=crawl_config.exclude_patterns if crawl_config else [],
         )
+        
+        self._get_http()
     
     async def teardown(self) -> None:
         """
         Cleanup resources.
         
         Browser is closed automatically by the context manager in process(),
-        so we don't need to do it here.
+        so only pending PDF records and the HTTP session are handled here.
         """
-        pass
+        await self._flush_pdf_records()
+        
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+    
+    def _get_http(self) -> aiohttp.ClientSession:
+        """Get or create the HTTP session shared by all PDF downloads."""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=PDF_DOWNLOAD_CONCURRENCY,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30,
+                )
+            )
+        return self._http
+    
+    def _new_id(self) -> str:
+        """
+        Get a random 128-bit id (32 hex chars) for file names.
+        
+        Ids are cut from one os.urandom() call per batch instead of
+        building a UUID object per file.
+        """
+        if not self._id_pool:
+            raw = os.urandom(16 * ID_BATCH_SIZE)
+            self._id_pool.extend(raw[i:i + 16].hex() for i in range(0, len(raw), 16))
+        return self._id_pool.popleft()
     
     async def process(self, document: Document) -> Document:
         """
@@ -92,6 +178,58 @@ class CrawlerStage(PipelineStage):
         Returns:
             Document populated with discovered pages
         """
+        await self._crawl(document)
+        return document
+    
+    async def stream(self, document: Document) -> AsyncIterator[Page]:
+        """
+        Crawl website, yielding each page as soon as it is downloaded.
+        
+        Pages are still added to document; the crawl keeps running in the
+        background while the caller handles each page, and pauses once
+        STREAM_BUFFER_SIZE pages are waiting for the caller. Iterate it
+        inside contextlib.aclosing() so the crawl is stopped as soon as the
+        caller stops reading.
+        
+        Args:
+            document: Document with start_url set
+            
+        Yields:
+            Crawled pages and downloaded PDFs, in completion order
+        """
+        pages: asyncio.Queue = asyncio.Queue(maxsize=STREAM_BUFFER_SIZE)
+        
+        def end_of_stream(task: asyncio.Task) -> None:
+            # Wake the reader; if the buffer is full it sees the crawl is
+            # done once drained. A cancelled crawl has no reader left.
+            if not task.cancelled():
+                with contextlib.suppress(asyncio.QueueFull):
+                    pages.put_nowait(None)
+        
+        crawl = asyncio.create_task(self._crawl(document, on_page=pages.put))
+        crawl.add_done_callback(end_of_stream)
+        try:
+            while True:
+                if crawl.done() and pages.empty():
+                    break
+                page = await pages.get()
+                if page is None:
+                    break
+                yield page
+            # Surface crawl errors to the caller
+            await crawl
+        finally:
+            if not crawl.done():
+                crawl.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await crawl
+    
+    async def _crawl(
+        self,
+        document: Document,
+        on_page: Optional[Callable[[Page], Awaitable[None]]] = None,
+    ) -> None:
+        """Crawl website into document, passing each new page to on_page."""
         start_url = document.start_url
         output_dir = document.output_dir or self.config.output_dir
         output_dir = output_dir.resolve()  # Convert to absolute path
@@ -111,7 +249,11 @@ class CrawlerStage(PipelineStage):
         # Parse robots.txt
         if crawl_config and crawl_config.respect_robots:
             logger.info(f"Respecting robots.txt for {base_domain}")
-            self._robots = parse_robots_txt(start_url)
+            self._robots = self._robots_cache.get(base_domain)
+            if self._robots is None:
+                # Blocking HTTP fetch + parse; keep it off the event loop
+                self._robots = await asyncio.to_thread(parse_robots_txt, start_url)
+                self._robots_cache[base_domain] = self._robots
             if self._robots.crawl_delay > 0:
                 self._rate_limiter.base_delay = max(
                     self._rate_limiter.base_delay,
@@ -123,7 +265,10 @@ class CrawlerStage(PipelineStage):
         # Discover URLs from sitemap
         discovered_urls: Set[str] = set()
         if crawl_config and crawl_config.use_sitemap:
-            discovered_urls = parse_sitemap(start_url)
+            discovered_urls = self._sitemap_cache.get(base_domain)
+            if discovered_urls is None:
+                discovered_urls = await asyncio.to_thread(parse_sitemap, start_url)
+                self._sitemap_cache[base_domain] = discovered_urls
         
         # Initialize crawl queue
         queue: asyncio.Queue = asyncio.Queue()
@@ -135,93 +280,143 @@ class CrawlerStage(PipelineStage):
         
         logger.info(f"Crawl queue initialized with {queue.qsize()} URLs (start_url + {len(discovered_urls)} from sitemap)")
         
-        visited: Set[str] = set()
+        # Visited URLs; the crawl stops at max_pages, so size the filter for that
+        visited = BloomFilter(capacity=max_pages)
         pdf_mapping: dict = {}  # Maps pdf_url -> (referring_page_url, depth)
         
+        async def crawl_url(url: str, depth: int, context: "BrowserContext") -> None:
+            """Crawl one queued URL and enqueue the links it leads to."""
+            logger.info(f"Processing URL from queue: {url} (depth={depth})")
+            
+            # Skip if already visited
+            if url in visited:
+                logger.info(f"Already visited, skipping: {url}")
+                return
+            
+            # Normalize URL
+            url = self._normalize_url(url)
+            
+            # Check content filter
+            should_skip, reason = self._content_filter.should_skip_url(url)
+            if should_skip:
+                logger.info(f"Skipping {url}: {reason}")
+                document.pages_skipped += 1
+                return
+            
+            # Check robots.txt
+            if self._robots and not self._robots.can_fetch(url):
+                logger.info(f"Blocked by robots.txt: {url}")
+                document.pages_skipped += 1
+                return
+            
+            visited.add(url)
+            
+            # Handle PDFs separately
+            if self._is_pdf(url):
+                # Store PDF with None as referring page (directly visited)
+                if url not in pdf_mapping:
+                    pdf_mapping[url] = (None, depth)
+                return
+            
+            # Rate limit
+            await self._rate_limiter.wait()
+            
+            try:
+                logger.info(f"Attempting to crawl: {url}")
+                page = await self._crawl_single_page(url, depth, output_dir, context)
+                document.add_page(page)
+                if on_page is not None:
+                    await on_page(page)
+                self._rate_limiter.success()
+                logger.info(f"Successfully crawled: {url} (found {len(page.html_content) if page.html_content else 0} chars)")
+                
+                # Extract links for further crawling
+                if depth < max_depth and page.html_content:
+                    links = await self._extract_links_from_html(
+                        page.html_content, url, base_domain
+                    )
+                    logger.info(f"Found {len(links)} links on {url}")
+                    for link in links:
+                        if link not in visited:
+                            # Check if link is a PDF and track the referring page
+                            if self._is_pdf(link):
+                                if link not in pdf_mapping:
+                                    pdf_mapping[link] = (url, depth + 1)  # Store referring page
+                            else:
+                                await queue.put((link, depth + 1))
+                            
+            except Exception as e:
+                logger.error(f"Failed to crawl {url}: {e}", exc_info=True)
+                self._rate_limiter.failure()
+                document.pages_failed += 1
+        
+        async def crawl_worker(context: "BrowserContext") -> None:
+            """Take URLs off the shared queue until cancelled."""
+            # Nothing awaits between the max_pages check, the queue pop and
+            # crawl_url() marking the URL visited, so no lock is needed
+            while True:
+                url, depth = await queue.get()
+                try:
+                    # Past max_pages, just drain the queue so join() returns
+                    if len(visited) < max_pages:
+                        await crawl_url(url, depth, context)
+                finally:
+                    queue.task_done()
+        
         # Lazy import playwright
         from playwright.async_api import async_playwright
         
         async with async_playwright() as p:
             self._browser = await p.chromium.launch(headless=True)
-            self._context = await self._browser.new_context(
-                user_agent="Mozilla/5.0 (compatible; DoclingBot/1.0)"
+            
+            # One browser context per worker so pages don't share an IPC channel
+            contexts = [
+                await self._browser.new_context(
+                    user_agent="Mozilla/5.0 (compatible; DoclingBot/1.0)"
+                )
+                for _ in range(CRAWL_CONCURRENCY)
+            ]
+            for context in contexts:
+                await context.route(BLOCKED_RESOURCES_GLOB, lambda route: route.abort())
+            workers = [
+                asyncio.create_task(crawl_worker(context)) for context in contexts
+            ]
+            
+            # Every queued URL is done (including links enqueued while
+            # crawling), unless a worker died first
+            queue_drained = asyncio.create_task(queue.join())
+            await asyncio.wait(
+                [queue_drained, *workers], return_when=asyncio.FIRST_COMPLETED
             )
             
-            while not queue.empty() and len(visited) < max_pages:
-                url, depth = await queue.get()
-                
-                logger.info(f"Processing URL from queue: {url} (depth={depth})")
-                
-                # Skip if already visited
-                if url in visited:
-                    logger.info(f"Already visited, skipping: {url}")
-                    continue
-                
-                # Normalize URL
-                url = self._normalize_url(url)
-                
-                # Check content filter
-                should_skip, reason = self._content_filter.should_skip_url(url)
-                if should_skip:
-                    logger.info(f"Skipping {url}: {reason}")
-                    document.pages_skipped += 1
-                    continue
-                
-                # Check robots.txt
-                if self._robots and not self._robots.can_fetch(url):
-                    logger.info(f"Blocked by robots.txt: {url}")
-                    document.pages_skipped += 1
-                    continue
-                
-                visited.add(url)
-                
-                # Handle PDFs separately
-                if self._is_pdf(url):
-                    # Store PDF with None as referring page (directly visited)
-                    if url not in pdf_mapping:
-                        pdf_mapping[url] = (None, depth)
-                    continue
-                
-                # Rate limit
-                await self._rate_limiter.wait()
-                
-                try:
-                    logger.info(f"Attempting to crawl: {url}")
-                    page = await self._crawl_single_page(url, depth, output_dir)
-                    document.add_page(page)
-                    self._rate_limiter.success()
-                    logger.info(f"Successfully crawled: {url} (found {len(page.html_content) if page.html_content else 0} chars)")
-                    
-                    # Extract links for further crawling
-                    if depth < max_depth and page.html_content:
-                        links = await self._extract_links_from_html(
-                            page.html_content, url, base_domain
-                        )
-                        logger.info(f"Found {len(links)} links on {url}")
-                        for link in links:
-                            if link not in visited:
-                                # Check if link is a PDF and track the referring page
-                                if self._is_pdf(link):
-                                    if link not in pdf_mapping:
-                                        pdf_mapping[link] = (url, depth + 1)  # Store referring page
-                                else:
-                                    await queue.put((link, depth + 1))
-                                
-                except Exception as e:
-                    logger.error(f"Failed to crawl {url}: {e}", exc_info=True)
-                    self._rate_limiter.failure()
-                    document.pages_failed += 1
+            queue_drained.cancel()
+            for worker in workers:
+                worker.cancel()
+            for result in await asyncio.gather(*workers, return_exceptions=True):
+                if isinstance(result, Exception):
+                    raise result
             
-            # Download PDFs with their referring pages
-            for pdf_url, (referring_page, depth) in pdf_mapping.items():
-                try:
-                    # Pass the referring page URL so PDF is nested under that page in MongoDB
-                    pdf_page = await self._download_pdf(pdf_url, output_dir, current_page_url=referring_page, crawl_depth=depth)
-                    document.add_page(pdf_page)
-                    logger.info(f"Downloaded PDF from page: {referring_page or 'direct'} -> {pdf_url}")
-                except Exception as e:
-                    logger.error(f"Failed to download PDF {pdf_url}: {e}")
-                    document.pages_failed += 1
+            # Download PDFs with their referring pages, a few at a time
+            semaphore = asyncio.Semaphore(PDF_DOWNLOAD_CONCURRENCY)
+            
+            async def download(pdf_url: str, referring_page: Optional[str], depth: int) -> None:
+                async with semaphore:
+                    try:
+                        # Pass the referring page URL so PDF is nested under that page in MongoDB
+                        pdf_page = await self._download_pdf(pdf_url, output_dir, current_page_url=referring_page, crawl_depth=depth)
+                        document.add_page(pdf_page)
+                        if on_page is not None:
+                            await on_page(pdf_page)
+                        logger.info(f"Downloaded PDF from page: {referring_page or 'direct'} -> {pdf_url}")
+                    except Exception as e:
+                        logger.error(f"Failed to download PDF {pdf_url}: {e}")
+                        document.pages_failed += 1
+            
+            await asyncio.gather(*(
+                download(pdf_url, referring_page, depth)
+                for pdf_url, (referring_page, depth) in pdf_mapping.items()
+            ))
+            await self._flush_pdf_records()
         
         document.end_time = time.time()
         logger.info(
@@ -229,19 +424,29 @@ class CrawlerStage(PipelineStage):
             f"{document.pdfs_downloaded} PDFs, "
             f"{document.pages_failed} failed"
         )
-        
-        return document
     
     async def _crawl_single_page(
-        self, url: str, depth: int, output_dir: Path
+        self, url: str, depth: int, output_dir: Path, context: "BrowserContext"
     ) -> Page:
-        """Crawl a single page and save content."""
+        """Crawl a single page in the given browser context and save content."""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+        
         start_time = time.time()
         
-        page_obj = await self._context.new_page()
+        page_obj = await context.new_page()
         try:
             timeout = self.config.crawl.page_timeout_ms if self.config else 30000
-            await page_obj.goto(url, timeout=timeout, wait_until="networkidle")
+            # Wait for "load" (images in, for OCR decisions and the PDF) rather
+            # than "networkidle", which also waits out analytics beacons
+            await page_obj.goto(url, timeout=timeout, wait_until="load")
+            try:
+                await page_obj.wait_for_function(
+                    f"document.body && document.body.innerText.length > {MIN_PAGE_TEXT_CHARS}",
+                    timeout=PAGE_TEXT_WAIT_MS,
+                )
+            except PlaywrightTimeoutError:
+                # Little text yet, e.g. JS-rendered content: let the network settle
+                await page_obj.wait_for_load_state("networkidle", timeout=timeout)
             
             # Get HTML content
             html_content = await page_obj.content()
@@ -268,8 +473,12 @@ class CrawlerStage(PipelineStage):
             dom_text = data["text"]
             scraped_images = data["images"]
             
-            # Generate content hash
-            content_hash = hashlib.md5(html_content.encode()).hexdigest()
+            # Encode once; the same bytes are hashed and written to disk
+            html_bytes = html_content.encode("utf-8")
+            
+            # Generate content hash (dedup only, not a security use); hashlib
+            # releases the GIL, so large pages hash in a worker thread
+            content_hash = await asyncio.to_thread(self._content_hash, html_bytes)
             
             # Check for duplicate
             if self._content_filter.is_duplicate_content(content_hash):
@@ -282,19 +491,21 @@ class CrawlerStage(PipelineStage):
                 )
             
             # Save HTML
-            filename = str(uuid.uuid4()).replace('-', '')
+            filename = self._new_id()
             html_path = output_dir / f"{filename}.html"
-            async with aiofiles.open(html_path, 'w', encoding="utf-8") as f:
-                await f.write(html_content)
+            await asyncio.to_thread(html_path.write_bytes, html_bytes)
             
             # Save DOM text
             dom_path = output_dir / f"{filename}.txt"
             async with aiofiles.open(dom_path, 'w', encoding="utf-8") as f:
                 await f.write(dom_text)
             
-            # Print as PDF
-            pdf_path = output_dir / f"{filename}.pdf"
-            await page_obj.pdf(path=str(pdf_path))
+            # Print as PDF (Chromium print is expensive, so only when there is
+            # text or images for later extraction/OCR to work with)
+            pdf_path = None
+            if dom_text.strip() or scraped_images:
+                pdf_path = output_dir / f"{filename}.pdf"
+                await page_obj.pdf(path=str(pdf_path))
             
             # --- VECTOR PIPELINE DISABLED IN ORCHESTRATOR MODE ---
             # Note: In orchestrator mode, PDFs are automatically queued for processing
@@ -322,106 +533,149 @@ class CrawlerStage(PipelineStage):
     
     async def _download_pdf(self, url: str, output_dir: Path, current_page_url: Optional[str] = None, crawl_depth: int = 0) -> Page:
         """Download a PDF file and save metadata to MongoDB using nested structure."""
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                content = await response.read()
-                
-                # Generate unique file ID
-                file_id = f"{uuid.uuid4()}.pdf"
+        async with self._get_http().get(url) as response:
+            # Generate unique file ID
+            file_id = f"{self._new_id()}.pdf"
+            
+            # Get original filename from URL
+            parsed_url = urlparse(url)
+            original_filename = parsed_url.path.split("/")[-1] or "document.pdf"
+            
+            # Save to configured PDF storage path
+            from app.config import UPLOAD_DIR
+            pdf_storage = Path(UPLOAD_DIR)
+            pdf_storage.mkdir(parents=True, exist_ok=True)
+            
+            # Stream the body to disk so only one chunk is held in memory
+            pdf_path = pdf_storage / file_id
+            file_size = 0
+            async with aiofiles.open(pdf_path, 'wb') as f:
+                async for chunk in response.content.iter_chunked(PDF_DOWNLOAD_CHUNK_SIZE):
+                    await f.write(chunk)
+                    file_size += len(chunk)
+            
+            # Also save to output_dir for pipeline compatibility
+            # (single threadpool hop; copyfile uses sendfile where available)
+            output_path = output_dir / f"{self._sanitize_filename(url)}.pdf"
+            await asyncio.to_thread(shutil.copyfile, pdf_path, output_path)
+            
+            # --- VECTOR PIPELINE DISABLED IN ORCHESTRATOR MODE ---
+            # Note: PDF processing handled by PDF processor workers in orchestrator mode
+            # Legacy vector pipeline integration disabled to prevent memory exhaustion
+            logger.info(f"PDF downloaded (orchestrator will process): {file_id}")
+            # --- END VECTOR PIPELINE INTEGRATION ---
+
+            # Queue metadata for MongoDB (nested website structure); records
+            # are written in bulk by _flush_pdf_records()
+            try:
+                from app.schemas.document import DocumentStatus, PdfDocument
                 
-                # Get original filename from URL
-                parsed_url = urlparse(url)
-                original_filename = parsed_url.path.split("/")[-1] or "document.pdf"
+                # Get crawl session ID from document metadata or generate one
+                crawl_session_id = getattr(self, '_crawl_session_id', str(uuid.uuid4()))
                 
-                # Save to configured PDF storage path
-                from app.config import UPLOAD_DIR
-                pdf_storage = Path(UPLOAD_DIR)
-                pdf_storage.mkdir(parents=True, exist_ok=True)
+                # Extract website URL (scheme + netloc)
+                website_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
                 
-                pdf_path = pdf_storage / file_id
-                async with aiofiles.open(pdf_path, 'wb') as f:
-                    await f.write(content)
+                # Use the referring page URL if provided, otherwise use the PDF URL itself
+                visited_url = current_page_url if current_page_url else url
                 
-                # Also save to output_dir for pipeline compatibility
-                output_path = output_dir / f"{self._sanitize_filename(url)}.pdf"
-                async with aiofiles.open(output_path, 'wb') as f:
-                    await f.write(content)
+                # Create PdfDocument
+                pdf_doc = PdfDocument(
+                    file_id=file_id,
+                    original_file=original_filename,
+                    source_url=url,
+                    file_path=str(pdf_path),
+                    crawl_session_id=crawl_session_id,
+                    file_size=file_size,
+                    crawl_depth=crawl_depth,
+                    status=DocumentStatus.STORED,  # No chunking for direct downloads
+                    is_crawled="1",
+                    total_pages=0,
+                    pages_with_text=0,
+                    pages_needing_ocr=0,
+                )
                 
-                # --- VECTOR PIPELINE DISABLED IN ORCHESTRATOR MODE ---
-                # Note: PDF processing handled by PDF processor workers in orchestrator mode
-                # Legacy vector pipeline integration disabled to prevent memory exhaustion
-                logger.info(f"PDF downloaded (orchestrator will process): {file_id}")
-                # --- END VECTOR PIPELINE INTEGRATION ---
-
-                # Save metadata to MongoDB using nested website structure
+                self._pending_pdfs.append(
+                    (website_url, crawl_session_id, visited_url, crawl_depth, pdf_doc)
+                )
+                if len(self._pending_pdfs) >= PDF_RECORD_BATCH_SIZE:
+                    await self._flush_pdf_records()
+            except Exception as e:
+                logger.warning(f"Failed to save PDF to DocumentStore: {e}", exc_info=True)
+            
+            return Page(
+                url=url,
+                pdf_path=pdf_path,
+                status_code=response.status,
+            )
+    
+    async def _flush_pdf_records(self) -> None:
+        """Write queued PDF records to MongoDB, one bulk write per website."""
+        async with self._flush_lock:
+            records, self._pending_pdfs = self._pending_pdfs, []
+            if not records:
+                return
+            
+            by_website: dict[tuple[str, str], list] = {}
+            for website_url, crawl_session_id, visited_url, crawl_depth, pdf_doc in records:
+                by_website.setdefault((website_url, crawl_session_id), []).append(
+                    (visited_url, crawl_depth, pdf_doc)
+                )
+            
+            for (website_url, crawl_session_id), pdfs in by_website.items():
                 try:
                     from app.services.document_store import DocumentStore
-                    from app.schemas.document import DocumentStatus, PdfDocument
                     store = DocumentStore.from_config()
                     
-                    # Get crawl session ID from document metadata or generate one
-                    crawl_session_id = getattr(self, '_crawl_session_id', str(uuid.uuid4()))
-                    
-                    # Extract website URL (scheme + netloc)
-                    website_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-                    
-                    # Use the referring page URL if provided, otherwise use the PDF URL itself
-                    visited_url = current_page_url if current_page_url else url
-                    
-                    # Create PdfDocument
-                    pdf_doc = PdfDocument(
-                        file_id=file_id,
-                        original_file=original_filename,
-                        source_url=url,
-                        file_path=str(pdf_path),
-                        crawl_session_id=crawl_session_id,
-                        file_size=len(content),
-                        crawl_depth=crawl_depth,
-                        status=DocumentStatus.STORED,  # No chunking for direct downloads
-                        is_crawled="1",
-                        total_pages=0,
-                        pages_with_text=0,
-                        pages_needing_ocr=0,
-                    )
-                    
-                    # Add PDF to website using nested structure
-                    store.add_pdf_to_website(
-                        website_url=website_url,
-                        crawl_session_id=crawl_session_id,
-                        visited_url=visited_url,
-                        crawl_depth=crawl_depth,
-                        pdf_document=pdf_doc
+                    # pymongo is blocking; keep it off the event loop
+                    added = await asyncio.to_thread(
+                        store.add_pdfs_to_website, website_url, crawl_session_id, pdfs
                     )
-                    
-                    logger.info(f"Saved PDF to MongoDB 'websites' (nested): {file_id} in {website_url}")
+                    logger.info(f"Saved {added} PDFs to MongoDB 'websites' (nested) for {website_url}")
                 except Exception as e:
-                    logger.warning(f"Failed to save PDF to DocumentStore: {e}", exc_info=True)
-                
-                return Page(
-                    url=url,
-                    pdf_path=pdf_path,
-                    status_code=response.status,
-                )
+                    logger.warning(f"Failed to save PDFs to DocumentStore: {e}", exc_info=True)
     
     async def _extract_links_from_html(
         self, html: str, base_url: str, base_domain: str
     ) -> Set[str]:
-        """Extract links from HTML content."""
-        from bs4 import BeautifulSoup
+        """Extract links from HTML content (parsed in a worker thread)."""
+        return await asyncio.to_thread(
+            self._parse_links, html, base_url, base_domain
+        )
+    
+    @classmethod
+    def _parse_links(cls, html: str, base_url: str, base_domain: str) -> Set[str]:
+        """Parse same-domain page links out of HTML (blocking)."""
+        # selectolax wraps the lexbor C HTML5 parser; much faster than bs4 here
+        from selectolax.lexbor import LexborHTMLParser
         
         links = set()
-        soup = BeautifulSoup(html, "html.parser")
+        seen_hrefs = set()  # Nav/footer links repeat; resolve each href once
+        tree = LexborHTMLParser(html)
         
-        for a_tag in soup.find_all("a", href=True):
-            href = a_tag["href"]
-            full_url = urljoin(base_url, href)
+        for a_tag in tree.css("a[href]"):
+            href = a_tag.attributes.get("href") or ""
+            if href in seen_hrefs:
+                continue
+            seen_hrefs.add(href)
+            
+            # Parse once and reuse for the domain, extension and normalize steps
+            parsed = urlparse(urljoin(base_url, href))
             
-            if self._is_same_domain(full_url, base_domain):
-                if self._is_valid_page(full_url):
-                    links.add(self._normalize_url(full_url))
+            if parsed.netloc == base_domain:
+                if _path_extension(parsed.path) not in _INVALID_EXTENSIONS:
+                    links.add(cls._normalize_parsed(parsed))
         
         return links
     
+    @staticmethod
+    def _content_hash(data: bytes) -> str:
+        """Hash page content for duplicate detection."""
+        if BLAKE3_AVAILABLE:
+            # Large pages are hashed on several threads, GIL released
+            return blake3.blake3(data, max_threads=blake3.blake3.AUTO).hexdigest()
+        return hashlib.md5(data, usedforsecurity=False).hexdigest()
+    
     @staticmethod
     def _get_base_domain(url: str) -> str:
         """Extract base domain from URL."""
@@ -431,7 +685,11 @@ class CrawlerStage(PipelineStage):
     @staticmethod
     def _normalize_url(url: str) -> str:
         """Normalize URL (remove fragments, trailing slashes)."""
-        parsed = urlparse(url)
+        return CrawlerStage._normalize_parsed(urlparse(url))
+    
+    @staticmethod
+    def _normalize_parsed(parsed: ParseResult) -> str:
+        """Normalize an already-parsed URL."""
         # Remove fragment and normalize
         return f"{parsed.scheme}://{parsed.netloc}{parsed.path.rstrip('/')}"
     
@@ -450,14 +708,9 @@ class CrawlerStage(PipelineStage):
     @staticmethod
     def _is_valid_page(url: str) -> bool:
         """Check if URL is a valid page (not image, css, js, etc)."""
-        invalid_extensions = [
-            ".css", ".js", ".png", ".jpg", ".jpeg", ".gif", ".svg",
-            ".ico", ".woff", ".woff2", ".ttf", ".eot"
-        ]
-        path = urlparse(url).path.lower()
-        return not any(path.endswith(ext) for ext in invalid_extensions)
+        return _path_extension(urlparse(url).path) not in _INVALID_EXTENSIONS
     
     @staticmethod
     def _is_pdf(url: str) -> bool:
         """Check if URL is a PDF."""
-        return urlparse(url).path.lower().endswith(".pdf")
+        return _path_extension(urlparse(url).path) == "pdf"
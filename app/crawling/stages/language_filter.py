@@ -5,8 +5,12 @@ Uses sentence-level detection for better granularity while maintaining accuracy.
 """
 
 import re
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
-from langdetect import detect, LangDetectException
+
+import numpy as np
+from langdetect import detect, detect_langs, LangDetectException
 
 from app.crawling.stages.base import PipelineStage
 from app.crawling.models.document import Document, Page
@@ -15,77 +19,214 @@ from app.config import get_logger
 
 logger = get_logger(__name__)
 
+# Page-level quick check: characters sampled from the start of each page
+PAGE_SAMPLE_CHARS = 2048
+# Confidence above which the whole page is kept/dropped without sentence checks
+PAGE_LANGUAGE_CONFIDENCE = 0.95
+
+# fastText language-ID model (loaded on first use, None if unavailable)
+_language_model = None
+_language_model_loaded = False
+
+
+def get_language_model():
+    """
+    Get the fastText language-ID model, loading it once.
+    
+    Returns:
+        fastText model, or None if LANGUAGE_MODEL_PATH is unset, the file
+        is missing, or fasttext is not installed (langdetect is used then)
+    """
+    global _language_model, _language_model_loaded
+    
+    if _language_model_loaded:
+        return _language_model
+    _language_model_loaded = True
+    
+    from app.config import LANGUAGE_MODEL_PATH
+    if not LANGUAGE_MODEL_PATH or not Path(LANGUAGE_MODEL_PATH).exists():
+        return None
+    
+    try:
+        import fasttext
+        _language_model = fasttext.load_model(LANGUAGE_MODEL_PATH)
+        logger.info(f"Loaded fastText language model: {LANGUAGE_MODEL_PATH}")
+    except ImportError:
+        logger.warning("fasttext not installed, using langdetect for language filtering")
+    except Exception as e:
+        logger.warning(f"Failed to load fastText language model: {e}")
+    
+    return _language_model
+
+
+@lru_cache(maxsize=1)
+def _bmp_alpha_table() -> np.ndarray:
+    """Lookup table of str.isalpha() for every Basic Multilingual Plane code point."""
+    return np.fromiter(
+        (chr(cp).isalpha() for cp in range(0x10000)), dtype=bool, count=0x10000
+    )
+
+
+def _alpha_ratios(texts: list[str]) -> np.ndarray:
+    """
+    Fraction of alphabetic characters in each text, computed in one pass.
+    
+    All texts are encoded into a single UTF-32 code point buffer, so the
+    per-character isalpha() test runs in NumPy instead of the interpreter.
+    Texts must be non-empty.
+    """
+    if not texts:
+        return np.empty(0)
+    
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    codes = np.frombuffer(
+        "".join(texts).encode("utf-32-le", "surrogatepass"), dtype=np.uint32
+    )
+    
+    is_alpha = _bmp_alpha_table()[np.minimum(codes, 0xFFFF)]
+    
+    # Code points outside the BMP are rare; test them in Python
+    wide = np.flatnonzero(codes > 0xFFFF)
+    if wide.size:
+        is_alpha[wide] = [chr(cp).isalpha() for cp in codes[wide].tolist()]
+    
+    starts = np.zeros(len(texts), dtype=np.int64)
+    np.cumsum(lengths[:-1], out=starts[1:])
+    return np.add.reduceat(is_alpha.astype(np.int64), starts) / lengths
+
 
 class LanguageFilterStage(PipelineStage):
     """
     Filters out pages that are not in English.
+    
+    Text is checked per sentence (default) or per paragraph. Segments
+    needing detection are collected across all pages and detected in one
+    batch (fastText when configured, else langdetect).
     """
     
+    # Segment splitters, by granularity
+    _PARA_RE = re.compile(r'\n\n')
+    # Handles: periods, question marks, exclamation marks, newlines
+    _SENT_RE = re.compile(r'(?<=[.!?])\s+|\n+')
+    _SPACE_RE = re.compile(r'\s+')
+    
+    def __init__(self, config=None, granularity: str = "sentence"):
+        """
+        Initialize language filter.
+        
+        Args:
+            config: Stage configuration
+            granularity: "sentence" or "paragraph"
+        """
+        super().__init__(config)
+        if granularity not in ("sentence", "paragraph"):
+            raise ValueError(f"Unknown granularity: {granularity!r}")
+        self.granularity = granularity
+        self._split_re = self._SENT_RE if granularity == "sentence" else self._PARA_RE
+        self._lid = None
+    
     @property
     def name(self) -> str:
         return "language_filter"
     
+    async def setup(self) -> None:
+        """Load the language-ID model (if configured)."""
+        self._lid = get_language_model()
+    
     async def process(self, document: Document) -> Document:
         """
-        Process document and filter non-English content at sentence level.
+        Process document and filter non-English content at the configured granularity.
         
         Args:
             document: Document to process
-            
+        
         Returns:
             Document with filtered pages
         """
-        logger.info("Starting language filtering (sentence-level)...")
+        logger.info(f"Starting language filtering ({self.granularity}-level)...")
         
-        pages_to_keep = []
-        filtered_count = 0
+        # Quick page-level check first; most pages are monolingual, so a
+        # confident verdict on a sample skips sentence-level detection
+        sample_refs = [
+            page_idx for page_idx, page in enumerate(document.pages)
+            if page.content and page.content.text and len(page.content.text.strip()) >= 15
+        ]
+        page_languages = self._detect_languages_with_confidence([
+            document.pages[page_idx].content.text[:PAGE_SAMPLE_CHARS]
+            for page_idx in sample_refs
+        ])
+        page_verdicts: dict[int, str] = {}
+        for page_idx, (lang, confidence) in zip(sample_refs, page_languages):
+            if lang is not None and confidence > PAGE_LANGUAGE_CONFIDENCE:
+                page_verdicts[page_idx] = lang
         
-        for page in document.pages:
-            # If no content, keep it
-            if not page.content or not page.content.text:
-                pages_to_keep.append(page)
+        # Split every page and collect the sentences long enough to check
+        page_sentences: list[Optional[list[str]]] = []
+        long_sentences: list[str] = []
+        long_refs: list[tuple[int, int]] = []  # (page index, sentence index)
+        
+        for page_idx, page in enumerate(document.pages):
+            # If no content, or confidently one language, no sentence checks
+            if not page.content or not page.content.text or page_idx in page_verdicts:
+                page_sentences.append(None)
                 continue
-                
-            original_text = page.content.text
             
-            # Split into sentences using regex (better than simple split)
-            # Handles: periods, question marks, exclamation marks, newlines
-            sentences = re.split(r'(?<=[.!?])\s+|\n+', original_text)
+            # Split into sentences/paragraphs using regex (better than simple split)
+            sentences = self._split_re.split(page.content.text)
+            page_sentences.append(sentences)
             
-            english_sentences = []
-            removed_chars = 0
-            
-            for sentence in sentences:
+            for sent_idx, sentence in enumerate(sentences):
                 cleaned_sentence = sentence.strip()
-                if not cleaned_sentence:
-                    continue
                 
                 # Keep very short text (likely headers, numbers, nav items)
                 # Reduced threshold from 30 to 15 for better sentence handling
                 if len(cleaned_sentence) < 15:
-                    english_sentences.append(sentence)
-                    continue
-                
-                # Skip if mostly numbers/symbols (keep without detection)
-                alpha_ratio = sum(c.isalpha() for c in cleaned_sentence) / len(cleaned_sentence)
-                if alpha_ratio < 0.5:  # Less than 50% alphabetic characters
-                    english_sentences.append(sentence)
                     continue
                 
-                try:
-                    # Detect language of the sentence
-                    lang = detect(cleaned_sentence)
-                    
-                    if lang == 'en':
-                        english_sentences.append(sentence)
-                    else:
-                        # Log only if substantial text is removed
-                        if len(cleaned_sentence) > 30:
-                            logger.debug(f"Removing non-English sentence ({lang}): {cleaned_sentence[:50]}...")
-                        removed_chars += len(sentence)
-                except LangDetectException:
-                    # If uncertain, safe to keep (often mixed content, symbols, etc.)
-                    english_sentences.append(sentence)
+                long_sentences.append(cleaned_sentence)
+                long_refs.append((page_idx, sent_idx))
+        
+        # Skip if mostly numbers/symbols (keep without detection)
+        alpha_ratios = _alpha_ratios(long_sentences)
+        candidates: list[str] = []
+        candidate_refs: list[tuple[int, int]] = []
+        for text, ref, alpha_ratio in zip(long_sentences, long_refs, alpha_ratios.tolist()):
+            if alpha_ratio >= 0.5:  # At least 50% alphabetic characters
+                candidates.append(text)
+                candidate_refs.append(ref)
+        
+        # Detect all candidate sentences in one batch
+        languages = self._detect_languages(candidates)
+        
+        removed_sentences: dict[int, set[int]] = {}
+        for (page_idx, sent_idx), text, lang in zip(candidate_refs, candidates, languages):
+            # If uncertain, safe to keep (often mixed content, symbols, etc.)
+            if lang is None or lang == 'en':
+                continue
+            # Log only if substantial text is removed
+            if len(text) > 30:
+                logger.debug(f"Removing non-English sentence ({lang}): {text[:50]}...")
+            removed_sentences.setdefault(page_idx, set()).add(sent_idx)
+        
+        pages_to_keep = []
+        filtered_count = 0
+        
+        for page_idx, (page, sentences) in enumerate(zip(document.pages, page_sentences)):
+            if sentences is None:
+                page_lang = page_verdicts.get(page_idx, 'en')
+                if page_lang == 'en':
+                    pages_to_keep.append(page)
+                else:
+                    logger.info(f"Dropped page {page.url} - Detected as non-English ({page_lang}).")
+                    filtered_count += 1
+                continue
+            
+            removed = removed_sentences.get(page_idx, ())
+            english_sentences = [
+                sentence for sent_idx, sentence in enumerate(sentences)
+                if sent_idx not in removed and sentence.strip()
+            ]
+            removed_chars = sum(len(sentences[sent_idx]) for sent_idx in removed)
             
             # Reconstruct the page text
             # Join sentences with appropriate spacing
@@ -93,7 +234,7 @@ class LanguageFilterStage(PipelineStage):
                 # Preserve original spacing as much as possible
                 new_text = ' '.join(english_sentences)
                 # Clean up multiple spaces
-                new_text = re.sub(r'\s+', ' ', new_text).strip()
+                new_text = self._SPACE_RE.sub(' ', new_text).strip()
                 
                 if removed_chars > 0:
                     logger.info(f"Filtered {removed_chars} chars of non-English text from {page.url}")
@@ -109,3 +250,58 @@ class LanguageFilterStage(PipelineStage):
         
         logger.info(f"Language filter complete. Removed {filtered_count} fully non-English pages.")
         return document
+    
+    def _detect_languages(self, texts: list[str]) -> list[Optional[str]]:
+        """
+        Detect the language of each text.
+        
+        Returns:
+            ISO 639-1 code per text, or None where detection failed
+        """
+        if not texts:
+            return []
+        
+        if self._lid is not None:
+            # One call for the whole batch; fastText rejects embedded newlines
+            labels, _ = self._lid.predict([t.replace("\n", " ") for t in texts], k=1)
+            return [
+                label[0].removeprefix("__label__") if label else None
+                for label in labels
+            ]
+        
+        languages = []
+        for text in texts:
+            try:
+                languages.append(detect(text))
+            except LangDetectException:
+                languages.append(None)
+        return languages
+    
+    def _detect_languages_with_confidence(
+        self, texts: list[str]
+    ) -> list[tuple[Optional[str], float]]:
+        """
+        Detect the most likely language of each text and its probability.
+        
+        Returns:
+            (ISO 639-1 code, probability) per text, or (None, 0.0) where
+            detection failed
+        """
+        if not texts:
+            return []
+        
+        if self._lid is not None:
+            labels, probs = self._lid.predict([t.replace("\n", " ") for t in texts], k=1)
+            return [
+                (label[0].removeprefix("__label__"), float(prob[0])) if label else (None, 0.0)
+                for label, prob in zip(labels, probs)
+            ]
+        
+        languages = []
+        for text in texts:
+            try:
+                best = detect_langs(text)[0]
+                languages.append((best.lang, best.prob))
+            except (LangDetectException, IndexError):
+                languages.append((None, 0.0))
+        return languages
@@ -9,7 +9,15 @@ from app.crawling.models.document import (
     Document, Page, PageContent, OCRAction, ImageInfo, ContentSource
 )
 
-from app.config import get_logger
+from app.config import (
+    get_logger,
+    OCR_MIN_WORD_COUNT_SUFFICIENT,
+    OCR_SCANNED_PDF_MAX_WORDS,
+    OCR_MIN_TEXT_BEARING_IMAGES,
+    OCR_MIN_TEXT_BEARING_RATIO,
+    OCR_MIN_TEXT_BEARING_AREA,
+    OCR_DECORATIVE_MAX_SIZE,
+)
 
 logger = get_logger(__name__)
 
@@ -85,19 +93,11 @@ class OCRDecisionStage(PipelineStage):
             return OCRAction.FULL_PAGE_OCR, "No content extracted"
         
         word_count = content.word_count
-        text_bearing_images = len([
-            img for img in content.images
-            if self._is_text_bearing(img, config)
-        ])
-        total_images = len(content.images)
-        
-        # Import conservative thresholds from config
-        from app.config import (
-            OCR_MIN_WORD_COUNT_SUFFICIENT,
-            OCR_SCANNED_PDF_MAX_WORDS,
-            OCR_MIN_TEXT_BEARING_IMAGES,
-            OCR_MIN_TEXT_BEARING_RATIO,
+        is_text_bearing = self._is_text_bearing
+        text_bearing_images = sum(
+            1 for img in content.images if is_text_bearing(img, config)
         )
+        total_images = len(content.images)
         
         # Thresholds (use config values for conservative OCR usage)
         min_text_bearing = OCR_MIN_TEXT_BEARING_IMAGES
@@ -170,8 +170,6 @@ class OCRDecisionStage(PipelineStage):
     
     def _is_text_bearing(self, image: ImageInfo, config) -> bool:
         """Check if image might contain text worth OCRing."""
-        from app.config import OCR_MIN_TEXT_BEARING_AREA, OCR_DECORATIVE_MAX_SIZE
-        
         min_area = OCR_MIN_TEXT_BEARING_AREA
         decorative_size = OCR_DECORATIVE_MAX_SIZE
         
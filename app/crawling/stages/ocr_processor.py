@@ -2,19 +2,192 @@
 OCR processor stage - performs OCR using Surya.
 """
 
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
+try:
+    import cv2  # type: ignore
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
 from app.crawling.stages.base import PipelineStage
 from app.crawling.models.document import (
     Document, Page, PageContent, OCRAction, ContentSource
 )
-from app.services.gpu_manager import get_surya_predictors
+from app.services.gpu_manager import get_surya_predictors, run_ocr_model
 
-from app.config import get_logger, OCR_MAX_BBOXES_PER_PAGE
+from app.config import (
+    get_logger, OCR_MAX_BBOXES_PER_PAGE, OCR_BATCH_SIZE, OCR_RASTERIZE_WORKERS,
+    OCR_NOISE_MAX_LAPLACIAN_VAR, OCR_MIN_TEXT_BEARING_AREA,
+)
 
 logger = get_logger(__name__)
 
+# Images per detection call when OCR_BATCH_SIZE is unset; detection runs
+# on each chunk while later PDFs are still being rasterized
+DETECTION_CHUNK_SIZE = 16
+
+# Grayscale -> black/white lookup table (threshold 200)
+_BINARIZE_LUT = [255 if p > 200 else 0 for p in range(256)]
+
+# Process pool for PDF rasterization (created on first use)
+_rasterize_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_rasterize_pool() -> ProcessPoolExecutor:
+    """Get the shared rasterization process pool."""
+    global _rasterize_pool
+    
+    if _rasterize_pool is None:
+        # Spawn rather than fork: the parent may already hold CUDA state
+        _rasterize_pool = ProcessPoolExecutor(
+            max_workers=OCR_RASTERIZE_WORKERS or None,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _rasterize_pool
+
+
+def shutdown_rasterize_pool() -> None:
+    """Shutdown the rasterization process pool. Call on application shutdown."""
+    global _rasterize_pool
+    
+    if _rasterize_pool is not None:
+        _rasterize_pool.shutdown(wait=True)
+        _rasterize_pool = None
+
+
+def _preprocess_image(img):
+    """Simple binarization to reduce noise."""
+    # This helps prevent hallucination of thousands of text lines
+    # Convert to grayscale
+    img = img.convert('L') 
+    # Binarize (threshold) - stricter threshold 200 to kill more gray noise
+    img = img.point(_BINARIZE_LUT)
+    return img.convert('RGB')
+
+
+def _binarize_samples(samples: bytes, width: int, height: int, stride: int):
+    """
+    Grayscale + threshold raw RGB pixmap samples with OpenCV.
+    
+    Same result as _preprocess_image, but works on the pixmap buffer
+    directly and uses OpenCV's SIMD kernels instead of three PIL passes.
+    """
+    from PIL import Image
+    
+    rgb = np.frombuffer(samples, np.uint8).reshape(height, stride)[:, :width * 3]
+    gray = cv2.cvtColor(rgb.reshape(height, width, 3), cv2.COLOR_RGB2GRAY)
+    cv2.threshold(gray, 200, 255, cv2.THRESH_BINARY, dst=gray)
+    bw = cv2.cvtColor(gray, cv2.COLOR_GRAY2RGB)
+    return Image.frombuffer("RGB", (width, height), bw, "raw", "RGB", 0, 1)
+
+
+def _laplacian_variance(img) -> float:
+    """
+    Variance of the Laplacian on a <=256px thumbnail.
+    
+    Cheap texture measure: speckled/noisy scans score far higher than
+    pages of text, which is what detection would later reject anyway.
+    """
+    thumb = img.convert('L')
+    thumb.thumbnail((256, 256))
+    a = np.asarray(thumb, dtype=np.float32)
+    if a.shape[0] < 3 or a.shape[1] < 3:
+        return 0.0
+    lap = a[1:-1, :-2] + a[1:-1, 2:] + a[:-2, 1:-1] + a[2:, 1:-1] - 4 * a[1:-1, 1:-1]
+    return float(lap.var())
+
+
+def _pixmap_to_image(pix):
+    """Binarized RGB PIL image from an RGB pixmap."""
+    from PIL import Image
+    
+    # Wrap the raw RGB samples; no PNG encode/decode round-trip
+    if CV2_AVAILABLE:
+        return _binarize_samples(pix.samples, pix.width, pix.height, pix.stride)
+    img = Image.frombuffer("RGB", (pix.width, pix.height), pix.samples, "raw", "RGB", pix.stride, 1)
+    return _preprocess_image(img)
+
+
+def _rasterize_pdf(pdf_path: str) -> list:
+    """
+    Render and preprocess every page of a PDF.
+    
+    Runs in the rasterization process pool, so it must stay a
+    module-level function.
+    
+    Returns:
+        (image, noise score) per page; the score is 0.0 when the noise
+        check is disabled
+    """
+    import fitz  # PyMuPDF
+    
+    doc = fitz.open(pdf_path)
+    images = []
+    
+    for page_num in range(len(doc)):
+        page = doc[page_num]
+        # Lower DPI from 150 to 96 for speed/noise reduction
+        pix = page.get_pixmap(dpi=96, alpha=False)
+        img = _pixmap_to_image(pix)
+        noise = _laplacian_variance(img) if OCR_NOISE_MAX_LAPLACIAN_VAR > 0 else 0.0
+        images.append((img, noise))
+    
+    doc.close()
+    return images
+
+
+def _extract_pdf_images(pdf_path: str) -> list:
+    """
+    Extract and preprocess the embedded images of a PDF.
+    
+    Used for OCR_IMAGES_ONLY pages: only image XObjects large enough to
+    carry text (OCR_MIN_TEXT_BEARING_AREA) are OCRed, not whole pages.
+    Runs in the rasterization process pool.
+    
+    Returns:
+        (image, noise score) per embedded image, same as _rasterize_pdf
+    """
+    import fitz  # PyMuPDF
+    
+    doc = fitz.open(pdf_path)
+    images = []
+    seen_xrefs = set()
+    
+    for page_num in range(len(doc)):
+        for image_entry in doc[page_num].get_images(full=True):
+            xref = image_entry[0]
+            # Logos etc. are shared between pages; OCR each image once
+            if xref in seen_xrefs:
+                continue
+            seen_xrefs.add(xref)
+            
+            try:
+                pix = fitz.Pixmap(doc, xref)
+                if pix.width * pix.height < OCR_MIN_TEXT_BEARING_AREA:
+                    continue
+                # Normalize CMYK/gray/alpha images to plain RGB samples
+                if pix.n - pix.alpha != 3:
+                    pix = fitz.Pixmap(fitz.csRGB, pix)
+                if pix.alpha:
+                    pix = fitz.Pixmap(pix, 0)
+            except Exception as e:
+                logger.debug(f"Could not extract image {xref} from {pdf_path}: {e}")
+                continue
+            
+            img = _pixmap_to_image(pix)
+            noise = _laplacian_variance(img) if OCR_NOISE_MAX_LAPLACIAN_VAR > 0 else 0.0
+            images.append((img, noise))
+    
+    doc.close()
+    return images
+
 
 class OCRProcessorStage(PipelineStage):
     """
@@ -38,9 +211,13 @@ class OCRProcessorStage(PipelineStage):
         """
         Perform OCR on pages that need it.
         
+        All pages needing OCR are rasterized first and run through Surya
+        detection/recognition together, so the models see full batches
+        instead of one PDF at a time.
+        
         Args:
             document: Document with OCR decisions set
-            
+        
         Returns:
             Document with OCR text added to pages
         """
@@ -55,25 +232,33 @@ class OCRProcessorStage(PipelineStage):
         
         logger.info(f"Running OCR on {len(pages_to_ocr)} pages")
         
+        ocr_pages = []
         for page in pages_to_ocr:
+            if not page.pdf_path or not page.pdf_path.exists():
+                logger.warning(f"No PDF for OCR: {page.url}")
+                continue
+            ocr_pages.append(page)
+        
+        if not ocr_pages:
+            return document
+        
+        # OCR_IMAGES_ONLY pages only have their embedded images OCRed
+        texts = await self._run_batch_ocr(
+            [page.pdf_path for page in ocr_pages],
+            images_only=[page.ocr_action == OCRAction.OCR_IMAGES_ONLY for page in ocr_pages],
+        )
+        
+        for page, text in zip(ocr_pages, texts):
             try:
-                await self._process_page(page)
+                self._apply_ocr_text(page, text)
             except Exception as e:
                 logger.error(f"OCR failed for {page.url}: {e}")
         
         return document
     
-    async def _process_page(self, page: Page) -> None:
-        """Process a single page with OCR."""
-        if not page.pdf_path or not page.pdf_path.exists():
-            logger.warning(f"No PDF for OCR: {page.url}")
-            return
-        
-        if page.ocr_action == OCRAction.FULL_PAGE_OCR:
-            text = await self._run_full_page_ocr(page.pdf_path)
-        else:
-            text = await self._run_images_only_ocr(page.pdf_path)
-        
+    @staticmethod
+    def _apply_ocr_text(page: Page, text: str) -> None:
+        """Store OCR text on a page, merging with any DOM text."""
         if text:
             # Update or merge with existing content
             if page.content and page.content.text:
@@ -84,160 +269,295 @@ class OCRProcessorStage(PipelineStage):
                 page.content = PageContent.from_text(text, ContentSource.OCR)
     
     async def _run_full_page_ocr(self, pdf_path: Path) -> str:
-        """Run full-page OCR on PDF using Surya v0.17 API."""
+        """Run full-page OCR on a single PDF using Surya v0.17 API."""
+        return (await self._run_batch_ocr([pdf_path]))[0]
+    
+    @staticmethod
+    def _bbox_polygons(det_prediction) -> list:
+        """Convert detected PolygonBox objects to the format recognition expects."""
+        page_polygons = []
+        # Positions in page_polygons and [x1, y1, x2, y2] of plain rectangles
+        rect_slots = []
+        rects = []
+        for bbox in det_prediction.bboxes:
+            # Extract polygon coordinates from PolygonBox
+            # PolygonBox has a .polygon attribute or .bbox attribute
+            if hasattr(bbox, 'polygon'):
+                page_polygons.append(bbox.polygon)
+            elif hasattr(bbox, 'bbox'):
+                # Converted to corners below, all rectangles at once
+                rect_slots.append(len(page_polygons))
+                rects.append(bbox.bbox)
+                page_polygons.append(None)
+            else:
+                # Try to convert PolygonBox directly
+                try:
+                    # If it's already a list of points, use it
+                    if isinstance(bbox, list):
+                        page_polygons.append(bbox)
+                    else:
+                        # Extract coordinates from the object
+                        page_polygons.append(bbox.tolist() if hasattr(bbox, 'tolist') else list(bbox))
+                except:
+                    logger.warning(f"Could not convert bbox to polygon format: {type(bbox)}")
+                    continue
+        
+        if rects:
+            # (N, 4) boxes -> (N, 4, 2) polygons [[x1,y1], [x2,y1], [x2,y2], [x1,y2]]
+            bb = np.asarray(rects)
+            corners = np.stack([bb[:, [0, 2, 2, 0]], bb[:, [1, 1, 3, 3]]], axis=-1)
+            # Recognition validates polygons as nested lists
+            for slot, polygon in zip(rect_slots, corners.tolist()):
+                page_polygons[slot] = polygon
+        return page_polygons
+    
+    @staticmethod
+    def _join_pages(text_by_page: dict, page_counts: list[int]) -> list[str]:
+        """Flatten (pdf index, page number) -> text into one string per PDF."""
+        # Flatten to list in order, per PDF
+        return [
+            "\\n\\n".join(
+                text_by_page.get((doc_idx, page_num), "")
+                for page_num in range(page_count)
+            )
+            for doc_idx, page_count in enumerate(page_counts)
+        ]
+    
+    async def _run_batch_ocr(
+        self, pdf_paths: list[Path], images_only: Optional[list[bool]] = None
+    ) -> list[str]:
+        """
+        Run full-page OCR on several PDFs with batched detection and
+        recognition.
+        
+        PDFs are rasterized in a process pool; detection and recognition run
+        on chunks of images as they arrive, so GPU work on early pages
+        overlaps with rasterization of the rest.
+        Images from all PDFs are flattened into one list; `owners` maps
+        each image back to its (PDF index, page number) so results can be
+        scattered back per PDF.
+        
+        Args:
+            pdf_paths: PDFs to OCR
+            images_only: Per PDF, OCR only its embedded images instead of
+                rendering full pages (default: all full-page)
+        
+        Returns:
+            OCR text per PDF ("" where OCR failed)
+        
+        A failed detection/recognition chunk only affects the PDFs with
+        pages in it; those are OCRed again one at a time.
+        """
         try:
-            import fitz  # PyMuPDF
-            from PIL import Image
-            import io
-            
             # Use centralized GPU manager
             det_predictor, rec_predictor = get_surya_predictors()
             
-            # Extract images from PDF
-            doc = fitz.open(str(pdf_path))
-            images = []
+            loop = asyncio.get_running_loop()
+            pool = get_rasterize_pool()
             
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                # Lower DPI from 150 to 96 for speed/noise reduction
-                pix = page.get_pixmap(dpi=96)
-                img_data = pix.tobytes("png")
-                img = Image.open(io.BytesIO(img_data))
-                images.append(img)
+            async def rasterize(doc_idx: int, pdf_path: Path):
+                extract = _extract_pdf_images if images_only and images_only[doc_idx] else _rasterize_pdf
+                try:
+                    return doc_idx, await loop.run_in_executor(pool, extract, str(pdf_path))
+                except ImportError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Failed to rasterize {pdf_path} for OCR: {e}")
+                    return doc_idx, []
             
-            doc.close()
+            # Preprocessed images from every PDF (simple binarization to reduce noise)
+            processed_images = []
+            owners: list[tuple[int, int]] = []  # (pdf index, page number)
+            page_counts = [0] * len(pdf_paths)
             
-            # Run OCR
-            # Run OCR with optimized parameters
-            logger.info(f"Running OCR on {len(images)} images (DPI=96)...")
+            # Map (pdf index, page number) to skipped message
+            all_text_placeholders = {}
             
-            # Preprocess images (simple binarization to reduce noise)
-            # This helps prevent hallucination of thousands of text lines
-            processed_images = []
-            for img in images:
-                # Convert to grayscale
-                img = img.convert('L') 
-                # Binarize (threshold) - stricter threshold 200 to kill more gray noise
-                img = img.point(lambda p: 255 if p > 200 else 0)
-                processed_images.append(img.convert('RGB'))
-
             # Run Detection first to check for complexity/hallucination
-            logger.info("Running detection pass...")
-            det_predictions = det_predictor(processed_images)
-
-            # Log per-page bbox counts and total boxes
-            per_page_counts = [len(pred.bboxes) for pred in det_predictions]
-            total_boxes = sum(per_page_counts)
-            logger.info(f"Detected bboxes per page: {per_page_counts}")
-            logger.info(f"Total detected text regions across pages: {total_boxes}")
-
+            det_predictions = []
+            det_chunk = OCR_BATCH_SIZE or DETECTION_CHUNK_SIZE
+            
             final_images_to_recognize = []
             final_indices = []
-
-            all_text_placeholders = {}  # Map index to skipped message
-
+            polygons_to_recognize = []
+            rec_predictions = []
+            
             skipped_pages = {}
-            for i, pred in enumerate(det_predictions):
+            
+            # PDF index -> error for PDFs with pages in a failed chunk
+            failed_docs: dict[int, Exception] = {}
+            
+            def mark_failed(image_indices, error: Exception, stage: str) -> None:
+                docs = {owners[i][0] for i in image_indices}
+                logger.error(
+                    f"Surya {stage} failed for {len(docs)} PDFs: {error}"
+                )
+                for doc_idx in docs:
+                    failed_docs.setdefault(doc_idx, error)
+            
+            def select_for_recognition(i: int, pred) -> None:
                 # If too many bboxes, it's likely noise/tables/chart -> Skip recognition for that page
                 if len(pred.bboxes) > OCR_MAX_BBOXES_PER_PAGE:
+                    doc_idx, page_num = owners[i]
                     skipped_pages[i] = len(pred.bboxes)
                     logger.warning(
-                        f"Page {i} has {len(pred.bboxes)} text regions (Limit: {OCR_MAX_BBOXES_PER_PAGE}). Skipping recognition to prevent hanging."
+                        f"Page {page_num} of {pdf_paths[doc_idx].name} has {len(pred.bboxes)} text regions (Limit: {OCR_MAX_BBOXES_PER_PAGE}). Skipping recognition to prevent hanging."
                     )
-                    all_text_placeholders[i] = f"[SKIPPED_COMPLEX_PAGE: {len(pred.bboxes)} regions detected]"
+                    all_text_placeholders[owners[i]] = f"[SKIPPED_COMPLEX_PAGE: {len(pred.bboxes)} regions detected]"
                 else:
                     final_images_to_recognize.append(processed_images[i])
                     final_indices.append(i)
-
-            if skipped_pages:
-                logger.info(f"Skipped pages due to high bbox counts: {skipped_pages}")
+                    # Prepare polygons for recognition from detection predictions
+                    polygons_to_recognize.append(self._bbox_polygons(pred))
             
-            if not final_images_to_recognize:
-                # All pages skipped
-                sorted_text = [all_text_placeholders.get(i, "") for i in range(len(images))]
-                return "\\n\\n".join(sorted_text)
-
-            # Prepare polygons for recognition from detection predictions
-            # Convert PolygonBox objects to the correct format for recognition
-            polygons_to_recognize = []
-            for idx in final_indices:
-                page_polygons = []
-                for bbox in det_predictions[idx].bboxes:
-                    # Extract polygon coordinates from PolygonBox
-                    # PolygonBox has a .polygon attribute or .bbox attribute
-                    if hasattr(bbox, 'polygon'):
-                        page_polygons.append(bbox.polygon)
-                    elif hasattr(bbox, 'bbox'):
-                        # bbox is [x1, y1, x2, y2]
-                        x1, y1, x2, y2 = bbox.bbox
-                        # Convert to polygon format [[x1,y1], [x2,y1], [x2,y2], [x1,y2]]
-                        page_polygons.append([[x1, y1], [x2, y1], [x2, y2], [x1, y2]])
-                    else:
-                        # Try to convert PolygonBox directly
-                        try:
-                            # If it's already a list of points, use it
-                            if isinstance(bbox, list):
-                                page_polygons.append(bbox)
-                            else:
-                                # Extract coordinates from the object
-                                page_polygons.append(bbox.tolist() if hasattr(bbox, 'tolist') else list(bbox))
-                        except:
-                            logger.warning(f"Could not convert bbox to polygon format: {type(bbox)}")
-                            continue
-                polygons_to_recognize.append(page_polygons)
+            async def detect_pending(flush: bool) -> None:
+                while len(processed_images) - len(det_predictions) >= (1 if flush else det_chunk):
+                    start = len(det_predictions)
+                    batch = processed_images[start:start + det_chunk]
+                    try:
+                        det_predictions.extend(await asyncio.to_thread(
+                            run_ocr_model, det_predictor, batch, batch_size=OCR_BATCH_SIZE or None
+                        ))
+                    except Exception as e:
+                        # Keep positions aligned; these pages are not recognized
+                        det_predictions.extend([None] * len(batch))
+                        mark_failed(range(start, len(det_predictions)), e, "detection")
+                        continue
+                    for i in range(start, len(det_predictions)):
+                        select_for_recognition(i, det_predictions[i])
             
-            # Run Recognition ONLY on safe pages with their detected polygons
-            rec_predictions = rec_predictor(
-                final_images_to_recognize,
-                polygons=polygons_to_recognize
-            )
-            # Log recognition sizes: lines per page and total recognized lines
-            try:
-                rec_lines_counts = [len(p.text_lines) for p in rec_predictions]
-                total_rec_lines = sum(rec_lines_counts)
-                logger.info(f"Recognition produced text lines per page: {rec_lines_counts}")
-                logger.info(f"Total recognition text lines across pages: {total_rec_lines}")
+            async def recognize_pending(flush: bool) -> None:
+                # Run Recognition ONLY on safe pages with their detected polygons
+                while len(final_images_to_recognize) - len(rec_predictions) >= (1 if flush else det_chunk):
+                    start = len(rec_predictions)
+                    batch = final_images_to_recognize[start:start + det_chunk]
+                    try:
+                        rec_predictions.extend(await asyncio.to_thread(
+                            run_ocr_model,
+                            rec_predictor,
+                            batch,
+                            polygons=polygons_to_recognize[start:start + det_chunk],
+                            recognition_batch_size=OCR_BATCH_SIZE or None,
+                        ))
+                    except Exception as e:
+                        rec_predictions.extend([None] * len(batch))
+                        mark_failed(final_indices[start:len(rec_predictions)], e, "recognition")
+            
+            for next_done in asyncio.as_completed(
+                [rasterize(doc_idx, pdf_path) for doc_idx, pdf_path in enumerate(pdf_paths)]
+            ):
+                doc_idx, doc_images = await next_done
+                page_counts[doc_idx] = len(doc_images)
+                for page_num, (img, noise) in enumerate(doc_images):
+                    # Obviously noisy pages would be rejected after detection; skip det+rec
+                    if OCR_NOISE_MAX_LAPLACIAN_VAR > 0 and noise > OCR_NOISE_MAX_LAPLACIAN_VAR:
+                        logger.warning(
+                            f"Page {page_num} of {pdf_paths[doc_idx].name} looks like noise (Laplacian variance {noise:.0f}). Skipping detection."
+                        )
+                        all_text_placeholders[(doc_idx, page_num)] = f"[SKIPPED_NOISY_PAGE: Laplacian variance {noise:.0f}]"
+                        continue
+                    processed_images.append(img)
+                    owners.append((doc_idx, page_num))
                 
-                # Skip if total recognized lines exceed 500 (likely noise/hallucination)
-                if total_rec_lines > 500:
-                    logger.warning(
-                        f"Total recognized text lines ({total_rec_lines}) exceeds limit (500). "
-                        f"Skipping recognition results to prevent hallucination."
-                    )
-                    # Mark all recognized pages as skipped
-                    for orig_idx in final_indices:
-                        all_text_placeholders[orig_idx] = f"[SKIPPED_EXCESSIVE_RECOGNITION: {total_rec_lines} lines detected]"
-                    sorted_text = [all_text_placeholders.get(i, "") for i in range(len(images))]
-                    return "\\n\\n".join(sorted_text)
-            except Exception:
-                logger.debug("Could not compute recognition line counts; unexpected rec_predictions format.")
+                # Detect and recognize full chunks while the remaining PDFs rasterize
+                await detect_pending(flush=False)
+                await recognize_pending(flush=False)
+            
+            if not processed_images:
+                return self._join_pages(all_text_placeholders, page_counts)
+            
+            # Run OCR with optimized parameters
+            logger.info(f"Running OCR on {len(processed_images)} images from {len(pdf_paths)} PDFs (DPI=96)...")
+            
+            logger.info("Running detection pass...")
+            await detect_pending(flush=True)
+            
+            # Log per-page bbox counts and total boxes
+            per_page_counts = [len(pred.bboxes) for pred in det_predictions if pred is not None]
+            total_boxes = sum(per_page_counts)
+            logger.info(f"Detected bboxes per page: {per_page_counts}")
+            logger.info(f"Total detected text regions across pages: {total_boxes}")
+            
+            if skipped_pages:
+                logger.info(f"Skipped pages due to high bbox counts: {skipped_pages}")
             
-            # Merge results back
             text_by_page = all_text_placeholders.copy()
+            
+            if final_images_to_recognize:
+                await recognize_pending(flush=True)
                 
-            for i, page_pred in enumerate(rec_predictions):
-                page_text = "\\n".join([line.text for line in page_pred.text_lines])
-                original_idx = final_indices[i]
-                text_by_page[original_idx] = page_text
+                # Scatter recognition results back to their PDFs
+                rec_by_doc: dict[int, list] = {}
+                for i, page_pred in enumerate(rec_predictions):
+                    doc_idx, page_num = owners[final_indices[i]]
+                    if doc_idx in failed_docs:
+                        continue
+                    rec_by_doc.setdefault(doc_idx, []).append((page_num, page_pred))
                 
-            # Flatten to list in order
-            sorted_text = [text_by_page.get(i, "") for i in range(len(images))]
-            return "\\n\\n".join(sorted_text)
-            
-
+                for doc_idx, doc_preds in rec_by_doc.items():
+                    # Log recognition sizes: lines per page and total recognized lines
+                    try:
+                        rec_lines_counts = [len(p.text_lines) for _, p in doc_preds]
+                        total_rec_lines = sum(rec_lines_counts)
+                        logger.info(f"Recognition produced text lines per page: {rec_lines_counts}")
+                        logger.info(f"Total recognition text lines across pages: {total_rec_lines}")
+                        
+                        # Skip if total recognized lines in one PDF exceed 500 (likely noise/hallucination)
+                        if total_rec_lines > 500:
+                            logger.warning(
+                                f"Total recognized text lines ({total_rec_lines}) exceeds limit (500). "
+                                f"Skipping recognition results to prevent hallucination."
+                            )
+                            # Mark all recognized pages as skipped
+                            for page_num, _ in doc_preds:
+                                text_by_page[(doc_idx, page_num)] = f"[SKIPPED_EXCESSIVE_RECOGNITION: {total_rec_lines} lines detected]"
+                            continue
+                    except Exception:
+                        logger.debug("Could not compute recognition line counts; unexpected rec_predictions format.")
+                    
+                    # Merge results back
+                    for page_num, page_pred in doc_preds:
+                        page_text = "\\n".join([line.text for line in page_pred.text_lines])
+                        text_by_page[(doc_idx, page_num)] = page_text
             
+            texts = self._join_pages(text_by_page, page_counts)
+            for doc_idx, error in failed_docs.items():
+                if len(pdf_paths) > 1:
+                    # OCR the PDF again on its own
+                    texts[doc_idx] = (await self._run_batch_ocr(
+                        [pdf_paths[doc_idx]],
+                        images_only=[images_only[doc_idx]] if images_only else None,
+                    ))[0]
+                elif isinstance(error, ImportError):
+                    texts[doc_idx] = await self._fallback_ocr(pdf_paths[doc_idx])
+                else:
+                    texts[doc_idx] = ""
+            return texts
+        
         except ImportError as e:
             logger.error(f"Surya not available: {e}")
-            return await self._fallback_ocr(pdf_path)
+            return [await self._fallback_ocr(pdf_path) for pdf_path in pdf_paths]
         except Exception as e:
             logger.error(f"Surya OCR failed: {e}")
-            return ""
+            if len(pdf_paths) > 1:
+                # Retry one PDF at a time so one bad PDF only loses its own text
+                return await self._run_batch_ocr_each(pdf_paths, images_only)
+            return [""]
+    
+    async def _run_batch_ocr_each(
+        self, pdf_paths: list[Path], images_only: Optional[list[bool]] = None
+    ) -> list[str]:
+        """Run _run_batch_ocr on each PDF separately."""
+        return [
+            (await self._run_batch_ocr(
+                [pdf_path], images_only=[images_only[i]] if images_only else None
+            ))[0]
+            for i, pdf_path in enumerate(pdf_paths)
+        ]
     
     async def _run_images_only_ocr(self, pdf_path: Path) -> str:
         """Run OCR on embedded images only."""
-        # For now, same as full page
-        # Future: extract only image regions
-        return await self._run_full_page_ocr(pdf_path)
+        return (await self._run_batch_ocr([pdf_path], images_only=[True]))[0]
     
     async def _fallback_ocr(self, pdf_path: Path) -> str:
         """Fallback OCR using PyMuPDF text extraction."""
@@ -254,7 +574,7 @@ class OCRProcessorStage(PipelineStage):
             
             doc.close()
             return "\n\n".join(text_parts)
-            
+        
         except Exception as e:
             logger.error(f"Fallback OCR failed: {e}")
             return ""
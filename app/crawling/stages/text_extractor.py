@@ -6,12 +6,74 @@ import re
 from typing import Optional
 
 from app.crawling.stages.base import PipelineStage
-from app.crawling.models.document import Document, Page, PageContent, ContentSource
+from app.crawling.models.document import Document, Page, PageContent, ContentSource, ImageInfo
 
 from app.config import get_logger
 
 logger = get_logger(__name__)
 
+# Whitespace runs, collapsed to a single space
+_WS_RE = re.compile(r"\s+")
+
+# Common noise patterns (cookie banners, navigation), removed in one pass
+_NOISE_RE = re.compile(
+    r"Accept\s+cookies?"
+    r"|Cookie\s+policy"
+    r"|Privacy\s+policy"
+    r"|Terms\s+of\s+service"
+    r"|Skip\s+to\s+content"
+    r"|Toggle\s+navigation"
+    r"|Loading\.\.\.",
+    re.IGNORECASE,
+)
+
+# Elements dropped (with their contents) before extracting HTML text
+STRIPPED_TAGS = ["script", "style", "nav", "footer", "header"]
+
+
+def clean_dom_text(raw_text: str) -> str:
+    """
+    Clean extracted DOM text.
+    
+    Removes:
+    - Excessive whitespace
+    - Navigation noise
+    - Cookie banners
+    """
+    if not raw_text:
+        return ""
+    
+    # Normalize whitespace
+    text = _WS_RE.sub(" ", raw_text)
+    
+    # Remove common noise patterns
+    text = _NOISE_RE.sub("", text)
+    
+    # Remove very short lines (likely buttons/links)
+    cleaned_lines = [
+        stripped for line in text.split("\n")
+        if len(stripped := line.strip()) > 20 or "." in stripped
+    ]
+    
+    return "\n".join(cleaned_lines).strip()
+
+
+def build_image_infos(scraped_images: list[dict]) -> list[ImageInfo]:
+    """Build ImageInfo entries from crawler-scraped image dimensions."""
+    infos = []
+    for img in scraped_images:
+        # Read each dimension once
+        width = img.get("width", 0)
+        height = img.get("height", 0)
+        infos.append(ImageInfo(
+            width=width,
+            height=height,
+            aspect_ratio=width / height if height > 0 else 0,
+            image_type="unknown",
+            area=width * height
+        ))
+    return infos
+
 
 class TextExtractorStage(PipelineStage):
     """
@@ -73,17 +135,7 @@ class TextExtractorStage(PipelineStage):
             
             # Add images if available
             if page.scraped_images:
-                from app.crawling.models.document import ImageInfo
-                content.images = [
-                    ImageInfo(
-                        width=img.get("width", 0),
-                        height=img.get("height", 0),
-                        aspect_ratio=img.get("width", 0) / img.get("height", 1) if img.get("height", 0) > 0 else 0,
-                        image_type="unknown",
-                        area=img.get("width", 0) * img.get("height", 0)
-                    )
-                    for img in page.scraped_images
-                ]
+                content.images = build_image_infos(page.scraped_images)
             return content
         
         # Try HTML content
@@ -101,56 +153,27 @@ class TextExtractorStage(PipelineStage):
         )
     
     def _clean_dom_text(self, raw_text: str) -> str:
-        """
-        Clean extracted DOM text.
-        
-        Removes:
-        - Excessive whitespace
-        - Navigation noise
-        - Cookie banners
-        """
-        if not raw_text:
-            return ""
-        
-        # Normalize whitespace
-        text = re.sub(r"\s+", " ", raw_text)
-        
-        # Remove common noise patterns
-        noise_patterns = [
-            r"Accept\s+cookies?",
-            r"Cookie\s+policy",
-            r"Privacy\s+policy",
-            r"Terms\s+of\s+service",
-            r"Skip\s+to\s+content",
-            r"Toggle\s+navigation",
-            r"Loading\.\.\.",
-        ]
-        
-        for pattern in noise_patterns:
-            text = re.sub(pattern, "", text, flags=re.IGNORECASE)
-        
-        # Remove very short lines (likely buttons/links)
-        lines = text.split("\n")
-        cleaned_lines = [
-            line.strip() for line in lines
-            if len(line.strip()) > 20 or "." in line
-        ]
-        
-        return "\n".join(cleaned_lines).strip()
+        """Clean extracted DOM text (see clean_dom_text)."""
+        return clean_dom_text(raw_text)
     
     def _extract_from_html(self, html: str) -> str:
-        """Extract text from HTML using BeautifulSoup."""
+        """Extract text from HTML using selectolax (Lexbor C parser)."""
+        # No markup or entities: nothing for the parser to do
+        if not html or ("<" not in html and "&" not in html):
+            return html or ""
+        
         try:
-            from bs4 import BeautifulSoup
+            from selectolax.lexbor import LexborHTMLParser
             
-            soup = BeautifulSoup(html, "html.parser")
+            tree = LexborHTMLParser(html)
             
-            # Remove script and style elements
-            for element in soup(["script", "style", "nav", "footer", "header"]):
-                element.decompose()
+            # Remove script and style elements (with their contents)
+            tree.strip_tags(STRIPPED_TAGS)
             
             # Get text
-            text = soup.get_text(separator="\n")
+            if tree.root is None:
+                return ""
+            text = tree.root.text(separator="\n")
             return text
             
         except Exception as e:
@@ -160,19 +183,17 @@ class TextExtractorStage(PipelineStage):
     def _detect_tables(self, html: str) -> bool:
         """Detect if page contains data tables."""
         try:
-            from bs4 import BeautifulSoup
+            from selectolax.lexbor import LexborHTMLParser
             
-            soup = BeautifulSoup(html, "html.parser")
-            tables = soup.find_all("table")
+            tree = LexborHTMLParser(html)
+            tables = tree.css("table")
             
             # Filter out layout tables
-            data_tables = [
-                t for t in tables
-                if len(t.find_all("tr")) > 2  # At least 3 rows
-                and len(t.find_all("td")) > 4  # At least 5 cells
-            ]
-            
-            return len(data_tables) > 0
+            return any(
+                len(t.css("tr")) > 2  # At least 3 rows
+                and len(t.css("td")) > 4  # At least 5 cells
+                for t in tables
+            )
             
         except Exception:
             return False
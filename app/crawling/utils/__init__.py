@@ -3,6 +3,7 @@
 from app.crawling.utils.rate_limiter import RateLimiter
 from app.crawling.utils.content_filter import ContentFilter
 from app.crawling.utils.robots import RobotsRules, parse_robots_txt, parse_sitemap
+from app.crawling.utils.bloom_filter import BloomFilter
 
 __all__ = [
     "RateLimiter",
@@ -10,4 +11,5 @@ __all__ = [
     "RobotsRules",
     "parse_robots_txt",
     "parse_sitemap",
+    "BloomFilter",
 ]
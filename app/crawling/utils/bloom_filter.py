@@ -0,0 +1,86 @@
+"""
+Bloom filter for compact set membership.
+"""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Bloom filter for string membership tests.
+    
+    Stores ~10-35 bits per item instead of the item itself. Membership
+    tests never give false negatives; false positives occur at roughly
+    `error_rate` while at most `capacity` items have been added.
+    
+    Bit positions use Kirsch-Mitzenmacher double hashing: both base
+    hashes come from a single BLAKE2b digest, so each test or add costs
+    one hash call regardless of the number of hash functions.
+    
+    Usage:
+        visited = BloomFilter(capacity=10_000)
+        
+        if url not in visited:
+            visited.add(url)
+    """
+    
+    def __init__(self, capacity: int = 10_000, error_rate: float = 1e-7):
+        """
+        Initialize Bloom filter.
+        
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false positive rate at capacity
+        """
+        capacity = max(1, capacity)
+        
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+    
+    def _positions(self, item: str) -> list[int]:
+        """Get the bit positions for an item."""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1  # Odd, so never 0
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+    
+    def add(self, item: str) -> bool:
+        """
+        Add an item.
+        
+        Args:
+            item: Item to add
+        
+        Returns:
+            True if the item was not already (probably) present
+        """
+        bits = self._bits
+        added = False
+        for pos in self._positions(item):
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                added = True
+        
+        if added:
+            self._count += 1
+        return added
+    
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+    
+    def __len__(self) -> int:
+        """Number of distinct items added (approximate past capacity)."""
+        return self._count
+    
+    def clear(self) -> None:
+        """Remove all items."""
+        self._bits = bytearray(len(self._bits))
+        self._count = 0
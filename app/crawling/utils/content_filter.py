@@ -2,9 +2,100 @@
 Content filter for skipping unwanted pages.
 """
 
+import hashlib
 import re
 from dataclasses import dataclass, field
-from typing import Optional, Set
+from typing import Optional, Set, Union
+
+try:
+    import xxhash  # type: ignore
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import hyperscan  # type: ignore
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+
+def _combine_patterns(patterns: list[str]) -> Optional[re.Pattern]:
+    """
+    Compile patterns into one case-insensitive alternation.
+    
+    Returns None if there are no patterns or they cannot be combined
+    (e.g. numbered backreferences or inline global flags).
+    """
+    if not patterns:
+        return None
+    
+    combined = "|".join(f"(?:{p})" for p in patterns)
+    # Group numbers shift once patterns are concatenated
+    if re.search(r"\\[1-9]", combined):
+        return None
+    try:
+        return re.compile(combined, re.IGNORECASE)
+    except re.error:
+        return None
+
+
+def _stop_on_match(*args) -> bool:
+    """Hyperscan match callback: stop at the first match."""
+    return True
+
+
+class _HyperscanMatcher:
+    """
+    Case-insensitive multi-pattern matcher backed by one Hyperscan database.
+    
+    All patterns are compiled into a single DFA-based scanner, so a search
+    is one pass over the text regardless of the number of patterns.
+    """
+    
+    def __init__(self, patterns: list[str]):
+        flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+        self._db = hyperscan.Database()
+        self._db.compile(
+            expressions=[p.encode("utf-8") for p in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[flags] * len(patterns),
+        )
+        # Hyperscan case folding and classes are ASCII-only; non-ASCII text uses re
+        self._fallback = [re.compile(p, re.IGNORECASE) for p in patterns]
+    
+    def search(self, text: str) -> bool:
+        if not text.isascii():
+            return any(p.search(text) for p in self._fallback)
+        try:
+            self._db.scan(text.encode("ascii"), match_event_handler=_stop_on_match)
+        except hyperscan.ScanTerminated:
+            return True
+        return False
+
+
+def _compile_matcher(patterns: list[str]):
+    """
+    Build a single matcher for a pattern category.
+    
+    Uses Hyperscan when installed and every pattern is supported by it,
+    otherwise a combined `re` alternation (None if neither applies).
+    """
+    if HYPERSCAN_AVAILABLE and patterns and all(p.isascii() for p in patterns):
+        try:
+            return _HyperscanMatcher(patterns)
+        except hyperscan.error:
+            # Unsupported syntax (backreferences, lookarounds, ...)
+            pass
+    return _combine_patterns(patterns)
+
+
+def content_fingerprint(content: bytes) -> int:
+    """64-bit fingerprint of page content for duplicate detection."""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_intdigest(content)
+    return int.from_bytes(hashlib.blake2b(content, digest_size=8).digest(), "little")
 
 
 @dataclass
@@ -15,7 +106,7 @@ class ContentFilter:
     Features:
     - Skip 404 and error pages
     - Skip login/auth pages
-    - Skip duplicate content
+    - Skip duplicate content (64-bit fingerprints in a set)
     - URL pattern matching (include/exclude)
     
     Usage:
@@ -33,8 +124,8 @@ class ContentFilter:
     include_patterns: list[str] = field(default_factory=list)
     exclude_patterns: list[str] = field(default_factory=list)
     
-    # Internal state
-    _seen_hashes: Set[str] = field(default_factory=set, repr=False)
+    # Internal state (64-bit content fingerprints)
+    _seen_hashes: Set[int] = field(default_factory=set, repr=False)
     _compiled_includes: list[re.Pattern] = field(default_factory=list, repr=False)
     _compiled_excludes: list[re.Pattern] = field(default_factory=list, repr=False)
     
@@ -68,6 +159,11 @@ class ContentFilter:
         self._login_patterns = [
             re.compile(p, re.IGNORECASE) for p in self.LOGIN_PATTERNS
         ]
+        
+        # One search per category instead of one per pattern
+        self._includes_re = _compile_matcher(self.include_patterns)
+        self._excludes_re = _compile_matcher(self.exclude_patterns)
+        self._logins_re = _compile_matcher(self.LOGIN_PATTERNS)
     
     def should_skip_url(self, url: str) -> tuple[bool, Optional[str]]:
         """
@@ -80,30 +176,39 @@ class ContentFilter:
             Tuple of (should_skip, reason)
         """
         # Check exclude patterns first
-        for pattern in self._compiled_excludes:
-            if pattern.search(url):
-                return True, f"Excluded by pattern: {pattern.pattern}"
+        if self._excludes_re is None or self._excludes_re.search(url):
+            # Find which pattern matched for the reason
+            for pattern in self._compiled_excludes:
+                if pattern.search(url):
+                    return True, f"Excluded by pattern: {pattern.pattern}"
         
         # Check include patterns (if any are set, URL must match at least one)
         if self._compiled_includes:
-            matched = any(p.search(url) for p in self._compiled_includes)
+            if self._includes_re is not None:
+                matched = bool(self._includes_re.search(url))
+            else:
+                matched = any(p.search(url) for p in self._compiled_includes)
             if not matched:
                 return True, "URL does not match any include pattern"
         
         # Check login patterns
         if self.skip_login_pages:
-            for pattern in self._login_patterns:
-                if pattern.search(url):
+            if self._logins_re is not None:
+                if self._logins_re.search(url):
                     return True, "Login/auth page"
+            else:
+                for pattern in self._login_patterns:
+                    if pattern.search(url):
+                        return True, "Login/auth page"
         
         return False, None
     
-    def is_duplicate_content(self, content_hash: str) -> bool:
+    def is_duplicate_content(self, content_hash: Union[str, int]) -> bool:
         """
         Check if content has been seen before.
         
         Args:
-            content_hash: Hash of page content
+            content_hash: Hex digest of page content, or an int fingerprint
             
         Returns:
             True if this content hash was already seen
@@ -111,12 +216,33 @@ class ContentFilter:
         if not self.skip_duplicates:
             return False
         
+        if isinstance(content_hash, str):
+            # First 64 bits of the digest; stored as int, not a 32-64 char str
+            try:
+                content_hash = int(content_hash[:16], 16)
+            except ValueError:
+                content_hash = content_fingerprint(content_hash.encode("utf-8"))
+        else:
+            content_hash &= 0xFFFF_FFFF_FFFF_FFFF
+        
         if content_hash in self._seen_hashes:
             return True
         
         self._seen_hashes.add(content_hash)
         return False
     
+    def add_content(self, content: bytes) -> bool:
+        """
+        Fingerprint content and check if it has been seen before.
+        
+        Args:
+            content: Raw page content
+            
+        Returns:
+            True if this content was already seen
+        """
+        return self.is_duplicate_content(content_fingerprint(content))
+    
     def is_error_page(self, status_code: int) -> bool:
         """
         Check if response is an error page.
@@ -1,8 +1,9 @@
 """
-Rate limiter with exponential backoff.
+Token-bucket rate limiter with exponential backoff.
 """
 
 import asyncio
+import random
 import time
 
 
@@ -10,9 +11,15 @@ class RateLimiter:
     """
     Rate limiter with exponential backoff for failed requests.
     
+    A token bucket refilled at one token per current delay: up to `burst`
+    requests may go out back to back, after which callers are spaced one
+    delay apart. With the default burst=1 this is a plain minimum gap.
+    
     Features:
     - Configurable base delay between requests
-    - Exponential backoff on failures
+    - Optional bursts up to `burst` requests
+    - Exponential backoff on failures (full jitter, so limiters that fail
+      together do not retry in lockstep)
     - Maximum delay cap
     - Async-compatible
     
@@ -35,6 +42,7 @@ class RateLimiter:
         base_delay: float = 1.0,
         max_delay: float = 30.0,
         backoff_factor: float = 2.0,
+        burst: int = 1,
     ):
         """
         Initialize rate limiter.
@@ -43,40 +51,63 @@ class RateLimiter:
             base_delay: Base delay between requests in seconds
             max_delay: Maximum delay (cap for backoff)
             backoff_factor: Multiplier for exponential backoff
+            burst: Bucket capacity (requests allowed without waiting)
         """
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.backoff_factor = backoff_factor
+        self.capacity = burst
         self.current_delay = base_delay
-        self.last_request_time = 0.0
         self.consecutive_failures = 0
+        # Negative while callers hold reserved (not yet due) slots
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        # Upper bound of the jittered backoff delay
+        self._ceiling = base_delay
+    
+    def _next_delay(self) -> float:
+        """Delay before the next request; sampled while backing off."""
+        if self.is_backing_off:
+            # Never below base_delay, which may be a robots.txt crawl-delay
+            self.current_delay = random.uniform(
+                self.base_delay, max(self.base_delay, self._ceiling)
+            )
+        return self.current_delay
+    
+    def _take_token(self) -> float:
+        """
+        Take a token, refilling first; returns seconds until it is due.
+        
+        The token is taken even when the bucket is empty, so concurrent
+        callers queue up one delay apart rather than all waking together.
+        """
+        now = time.monotonic()
+        delay = self._next_delay()
+        if delay > 0:
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) / delay)
+        else:
+            self.tokens = self.capacity
+        self.last_refill = now
+        
+        self.tokens -= 1
+        return -self.tokens * delay if self.tokens < 0 else 0.0
     
     async def wait(self) -> None:
         """
         Wait before next request.
         
-        Calculates required delay based on last request time
-        and current backoff state.
+        Returns immediately while the bucket has tokens; otherwise sleeps
+        until the reserved token is refilled.
         """
-        now = time.time()
-        elapsed = now - self.last_request_time
-        wait_time = max(0, self.current_delay - elapsed)
-        
+        wait_time = self._take_token()
         if wait_time > 0:
             await asyncio.sleep(wait_time)
-        
-        self.last_request_time = time.time()
     
     def wait_sync(self) -> None:
         """Synchronous version of wait()."""
-        now = time.time()
-        elapsed = now - self.last_request_time
-        wait_time = max(0, self.current_delay - elapsed)
-        
+        wait_time = self._take_token()
         if wait_time > 0:
             time.sleep(wait_time)
-        
-        self.last_request_time = time.time()
     
     def success(self) -> None:
         """
@@ -86,15 +117,17 @@ class RateLimiter:
         """
         self.consecutive_failures = 0
         self.current_delay = self.base_delay
+        self._ceiling = self.base_delay
     
     def failure(self) -> None:
         """
         Call after failed request.
         
-        Increases delay exponentially up to max_delay.
+        Increases the backoff ceiling exponentially up to max_delay; the
+        actual delay is sampled below it on each wait.
         """
         self.consecutive_failures += 1
-        self.current_delay = min(
+        self._ceiling = min(
             self.base_delay * (self.backoff_factor ** self.consecutive_failures),
             self.max_delay
         )
@@ -107,5 +140,7 @@ class RateLimiter:
     def reset(self) -> None:
         """Reset all state."""
         self.current_delay = self.base_delay
-        self.last_request_time = 0.0
+        self._ceiling = self.base_delay
+        self.tokens = float(self.capacity)
+        self.last_refill = time.monotonic()
         self.consecutive_failures = 0
@@ -2,7 +2,10 @@
 
 
 import asyncio
-import uuid
+import functools
+import logging
+import os
+import secrets
 from docling_core.transforms.serializer.base import (
     BaseDocSerializer,
     SerializationResult,
@@ -19,100 +22,268 @@ from docling_core.transforms.serializer.common import create_ser_result
 from typing import Iterable, Optional, Any, Dict
 from typing_extensions import override
 from pathlib import Path
-import re
 from concurrent.futures import ThreadPoolExecutor
 from app.config import app_config
 
+logger = logging.getLogger(__name__)
+
+# Image modes written as-is; anything else is converted to RGB first
+_OK_MODES = frozenset({'RGB', 'L', 'RGBA'})
+
+
+@functools.lru_cache(maxsize=1)
+def _get_default_executor() -> ThreadPoolExecutor:
+    """Process-wide executor shared by serializers created without one"""
+    return ThreadPoolExecutor(
+        max_workers=min(8, (os.cpu_count() or 4) * 2),
+        thread_name_prefix='pic-save',
+    )
+
+
+def _save_image(pil_img, img_path: Path, image_format: str, compress_level: int) -> None:
+    """Save a PIL image as PNG, or lossless WebP when image_format is 'webp'"""
+    # Convert to RGB if needed
+    if pil_img.mode not in _OK_MODES:
+        pil_img = pil_img.convert('RGB')
+    if image_format == 'webp':
+        # quality=0 is the fastest lossless effort level
+        pil_img.save(img_path, format='WEBP', lossless=True, quality=0)
+    else:
+        pil_img.save(img_path, format='PNG', compress_level=compress_level)
+
+
+def _extract_full_text_iter(root) -> str:
+    """
+    Collect text of an item tree depth-first: each item's text, then its
+    children, then its caption; whitespace collapsed to single spaces.
+    """
+    text_parts = []
+    # (item, False) visits an item; (caption text, True) emits a queued caption
+    stack = [(root, False)]
+    while stack:
+        item, is_caption = stack.pop()
+        if is_caption:
+            text_parts.append(item)
+            continue
+        
+        text = getattr(item, 'text', None)
+        if text:
+            text_parts.append(text)
+        
+        caption = getattr(item, 'caption', None)
+        if caption is not None:
+            cap_text = getattr(caption, 'text', None)
+            if cap_text:
+                cap_text = cap_text.strip()
+                if cap_text and not cap_text.startswith('#/'):
+                    stack.append((cap_text, True))
+            elif isinstance(caption, str) and not caption.startswith('#/'):
+                stack.append((caption, True))
+        
+        children = getattr(item, 'children', None)
+        if children:
+            stack.extend((child, False) for child in reversed(children))
+    
+    # Collapse whitespace runs (str.split is faster than re.sub here)
+    return " ".join(" ".join(text_parts).split())
+
+
+def _caption_from_markdown(exported_md: Optional[str]) -> Optional[str]:
+    """Pick the caption text around the image link in a picture's markdown export"""
+    if not exported_md:
+        return None
+    
+    parts = exported_md.split('![Image](')
+    
+    if len(parts) > 1:
+        caption_candidate = parts[0].strip()
+        
+        if caption_candidate and len(caption_candidate) > 2:
+            caption_candidate = caption_candidate.replace('\n', ' ')
+            caption_candidate = ' '.join(caption_candidate.split())
+            
+            lower_caption = caption_candidate.lower()
+            if any(keyword in lower_caption for keyword in 
+                ['figure', 'fig.', 'table', 'image', 'diagram', 'chart']):
+                return caption_candidate
+            
+            if len(caption_candidate) > 10:
+                return caption_candidate
+    
+    if len(parts) > 1 and len(parts[1]) > 2:
+        after_image = parts[1]
+        if ')' in after_image:
+            caption_after = after_image.split(')', 1)[1].strip()
+            if caption_after and len(caption_after) > 10:
+                return caption_after
+    
+    return None
+
+
 class FilePictureSerializer_new(MarkdownPictureSerializer):
     """Custom async picture serializer that saves images to files with dynamic placeholders"""
     
     def __init__(
         self, 
         output_dir: Path = Path("exported_images"),         
-        executor: Optional[ThreadPoolExecutor] = None
+        executor: Optional[ThreadPoolExecutor] = None,
+        image_format: str = "png",
+        image_compress_level: int = 1,
+        dedicated_executor: bool = False,
     ):
         super().__init__()
         self.output_dir = output_dir
+        self.image_format = image_format
+        self.image_compress_level = image_compress_level
         self.output_dir.mkdir(exist_ok=True, parents=True)
         self.image_counter = 0
         
         self.image_map: Dict[str, Dict[str, Any]] = {}
-        # Track if we own the executor to know if we should shut it down
-        self._owns_executor = executor is None
-        self.executor = executor or ThreadPoolExecutor(max_workers=4)
-        self._executor_shutdown = False
-        self._lock = asyncio.Lock()
+        # Track if we own the executor to know if we should shut it down;
+        # without one we use the shared executor unless a dedicated one is asked for
+        self._owns_executor = executor is None and dedicated_executor
+        if executor is not None:
+            self.executor = executor
+        elif dedicated_executor:
+            self.executor = ThreadPoolExecutor(max_workers=4)
+        else:
+            self.executor = _get_default_executor()
+        # Lookup tables for the document being serialized, rebuilt when
+        # a different (or grown) pictures/body list is passed in
+        self._pic_index_src = None
+        self._pic_index_len = 0
+        self._pic_index_map: Dict[Any, Any] = {}
+        self._body_index_src = None
+        self._body_index_map: Dict[Any, int] = {}
     
     @classmethod
     async def from_config(cls,executor: Optional[ThreadPoolExecutor] = None):
         """Initialize Enhanced DocumentProcessor with all required dependencies"""
         output_dir=app_config.exported_images
-        return cls(output_dir=Path(output_dir), executor=executor)
+        return cls(
+            output_dir=Path(output_dir),
+            executor=executor,
+            image_format=app_config.EXPORTED_IMAGE_FORMAT,
+            image_compress_level=app_config.EXPORTED_IMAGE_COMPRESS_LEVEL,
+        )
      
 
 
+    @property
+    def _image_suffix(self) -> str:
+        return "webp" if self.image_format == "webp" else "png"
+    
+    def _pic_index(self, pictures) -> Dict[Any, Any]:
+        """Map self_ref (or name) -> first picture with it in doc.pictures"""
+        if self._pic_index_src is not pictures or self._pic_index_len != len(pictures):
+            index: Dict[Any, Any] = {}
+            for pic_data in pictures:
+                pic_ref = getattr(pic_data, 'self_ref', None) or getattr(pic_data, 'name', None)
+                index.setdefault(pic_ref, pic_data)
+            self._pic_index_src = pictures
+            self._pic_index_len = len(pictures)
+            self._pic_index_map = index
+        return self._pic_index_map
+    
+    def _body_index(self, body) -> Dict[Any, int]:
+        """Map self_ref -> first position in doc.body"""
+        if self._body_index_src is not body:
+            index: Dict[Any, int] = {}
+            for idx, doc_item in enumerate(body):
+                index.setdefault(getattr(doc_item, 'self_ref', None), idx)
+            self._body_index_src = body
+            self._body_index_map = index
+        return self._body_index_map
+    
     async def _save_image_async(self, pil_img, img_path: Path) -> None:
         """Save PIL image asynchronously"""
-        if self._executor_shutdown:
-            raise RuntimeError("Executor has been shut down")
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         await loop.run_in_executor(
             self.executor,
-            lambda: pil_img.save(img_path, format='PNG')
+            _save_image,
+            pil_img,
+            img_path,
+            self.image_format,
+            self.image_compress_level,
         )
     
     async def _extract_image_async(self, item: PictureItem, doc: DoclingDocument) -> Optional[Any]:
         """Extract PIL image from item asynchronously"""
-        if self._executor_shutdown:
-            raise RuntimeError("Executor has been shut down")
+        loop = asyncio.get_running_loop()
         pil_img = None
+        # Look each attribute up once (hasattr + access does it twice)
+        self_ref = getattr(item, 'self_ref', None)
+        pictures = getattr(doc, 'pictures', None)
         
         # Method 1: Try to get image from doc.pictures (most reliable)
-        if hasattr(doc, 'pictures') and doc.pictures:
-            if hasattr(item, 'self_ref') and item.self_ref:
-                for pic_data in doc.pictures:
-                    pic_ref = getattr(pic_data, 'self_ref', None) or getattr(pic_data, 'name', None)
-                    if pic_ref == item.self_ref:
-                        if hasattr(pic_data, 'pil_image') and pic_data.pil_image:
-                            pil_img = pic_data.pil_image
-                            break
-                        elif hasattr(pic_data, 'get_image'):
-                            # Run get_image in executor if it's blocking
-                            loop = asyncio.get_event_loop()
-                            pil_img = await loop.run_in_executor(
-                                self.executor,
-                                lambda: pic_data.get_image(doc)
-                            )
-                            break
-                        elif hasattr(pic_data, 'image'):
-                            image_ref = pic_data.image
-                            if hasattr(image_ref, 'pil_image') and image_ref.pil_image:
-                                pil_img = image_ref.pil_image
-                                break
-                            elif hasattr(image_ref, 'get_image'):
-                                loop = asyncio.get_event_loop()
-                                pil_img = await loop.run_in_executor(
-                                    self.executor,
-                                    lambda: image_ref.get_image(doc)
-                                )
-                                break
+        if pictures and self_ref:
+            pic_data = self._pic_index(pictures).get(self_ref)
+            if pic_data is not None:
+                pic_pil = getattr(pic_data, 'pil_image', None)
+                # Loader to run if no image is attached yet
+                get_image = getattr(pic_data, 'get_image', None)
+                image_ref = getattr(pic_data, 'image', None)
+                if pic_pil:
+                    pil_img = pic_pil
+                elif get_image is None and image_ref is not None:
+                    ref_pil = getattr(image_ref, 'pil_image', None)
+                    if ref_pil:
+                        pil_img = ref_pil
+                    else:
+                        get_image = getattr(image_ref, 'get_image', None)
+                
+                if pil_img is None and get_image is not None:
+                    # Run get_image in executor if it's blocking
+                    pil_img = await loop.run_in_executor(self.executor, get_image, doc)
         
         # Method 2: Try from item.image directly (fallback)
-        if pil_img is None and hasattr(item, 'image') and item.image:
-            image_obj = item.image
-            if hasattr(image_obj, 'pil_image') and image_obj.pil_image:
-                pil_img = image_obj.pil_image
-            elif hasattr(image_obj, 'get_image'):
-                loop = asyncio.get_event_loop()
-                pil_img = await loop.run_in_executor(
-                    self.executor,
-                    lambda: image_obj.get_image(doc)
-                )
+        image_obj = getattr(item, 'image', None)
+        if pil_img is None and image_obj:
+            obj_pil = getattr(image_obj, 'pil_image', None)
+            obj_get_image = getattr(image_obj, 'get_image', None)
+            if obj_pil:
+                pil_img = obj_pil
+            elif obj_get_image is not None:
+                pil_img = await loop.run_in_executor(self.executor, obj_get_image, doc)
             elif hasattr(image_obj, 'size') and hasattr(image_obj, 'save'):
                 pil_img = image_obj
         
         return pil_img
     
+    def _image_path(self, raw_id: str) -> Path:
+        """Output file path for an image id"""
+        return self.output_dir / f"image_{raw_id}.{self._image_suffix}"
+    
+    def _finalize(
+        self,
+        raw_id: str,
+        img_path: Path,
+        caption: str,
+        item: PictureItem,
+        doc_serializer: BaseDocSerializer,
+    ) -> SerializationResult:
+        """Record a saved image and build its placeholder result (shared by both serialize paths)"""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Caption: %s", caption)
+        
+        # Store in mapping
+        if hasattr(item, 'self_ref'):
+            self.image_map[item.self_ref] = {
+                'path': str(img_path),
+                'caption': caption,
+                'id': raw_id
+            }
+        self.image_counter += 1
+        
+        # Create dynamic placeholder
+        placeholder = f"<!-- IMAGE_ID:{raw_id}|PATH:{img_path}|CAPTION:{caption} -->"
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Saved image %s: %s - %s...", raw_id, img_path, caption[:50])
+        
+        text_res = doc_serializer.post_process(text=placeholder)
+        return create_ser_result(text=text_res, span_source=item)
+    
     @override
     async def serialize_async(
         self,
@@ -124,72 +295,35 @@ class FilePictureSerializer_new(MarkdownPictureSerializer):
     ) -> SerializationResult:
         """Async serialize picture item to markdown with dynamic file reference placeholder"""
         try:
-            # Generate unique ID
-            _idval = str(uuid.uuid4()).replace('-', '')
-            first5 = _idval[:5]
-            middle5 = _idval[25:30]
-            raw_id = first5 + middle5
+            # Generate unique ID (10 hex chars)
+            raw_id = secrets.token_hex(5)
             
-            print(f"Processing image with UUID: {raw_id}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Processing image with id: %s", raw_id)
             
             # Extract image asynchronously
             pil_img = await self._extract_image_async(item, doc)
             
             if pil_img is not None:
-                # Convert to RGB if needed (run in executor)
-                if pil_img.mode not in ('RGB', 'L', 'RGBA'):
-                    if self._executor_shutdown:
-                        # Try direct conversion if executor is shutdown
-                        pil_img = pil_img.convert('RGB')
-                    else:
-                        loop = asyncio.get_event_loop()
-                        pil_img = await loop.run_in_executor(
-                            self.executor,
-                            lambda: pil_img.convert('RGB')
-                        )
-                
-                # Generate unique filename
-                img_filename = f"image_{raw_id}.png"
-                img_path = self.output_dir / img_filename
+                img_path = self._image_path(raw_id)
                 
-                # Save image asynchronously
+                # Convert (if needed) and save in one executor job
                 await self._save_image_async(pil_img, img_path)
                 
                 # Get caption asynchronously
                 caption = await self._get_caption_async(item, doc)
-                print(f"Caption: {caption}")
-                
-                # Store in mapping (thread-safe)
-                async with self._lock:
-                    if hasattr(item, 'self_ref'):
-                        self.image_map[item.self_ref] = {
-                            'path': str(img_path),
-                            'caption': caption,
-                            'id': raw_id
-                        }
-                    self.image_counter += 1
-                
-                # Create dynamic placeholder
-                placeholder = f"<!-- IMAGE_ID:{raw_id}|PATH:{img_path}|CAPTION:{caption} -->"
                 
-                print(f"✓ Saved image {raw_id}: {img_path} - {caption[:50]}...")
-                
-                text_res = placeholder
-                text_res = doc_serializer.post_process(text=text_res)
-                return create_ser_result(text=text_res, span_source=item)
+                # No await between here and the mapping update, so no lock needed
+                return self._finalize(raw_id, img_path, caption, item, doc_serializer)
             
         except RuntimeError as e:
             # Handle executor shutdown errors specifically
             if "shutdown" in str(e).lower():
-                print(f"✗ Executor shutdown during image processing: {e}")
+                logger.warning("Executor shutdown during image processing: %s", e)
             else:
-                print(f"✗ Runtime error during image processing: {e}")
-                import traceback
-                traceback.print_exc()
-        except Exception as e:
-            print(f"✗ Failed to save image: {e}")
-            import traceback
-            traceback.print_exc()
+                logger.exception("Runtime error during image processing")
+        except Exception:
+            logger.exception("Failed to save image")
         
         # Fallback
         return create_ser_result(text="<!-- IMAGE_SAVE_FAILED -->\n\n")
@@ -205,117 +339,59 @@ class FilePictureSerializer_new(MarkdownPictureSerializer):
     ) -> SerializationResult:
         """Synchronous wrapper - processes images synchronously to avoid executor issues"""
         try:
-            # Generate unique ID
-            _idval = str(uuid.uuid4()).replace('-', '')
-            first5 = _idval[:5]
-            middle5 = _idval[25:30]
-            raw_id = first5 + middle5
+            # Generate unique ID (10 hex chars)
+            raw_id = secrets.token_hex(5)
             
-            print(f"Processing image with UUID: {raw_id}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Processing image with id: %s", raw_id)
             
             # Extract image synchronously to avoid executor issues in sync context
             pil_img = self._extract_image_sync(item, doc)
             
             if pil_img is not None:
-                # Convert to RGB if needed
-                if pil_img.mode not in ('RGB', 'L', 'RGBA'):
-                    pil_img = pil_img.convert('RGB')
-                
-                # Generate unique filename
-                img_filename = f"image_{raw_id}.png"
-                img_path = self.output_dir / img_filename
+                img_path = self._image_path(raw_id)
                 
-                # Save image synchronously
-                pil_img.save(img_path, format='PNG')
+                # Convert (if needed) and save synchronously
+                _save_image(pil_img, img_path, self.image_format, self.image_compress_level)
                 
                 # Get caption synchronously
                 caption = self._get_caption_sync(item, doc)
                 
-                # Store in mapping
-                if hasattr(item, 'self_ref'):
-                    self.image_map[item.self_ref] = {
-                        'path': str(img_path),
-                        'caption': caption,
-                        'id': raw_id
-                    }
-                self.image_counter += 1
-                
-                # Create dynamic placeholder
-                placeholder = f"<!-- IMAGE_ID:{raw_id}|PATH:{img_path}|CAPTION:{caption} -->"
+                return self._finalize(raw_id, img_path, caption, item, doc_serializer)
                 
-                print(f"✓ Saved image {raw_id}: {img_path} - {caption[:50]}...")
-                
-                text_res = placeholder
-                text_res = doc_serializer.post_process(text=text_res)
-                return create_ser_result(text=text_res, span_source=item)
-                
-        except Exception as e:
-            print(f"✗ Failed to save image: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Failed to save image")
         
         # Fallback
         return create_ser_result(text="<!-- IMAGE_SAVE_FAILED -->\n\n")
     
-    async def _get_caption_async(self, item: PictureItem, doc: DoclingDocument) -> str:
-        """Extract complete caption from picture item asynchronously"""
-        
-        # Method 1: Try to export item to markdown and extract caption from it
-        try:
-            if hasattr(item, 'export_to_markdown'):
-                if self._executor_shutdown:
-                    # Skip executor-based operations if shutdown
-                    return f"Figure {self.image_counter + 1}"
-                loop = asyncio.get_event_loop()
-                exported_md = await loop.run_in_executor(
-                    self.executor,
-                    lambda: item.export_to_markdown(doc)
-                )
-                
-                if exported_md:
-                    parts = exported_md.split('![Image](')
-                    
-                    if len(parts) > 1:
-                        caption_candidate = parts[0].strip()
-                        
-                        if caption_candidate and len(caption_candidate) > 2:
-                            caption_candidate = caption_candidate.replace('\n', ' ')
-                            caption_candidate = ' '.join(caption_candidate.split())
-                            
-                            lower_caption = caption_candidate.lower()
-                            if any(keyword in lower_caption for keyword in 
-                                ['figure', 'fig.', 'table', 'image', 'diagram', 'chart']):
-                                return caption_candidate
-                            
-                            if len(caption_candidate) > 10:
-                                return caption_candidate
-                    
-                    if len(parts) > 1 and len(parts[1]) > 2:
-                        after_image = parts[1]
-                        if ')' in after_image:
-                            caption_after = after_image.split(')', 1)[1].strip()
-                            if caption_after and len(caption_after) > 10:
-                                return caption_after
-        
-        except Exception as e:
-            print(f"Could not parse markdown export: {e}")
-        
-        # Method 2: Check item's direct caption attribute
-        if hasattr(item, 'caption') and item.caption:
-            if hasattr(item.caption, 'text') and item.caption.text:
-                caption_text = item.caption.text.strip()
+    def _cheap_caption(self, item: PictureItem, doc: DoclingDocument) -> Optional[str]:
+        """Caption from data already on the item/document (no markdown export)"""
+        # Method 1: Check item's direct caption attribute
+        item_caption = getattr(item, 'caption', None)
+        if item_caption:
+            caption_text = getattr(item_caption, 'text', None)
+            if caption_text:
+                caption_text = caption_text.strip()
                 if caption_text and not caption_text.startswith('#/'):
                     return caption_text
-            elif isinstance(item.caption, str) and not item.caption.startswith('#/'):
-                return item.caption.strip()
+            elif isinstance(item_caption, str) and not item_caption.startswith('#/'):
+                return item_caption.strip()
+        
+        # Method 2: Check picture metadata
+        self_ref = getattr(item, 'self_ref', None)
+        pictures = getattr(doc, 'pictures', None)
+        if pictures and self_ref is not None:
+            pic_data = self._pic_index(pictures).get(self_ref)
+            if pic_data is not None and getattr(pic_data, 'self_ref', None) == self_ref:
+                description = getattr(pic_data, 'description', None)
+                if description:
+                    return description.strip()
         
         # Method 3: Search in document body for nearby CAPTION elements
-        if hasattr(item, 'self_ref') and hasattr(doc, 'body'):
-            item_index = None
-            for idx, doc_item in enumerate(doc.body):
-                if hasattr(doc_item, 'self_ref') and doc_item.self_ref == item.self_ref:
-                    item_index = idx
-                    break
+        body = getattr(doc, 'body', None)
+        if self_ref is not None and body is not None:
+            item_index = self._body_index(body).get(self_ref)
             
             if item_index is not None:
                 search_range = 5
@@ -323,11 +399,11 @@ class FilePictureSerializer_new(MarkdownPictureSerializer):
                 
                 for offset in range(-search_range, search_range + 1):
                     check_idx = item_index + offset
-                    if 0 <= check_idx < len(doc.body):
-                        nearby_item = doc.body[check_idx]
+                    if 0 <= check_idx < len(body):
+                        nearby_item = body[check_idx]
                         
-                        if hasattr(nearby_item, 'label') and nearby_item.label == DocItemLabel.CAPTION:
-                            caption_text = await self._extract_full_text_async(nearby_item)
+                        if getattr(nearby_item, 'label', None) == DocItemLabel.CAPTION:
+                            caption_text = self._extract_full_text_sync(nearby_item)
                             if caption_text:
                                 caption_parts.append(caption_text)
                 
@@ -335,81 +411,76 @@ class FilePictureSerializer_new(MarkdownPictureSerializer):
                     full_caption = " ".join(caption_parts).strip()
                     return full_caption
         
-        # Method 4: Check picture metadata
-        if hasattr(doc, 'pictures') and doc.pictures:
-            if hasattr(item, 'self_ref'):
-                for pic_data in doc.pictures:
-                    pic_ref = getattr(pic_data, 'self_ref', None)
-                    if pic_ref == item.self_ref:
-                        if hasattr(pic_data, 'description') and pic_data.description:
-                            return pic_data.description.strip()
-                        break
+        return None
+    
+    async def _get_caption_async(self, item: PictureItem, doc: DoclingDocument) -> str:
+        """Extract complete caption from picture item asynchronously"""
+        # Cheap attribute lookups first; markdown export is the costly path
+        caption = self._cheap_caption(item, doc)
+        if caption is not None:
+            return caption
+        
+        # Method 4: Try to export item to markdown and extract caption from it
+        try:
+            export_to_markdown = getattr(item, 'export_to_markdown', None)
+            if export_to_markdown is not None:
+                loop = asyncio.get_running_loop()
+                exported_md = await loop.run_in_executor(
+                    self.executor, export_to_markdown, doc
+                )
+                caption = _caption_from_markdown(exported_md)
+                if caption is not None:
+                    return caption
+        
+        except Exception:
+            logger.warning("Could not parse markdown export", exc_info=True)
         
         # Fallback
         return f"Figure {self.image_counter + 1}"
     
     async def _extract_full_text_async(self, item) -> str:
-        """Extract all text content from an item recursively"""
-        text_parts = []
-        
-        if hasattr(item, 'text') and item.text:
-            text_parts.append(item.text.strip())
-        
-        if hasattr(item, 'children') and item.children:
-            # Process children concurrently
-            tasks = [self._extract_full_text_async(child) for child in item.children]
-            child_texts = await asyncio.gather(*tasks)
-            text_parts.extend([text for text in child_texts if text])
-        
-        if hasattr(item, 'caption'):
-            if hasattr(item.caption, 'text') and item.caption.text:
-                cap_text = item.caption.text.strip()
-                if cap_text and not cap_text.startswith('#/'):
-                    text_parts.append(cap_text)
-            elif isinstance(item.caption, str) and not item.caption.startswith('#/'):
-                text_parts.append(item.caption.strip())
-        
-        full_text = " ".join(text_parts).strip()
-        full_text = re.sub(r'\s+', ' ', full_text)
-        
-        return full_text
+        """Extract all text content from an item and its children"""
+        # Pure attribute reads; no reason to spread the walk over coroutines
+        return _extract_full_text_iter(item)
     
     def _extract_full_text(self, item) -> str:
-        """Synchronous wrapper for _extract_full_text_async"""
-        return asyncio.run(self._extract_full_text_async(item))
+        """Synchronous version of _extract_full_text_async (safe inside a running loop)"""
+        return self._extract_full_text_sync(item)
     
     def _extract_image_sync(self, item: PictureItem, doc: DoclingDocument) -> Optional[Any]:
         """Extract PIL image synchronously (for use in sync serialize method)"""
         pil_img = None
+        self_ref = getattr(item, 'self_ref', None)
+        pictures = getattr(doc, 'pictures', None)
         
         # Method 1: Try to get image from doc.pictures (most reliable)
-        if hasattr(doc, 'pictures') and doc.pictures:
-            if hasattr(item, 'self_ref') and item.self_ref:
-                for pic_data in doc.pictures:
-                    pic_ref = getattr(pic_data, 'self_ref', None) or getattr(pic_data, 'name', None)
-                    if pic_ref == item.self_ref:
-                        if hasattr(pic_data, 'pil_image') and pic_data.pil_image:
-                            pil_img = pic_data.pil_image
-                            break
-                        elif hasattr(pic_data, 'get_image'):
-                            pil_img = pic_data.get_image(doc)
-                            break
-                        elif hasattr(pic_data, 'image'):
-                            image_ref = pic_data.image
-                            if hasattr(image_ref, 'pil_image') and image_ref.pil_image:
-                                pil_img = image_ref.pil_image
-                                break
-                            elif hasattr(image_ref, 'get_image'):
-                                pil_img = image_ref.get_image(doc)
-                                break
+        if pictures and self_ref:
+            pic_data = self._pic_index(pictures).get(self_ref)
+            if pic_data is not None:
+                pic_pil = getattr(pic_data, 'pil_image', None)
+                get_image = getattr(pic_data, 'get_image', None)
+                image_ref = getattr(pic_data, 'image', None)
+                if pic_pil:
+                    pil_img = pic_pil
+                elif get_image is not None:
+                    pil_img = get_image(doc)
+                elif image_ref is not None:
+                    ref_pil = getattr(image_ref, 'pil_image', None)
+                    ref_get_image = getattr(image_ref, 'get_image', None)
+                    if ref_pil:
+                        pil_img = ref_pil
+                    elif ref_get_image is not None:
+                        pil_img = ref_get_image(doc)
         
         # Method 2: Try from item.image directly (fallback)
-        if pil_img is None and hasattr(item, 'image') and item.image:
-            image_obj = item.image
-            if hasattr(image_obj, 'pil_image') and image_obj.pil_image:
-                pil_img = image_obj.pil_image
-            elif hasattr(image_obj, 'get_image'):
-                pil_img = image_obj.get_image(doc)
+        image_obj = getattr(item, 'image', None)
+        if pil_img is None and image_obj:
+            obj_pil = getattr(image_obj, 'pil_image', None)
+            obj_get_image = getattr(image_obj, 'get_image', None)
+            if obj_pil:
+                pil_img = obj_pil
+            elif obj_get_image is not None:
+                pil_img = obj_get_image(doc)
             elif hasattr(image_obj, 'size') and hasattr(image_obj, 'save'):
                 pil_img = image_obj
         
@@ -417,118 +488,34 @@ class FilePictureSerializer_new(MarkdownPictureSerializer):
     
     def _get_caption_sync(self, item: PictureItem, doc: DoclingDocument) -> str:
         """Extract caption synchronously (for use in sync serialize method)"""
-        try:
-            if hasattr(item, 'export_to_markdown'):
-                exported_md = item.export_to_markdown(doc)
-                
-                if exported_md:
-                    parts = exported_md.split('![Image](')
-                    
-                    if len(parts) > 1:
-                        caption_candidate = parts[0].strip()
-                        
-                        if caption_candidate and len(caption_candidate) > 2:
-                            caption_candidate = caption_candidate.replace('\n', ' ')
-                            caption_candidate = ' '.join(caption_candidate.split())
-                            
-                            lower_caption = caption_candidate.lower()
-                            if any(keyword in lower_caption for keyword in 
-                                ['figure', 'fig.', 'table', 'image', 'diagram', 'chart']):
-                                return caption_candidate
-                            
-                            if len(caption_candidate) > 10:
-                                return caption_candidate
-                    
-                    if len(parts) > 1 and len(parts[1]) > 2:
-                        after_image = parts[1]
-                        if ')' in after_image:
-                            caption_after = after_image.split(')', 1)[1].strip()
-                            if caption_after and len(caption_after) > 10:
-                                return caption_after
-        
-        except Exception as e:
-            print(f"Could not parse markdown export: {e}")
+        caption = self._cheap_caption(item, doc)
+        if caption is not None:
+            return caption
         
-        # Method 2: Check item's direct caption attribute
-        if hasattr(item, 'caption') and item.caption:
-            if hasattr(item.caption, 'text') and item.caption.text:
-                caption_text = item.caption.text.strip()
-                if caption_text and not caption_text.startswith('#/'):
-                    return caption_text
-            elif isinstance(item.caption, str) and not item.caption.startswith('#/'):
-                return item.caption.strip()
-        
-        # Method 3: Search in document body for nearby CAPTION elements
-        if hasattr(item, 'self_ref') and hasattr(doc, 'body'):
-            item_index = None
-            for idx, doc_item in enumerate(doc.body):
-                if hasattr(doc_item, 'self_ref') and doc_item.self_ref == item.self_ref:
-                    item_index = idx
-                    break
-            
-            if item_index is not None:
-                search_range = 5
-                caption_parts = []
-                
-                for offset in range(-search_range, search_range + 1):
-                    check_idx = item_index + offset
-                    if 0 <= check_idx < len(doc.body):
-                        nearby_item = doc.body[check_idx]
-                        
-                        if hasattr(nearby_item, 'label') and nearby_item.label == DocItemLabel.CAPTION:
-                            caption_text = self._extract_full_text_sync(nearby_item)
-                            if caption_text:
-                                caption_parts.append(caption_text)
-                
-                if caption_parts:
-                    full_caption = " ".join(caption_parts).strip()
-                    return full_caption
+        # Last resort: export item to markdown and extract caption from it
+        try:
+            export_to_markdown = getattr(item, 'export_to_markdown', None)
+            if export_to_markdown is not None:
+                caption = _caption_from_markdown(export_to_markdown(doc))
+                if caption is not None:
+                    return caption
         
-        # Method 4: Check picture metadata
-        if hasattr(doc, 'pictures') and doc.pictures:
-            if hasattr(item, 'self_ref'):
-                for pic_data in doc.pictures:
-                    pic_ref = getattr(pic_data, 'self_ref', None)
-                    if pic_ref == item.self_ref:
-                        if hasattr(pic_data, 'description') and pic_data.description:
-                            return pic_data.description.strip()
-                        break
+        except Exception:
+            logger.warning("Could not parse markdown export", exc_info=True)
         
         # Fallback
         return f"Figure {self.image_counter + 1}"
     
     def _extract_full_text_sync(self, item) -> str:
-        """Extract all text content from an item recursively (sync version)"""
-        text_parts = []
-        
-        if hasattr(item, 'text') and item.text:
-            text_parts.append(item.text.strip())
-        
-        if hasattr(item, 'children') and item.children:
-            for child in item.children:
-                child_text = self._extract_full_text_sync(child)
-                if child_text:
-                    text_parts.append(child_text)
-        
-        if hasattr(item, 'caption'):
-            if hasattr(item.caption, 'text') and item.caption.text:
-                cap_text = item.caption.text.strip()
-                if cap_text and not cap_text.startswith('#/'):
-                    text_parts.append(cap_text)
-            elif isinstance(item.caption, str) and not item.caption.startswith('#/'):
-                text_parts.append(item.caption.strip())
-        
-        full_text = " ".join(text_parts).strip()
-        full_text = re.sub(r'\s+', ' ', full_text)
-        
-        return full_text
+        """Extract all text content from an item and its children (sync version)"""
+        return _extract_full_text_iter(item)
     
     async def close(self):
-        """Cleanup method to shutdown executor"""
-        # Only shutdown if we own the executor and haven't already shut it down
-        if self._owns_executor and not self._executor_shutdown:
+        """Cleanup method to shutdown executor (only a dedicated one we created)"""
+        # Only shutdown if we own the executor (shutdown is idempotent); later
+        # submits raise RuntimeError, which serialize_async already handles
+        if self._owns_executor:
             try:
                 self.executor.shutdown(wait=True)
-                self._executor_shutdown = True
             except Exception as e:
-                print(f"Warning: Error during executor shutdown: {e}")
+                logger.warning("Error during executor shutdown: %s", e)
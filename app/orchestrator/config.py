@@ -4,11 +4,11 @@ Orchestrator Configuration
 Defines worker counts, queue sizes, and resource limits for the multi-site crawler.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkerConfig:
     """Configuration for worker pools."""
     
@@ -21,26 +21,29 @@ class WorkerConfig:
     pdf_workers: int = 2  # Increased from 1 (if GPU available, 2-3 can run in parallel)
     ocr_workers: int = 1
     
-    @property
-    def total_workers(self) -> int:
-        """Total number of workers."""
-        return (
+    # Total number of workers (computed once in __post_init__)
+    total_workers: int = field(init=False, compare=False)
+    
+    def __post_init__(self):
+        """Compute derived totals (frozen, so set via object.__setattr__)."""
+        object.__setattr__(self, "total_workers", (
             self.crawler_workers +
             self.processor_workers +
             self.pdf_workers +
             self.ocr_workers +
             self.storage_workers
-        )
+        ))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QueueConfig:
     """Configuration for queue sizes (backpressure control)."""
     
     # Website URL queue
     crawl_queue_size: int = 20  # Increased from 10 (more URLs can be queued)
     
-    # Raw pages waiting for processing (text extraction, chunking)
+    # Raw pages waiting for or in processing (text extraction, chunking);
+    # a credit pool: a page holds a slot until a processor finishes it
     processing_queue_size: int = 100  # Increased from 50 (reduce backpressure)
     
     # PDFs waiting for Docling processing (GPU bottleneck - keep small!)
@@ -52,18 +55,23 @@ class QueueConfig:
     # Processed chunks waiting for storage
     storage_queue_size: int = 200  # Increased from 100 (more buffer for storage)
     
-    @property
-    def total_queue_capacity(self) -> int:
-        """Total capacity across all queues."""
-        return (
+    # Failed tasks waiting for retry/dead-letter handling
+    failure_queue_size: int = 100
+    
+    # Total capacity across all queues (computed once in __post_init__)
+    total_queue_capacity: int = field(init=False, compare=False)
+    
+    def __post_init__(self):
+        """Compute derived totals (frozen, so set via object.__setattr__)."""
+        object.__setattr__(self, "total_queue_capacity", (
             self.crawl_queue_size +
             self.processing_queue_size +
             self.ocr_queue_size +
             self.storage_queue_size
-        )
+        ))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResourceLimits:
     """Resource usage limits."""
     
@@ -81,7 +89,7 @@ class ResourceLimits:
     max_concurrent_requests: int = 5  # Per website
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RecoveryConfig:
     """Configuration for worker recovery system."""
     
@@ -102,7 +110,27 @@ class RecoveryConfig:
     storage_timeout: float = 120.0  # 2 minutes
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class ScalingConfig:
+    """Configuration for adaptive PDF worker scaling."""
+    
+    # Fewest PDF workers to shrink to
+    min_workers: int = 1
+    
+    # Most PDF workers to grow to (each runs Docling on the GPU)
+    max_workers: int = 5
+    
+    # Multiply the PDF worker count by this after PDF timeouts
+    timeout_penalty_factor: float = 0.75
+    
+    # Successful PDFs without a timeout before adding a PDF worker
+    growth_success_interval: int = 20
+    
+    # Minimum seconds between two timeout-driven shrinks
+    timeout_cooldown_s: float = 30.0
+
+
+@dataclass(frozen=True, slots=True)
 class OrchestratorConfig:
     """Complete orchestrator configuration."""
     
@@ -121,8 +149,15 @@ class OrchestratorConfig:
     # Progress tracking
     save_progress_interval_seconds: float = 10.0
     
+    # Adaptive PDF worker count (resized on every recovery health check)
+    dynamic_concurrency: bool = False
+    scaling: ScalingConfig = field(default_factory=ScalingConfig)
+    
+    # Cached summary text (built once in __post_init__)
+    _summary: str = field(init=False, repr=False, compare=False)
+    
     def __post_init__(self):
-        """Validate configuration."""
+        """Validate configuration and build the summary."""
         if self.workers.ocr_workers > 2:
             raise ValueError(
                 "ocr_workers should not exceed 2 to prevent GPU overload. "
@@ -134,10 +169,16 @@ class OrchestratorConfig:
                 "ocr_queue_size should not exceed 20 to prevent memory issues. "
                 f"Got: {self.queues.ocr_queue_size}"
             )
+        
+        object.__setattr__(self, "_summary", self._build_summary())
     
     @property
     def summary(self) -> str:
         """Human-readable configuration summary."""
+        return self._summary
+    
+    def _build_summary(self) -> str:
+        """Format the configuration summary."""
         return f"""
 Orchestrator Configuration:
   Workers: {self.workers.total_workers} total
@@ -164,6 +205,8 @@ Orchestrator Configuration:
     - Check Interval: {self.recovery.check_interval}s
     - Max Retries: {self.recovery.max_task_retries}
     - PDF Timeout: {self.recovery.pdf_timeout}s
+  
+  Dynamic Concurrency: {"Enabled" if self.dynamic_concurrency else "Disabled"}
 """
 
 
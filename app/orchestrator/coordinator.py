@@ -17,9 +17,11 @@ from app.orchestrator.workers import (
     ProcessorWorker,
     OcrWorker,
     StorageWorker,
+    FailureHandlerWorker,
 )
 from app.orchestrator.workers.pdf_processor import PdfProcessorWorker
 from app.orchestrator.workers.recovery import WorkerHealthMonitor, WorkerTimeout
+from app.orchestrator.scaling import AdaptiveScaler
 from app.orchestrator.models.task import CrawlTask, TaskPriority
 from app.orchestrator.monitoring import (
     HealthMonitor,
@@ -102,6 +104,7 @@ class MultiSiteOrchestrator:
         self.pdf_workers: List[PdfProcessorWorker] = []
         self.ocr_workers: List[OcrWorker] = []
         self.storage_workers: List[StorageWorker] = []
+        self.failure_worker: Optional[FailureHandlerWorker] = None
         
         # Worker tasks (for lifecycle management)
         self.worker_tasks: List[asyncio.Task] = []
@@ -124,6 +127,11 @@ class MultiSiteOrchestrator:
         # Worker recovery
         self.worker_recovery: Optional[WorkerHealthMonitor] = None
         
+        # Adaptive PDF worker scaling
+        self.scaler: Optional[AdaptiveScaler] = None
+        self._scaling_task: Optional[asyncio.Task] = None
+        self._pdf_worker_seq = 0
+        
         # Shutdown coordination
         self._shutdown_event: Optional[asyncio.Event] = None
     
@@ -185,6 +193,11 @@ class MultiSiteOrchestrator:
         if self.config.enable_monitoring:
             self._monitoring_task = asyncio.create_task(self._run_monitoring())
         
+        # Start adaptive PDF worker scaling if enabled
+        if self.config.dynamic_concurrency:
+            self.scaler = AdaptiveScaler.from_config(self.config)
+            self._scaling_task = asyncio.create_task(self._run_scaling())
+        
         # Update stats
         self.stats.total_workers = len(self.worker_tasks)
         self.stats.active_workers = len(self.worker_tasks)
@@ -233,13 +246,8 @@ class MultiSiteOrchestrator:
         logger.info(f"  ✓ {len(self.processor_workers)} processor workers")
         
         # Spawn PDF processor workers (GPU - Docling)
-        for i in range(self.config.workers.pdf_workers):
-            worker = PdfProcessorWorker(f"pdf-{i+1}", self.queue_manager)
-            await worker.startup()
-            self.pdf_workers.append(worker)
-            
-            task = asyncio.create_task(worker.run())
-            self.worker_tasks.append(task)
+        for _ in range(self.config.workers.pdf_workers):
+            await self._spawn_pdf_worker()
         
         logger.info(f"  ✓ {len(self.pdf_workers)} PDF processor workers (GPU - Docling)")
         
@@ -271,6 +279,60 @@ class MultiSiteOrchestrator:
             self.worker_tasks.append(task)
         
         logger.info(f"  ✓ {len(self.storage_workers)} storage workers")
+        
+        # Spawn failure handler (retries/dead-letters failed tasks off the hot path)
+        self.failure_worker = FailureHandlerWorker("failure-1", self.queue_manager)
+        await self.failure_worker.startup()
+        task = asyncio.create_task(self.failure_worker.run())
+        self.worker_tasks.append(task)
+        
+        logger.info("  ✓ 1 failure handler worker")
+    
+    async def _spawn_pdf_worker(self):
+        """Start one more PDF processor worker."""
+        self._pdf_worker_seq += 1
+        worker = PdfProcessorWorker(f"pdf-{self._pdf_worker_seq}", self.queue_manager)
+        await worker.startup()
+        self.pdf_workers.append(worker)
+        
+        task = asyncio.create_task(worker.run())
+        self.worker_tasks.append(task)
+    
+    async def _resize_pdf_workers(self, target: int):
+        """
+        Start or stop PDF workers to reach target.
+        
+        Only idle workers are stopped; if all are busy the pool shrinks on
+        a later check instead.
+        """
+        while len(self.pdf_workers) < target:
+            await self._spawn_pdf_worker()
+            logger.info(f"Scaled PDF workers up to {len(self.pdf_workers)}")
+        
+        excess = len(self.pdf_workers) - target
+        for worker in [w for w in self.pdf_workers if not w.is_busy][:max(0, excess)]:
+            self.pdf_workers.remove(worker)
+            await worker.stop()
+            logger.info(f"Scaled PDF workers down to {len(self.pdf_workers)} (stopped {worker.worker_id})")
+    
+    async def _run_scaling(self):
+        """Background task feeding PDF worker outcomes to the adaptive scaler."""
+        try:
+            while not self._shutdown_event.is_set():
+                await asyncio.sleep(self.config.recovery.check_interval)
+                
+                try:
+                    target = self.scaler.tick(
+                        successes_total=sum(w.pdfs_processed for w in self.pdf_workers),
+                        timeouts_total=sum(w.pdf_timeouts for w in self.pdf_workers),
+                    )
+                    await self._resize_pdf_workers(target)
+                except Exception as e:
+                    # Keep scaling on the next check
+                    logger.error(f"Scaling error: {e}", exc_info=True)
+        
+        except asyncio.CancelledError:
+            logger.debug("Scaling task cancelled")
     
     async def crawl_websites(
         self,
@@ -400,28 +462,32 @@ class MultiSiteOrchestrator:
         processing_size = self.queue_manager.processing_queue.qsize()
         ocr_size = self.queue_manager.ocr_queue.qsize()
         storage_size = self.queue_manager.storage_queue.qsize()
+        failure_size = self.queue_manager.failure_queue.qsize()
         
         all_empty = (
             crawl_size == 0 and
             processing_size == 0 and
             ocr_size == 0 and
-            storage_size == 0
+            storage_size == 0 and
+            failure_size == 0
         )
         
         if not all_empty:
             logger.debug(
                 f"Queues not empty: crawl={crawl_size}, processing={processing_size}, "
-                f"ocr={ocr_size}, storage={storage_size}"
+                f"ocr={ocr_size}, storage={storage_size}, failure={failure_size}"
             )
             return False
         
-        # Check if all workers are idle (no active tasks)
+        # Check if all workers are idle (no active tasks), including a
+        # failure handler that may be about to requeue a task
         all_workers = (
             self.crawler_workers +
             self.processor_workers +
             self.pdf_workers +
             self.ocr_workers +
-            self.storage_workers
+            self.storage_workers +
+            ([self.failure_worker] if self.failure_worker else [])
         )
         
         # Count busy workers for debugging
@@ -627,13 +693,14 @@ class MultiSiteOrchestrator:
             if recovery_stats.total_recoveries > 0:
                 logger.info(f"Recovery stats: {recovery_stats}")
         
-        # Cancel monitoring task
-        if self._monitoring_task and not self._monitoring_task.done():
-            self._monitoring_task.cancel()
-            try:
-                await self._monitoring_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel monitoring and scaling tasks
+        for background_task in (self._monitoring_task, self._scaling_task):
+            if background_task and not background_task.done():
+                background_task.cancel()
+                try:
+                    await background_task
+                except asyncio.CancelledError:
+                    pass
         
         # Shutdown all workers
         logger.info("Shutting down workers...")
@@ -642,7 +709,8 @@ class MultiSiteOrchestrator:
             self.processor_workers +
             self.pdf_workers +
             self.ocr_workers +
-            self.storage_workers
+            self.storage_workers +
+            ([self.failure_worker] if self.failure_worker else [])
         )
         
         for worker in all_workers:
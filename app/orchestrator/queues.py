@@ -5,7 +5,7 @@ Manages asyncio queues with backpressure control, monitoring, and graceful shutd
 """
 
 import asyncio
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set, Callable, Awaitable
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -47,6 +47,15 @@ class QueueMetrics:
         return self.current_size == 0
 
 
+@dataclass
+class FailureEvent:
+    """A failed task handed to the failure handler worker."""
+    task: Any
+    error: str
+    # Coroutine function that puts the task back on its queue for a retry
+    requeue: Callable[[Any], Awaitable[None]]
+
+
 class QueueManager:
     """
     Manages all orchestrator queues with monitoring and backpressure.
@@ -81,11 +90,23 @@ class QueueManager:
         # Dead letter queue for failed tasks
         self.dead_letter_queue: Optional[asyncio.Queue] = None
         
+        # Failed tasks waiting for retry/dead-letter handling
+        self.failure_queue: Optional[asyncio.Queue] = None
+        
         # Metrics tracking
         self.metrics: Dict[str, QueueMetrics] = {}
         self._start_time: Optional[datetime] = None
         self._shutdown_event: Optional[asyncio.Event] = None
         
+        # Processing credits: a page holds one from enqueue until a
+        # processor finishes it, so producers wait on downstream capacity
+        self._proc_credits = 0
+        self._proc_credit_cond: Optional[asyncio.Condition] = None
+        
+        # Page task ids queued per crawl task, so a retried crawl does not
+        # queue (and process) pages an earlier attempt already queued
+        self._queued_pages: Dict[str, Set[str]] = {}
+        
         # Task tracking (for monitoring)
         self._active_tasks: Dict[str, Any] = {}
     
@@ -103,6 +124,9 @@ class QueueManager:
         # Unlimited dead letter queue
         self.dead_letter_queue = asyncio.Queue()
         
+        # Bounded; when full, reporters handle the failure inline instead
+        self.failure_queue = asyncio.Queue(maxsize=self.config.failure_queue_size)
+        
         # Initialize metrics
         self.metrics = {
             "crawl": QueueMetrics("crawl", max_size=self.config.crawl_queue_size),
@@ -116,6 +140,9 @@ class QueueManager:
         self._start_time = datetime.utcnow()
         self._shutdown_event = asyncio.Event()
         
+        self._proc_credits = self.config.processing_queue_size
+        self._proc_credit_cond = asyncio.Condition()
+        
         logger.info(f"✓ Queues initialized (capacity: {self.config.total_queue_capacity})")
     
     async def shutdown(self, timeout: float = 30.0):
@@ -146,6 +173,7 @@ class QueueManager:
         """Wait for all main queues to become empty."""
         while True:
             if (self.crawl_queue.empty() and
+                self.failure_queue.empty() and
                 self.processing_queue.empty() and
                 self.ocr_queue.empty() and
                 self.storage_queue.empty()):
@@ -178,7 +206,13 @@ class QueueManager:
     # ==================== Processing Queue ====================
     
     async def put_process_task(self, task: ProcessTask, timeout: Optional[float] = None):
-        """Add process task to queue."""
+        """
+        Requeue a process task for retry.
+        
+        Takes a processing credit without waiting: the task's current
+        attempt still holds one, released when that attempt finishes.
+        """
+        self._proc_credits -= 1
         await self._put_with_metrics(
             self.processing_queue,
             "processing",
@@ -194,6 +228,85 @@ class QueueManager:
             timeout
         )
     
+    async def put_process_tasks(self, tasks: List[ProcessTask], timeout: Optional[float] = None):
+        """
+        Add several process tasks to queue in one call.
+        
+        Waits once per chunk of up to processing_queue_size tasks until
+        that many processing credits are free (backpressure), then
+        enqueues the whole chunk.
+        """
+        chunk_size = max(1, self.config.processing_queue_size)
+        for start in range(0, len(tasks), chunk_size):
+            chunk = tasks[start:start + chunk_size]
+            if timeout:
+                await asyncio.wait_for(self.reserve_process_slots(len(chunk)), timeout=timeout)
+            else:
+                await self.reserve_process_slots(len(chunk))
+            await self._put_many_with_metrics(
+                self.processing_queue,
+                "processing",
+                chunk,
+                None
+            )
+    
+    async def put_crawled_pages(self, crawl_task_id: str, tasks: List[ProcessTask]) -> int:
+        """
+        Queue pages crawled for a crawl task, skipping any already queued.
+        
+        Returns:
+            Number of tasks actually queued
+        """
+        queued = self._queued_pages.setdefault(crawl_task_id, set())
+        new_tasks = [t for t in tasks if t.task_id not in queued]
+        if new_tasks:
+            await self.put_process_tasks(new_tasks)
+            queued.update(t.task_id for t in new_tasks)
+        return len(new_tasks)
+    
+    def forget_crawled_pages(self, crawl_task_id: str):
+        """Drop the queued-page record of a crawl task that will not run again."""
+        self._queued_pages.pop(crawl_task_id, None)
+    
+    async def requeue_process_tasks(self, tasks: List[ProcessTask]):
+        """Return dequeued, unprocessed tasks to queue (they keep their credits)."""
+        await self._put_many_with_metrics(
+            self.processing_queue,
+            "processing",
+            tasks,
+            None
+        )
+    
+    async def reserve_process_slots(self, count: int):
+        """Wait until count processing credits are free, then take them."""
+        async with self._proc_credit_cond:
+            await self._proc_credit_cond.wait_for(lambda: self._proc_credits >= count)
+            self._proc_credits -= count
+    
+    async def release_process_slots(self, count: int = 1):
+        """Return processing credits once tasks are finished."""
+        async with self._proc_credit_cond:
+            self._proc_credits += count
+            self._proc_credit_cond.notify_all()
+    
+    async def get_process_task_batch(
+        self,
+        max_items: int = 32,
+        timeout: Optional[float] = None
+    ) -> List[ProcessTask]:
+        """
+        Get up to max_items process tasks from queue.
+        
+        Waits for the first task, then takes whatever else is already queued.
+        Returns an empty list on timeout.
+        """
+        return await self._get_many_with_metrics(
+            self.processing_queue,
+            "processing",
+            max_items,
+            timeout
+        )
+    
     # ==================== PDF Queue ====================
     
     async def put_pdf_task(self, task: PdfTask, timeout: Optional[float] = None):
@@ -251,6 +364,51 @@ class QueueManager:
             timeout
         )
     
+    # ==================== Failure Queue ====================
+    
+    def report_failure(self, event: FailureEvent) -> bool:
+        """
+        Hand a failed task to the failure handler without waiting.
+        
+        Returns:
+            False if the failure queue is full; the caller must then
+            handle the failure itself (see handle_failure)
+        """
+        try:
+            self.failure_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning(
+                f"Failure queue full - handling failure of task {event.task.task_id} inline"
+            )
+            return False
+        return True
+    
+    async def handle_failure(self, event: FailureEvent):
+        """Requeue a failed task for retry, or dead-letter it if out of retries."""
+        task = event.task
+        if task.retry_count >= task.max_retries:
+            await self.put_dead_letter(
+                task,
+                f"Max retries exceeded: {event.error}"
+            )
+            return
+        
+        task.mark_failed(event.error)
+        await event.requeue(task)
+        logger.info(
+            f"Requeued task {task.task_id} "
+            f"(retry {task.retry_count}/{task.max_retries})"
+        )
+    
+    async def get_failure(self, timeout: Optional[float] = None) -> Optional[FailureEvent]:
+        """Get next failure event from queue."""
+        try:
+            if timeout:
+                return await asyncio.wait_for(self.failure_queue.get(), timeout=timeout)
+            return await self.failure_queue.get()
+        except asyncio.TimeoutError:
+            return None
+    
     # ==================== Dead Letter Queue ====================
     
     async def put_dead_letter(self, task: Any, error: str):
@@ -306,6 +464,74 @@ class QueueManager:
                 metrics.total_added
             )
     
+    async def _put_many_with_metrics(
+        self,
+        queue: asyncio.Queue,
+        queue_name: str,
+        tasks: List[Any],
+        timeout: Optional[float]
+    ):
+        """Put items in queue with one metrics update, awaiting only when full."""
+        if not tasks:
+            return
+        start_time = datetime.utcnow()
+        
+        async def put_all():
+            for task in tasks:
+                try:
+                    queue.put_nowait(task)
+                except asyncio.QueueFull:
+                    await queue.put(task)
+        
+        if timeout:
+            await asyncio.wait_for(put_all(), timeout=timeout)
+        else:
+            await put_all()
+        
+        # Update metrics (every item counted with the batch's wait time)
+        metrics = self.metrics.get(queue_name)
+        if metrics:
+            previous = metrics.total_added
+            metrics.total_added += len(tasks)
+            metrics.current_size = queue.qsize()
+            
+            wait_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            metrics.avg_wait_time_ms = (
+                (metrics.avg_wait_time_ms * previous + wait_time * len(tasks)) /
+                metrics.total_added
+            )
+    
+    async def _get_many_with_metrics(
+        self,
+        queue: asyncio.Queue,
+        queue_name: str,
+        max_items: int,
+        timeout: Optional[float]
+    ) -> List[Any]:
+        """Get up to max_items from queue with one metrics update."""
+        try:
+            if timeout:
+                first = await asyncio.wait_for(queue.get(), timeout=timeout)
+            else:
+                first = await queue.get()
+        except asyncio.TimeoutError:
+            return []
+        
+        tasks = [first]
+        while len(tasks) < max_items:
+            try:
+                tasks.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        
+        # Update metrics
+        metrics = self.metrics.get(queue_name)
+        if metrics:
+            metrics.total_removed += len(tasks)
+            metrics.current_size = queue.qsize()
+        
+        return tasks
+    
     async def _get_with_metrics(
         self,
         queue: asyncio.Queue,
@@ -0,0 +1,121 @@
+"""
+Adaptive Worker Scaling
+
+Adjusts the number of PDF workers to observed downstream capacity: shrinks
+on PDF processing timeouts and grows back after a run of successes.
+"""
+
+import time
+from typing import Optional
+
+from app.config import get_logger
+from app.orchestrator.config import OrchestratorConfig
+
+logger = get_logger(__name__)
+
+
+class AdaptiveScaler:
+    """
+    Multiplicative-decrease / additive-increase controller for PDF workers.
+    
+    Fed cumulative success and timeout counts on every health check, it
+    returns the PDF worker count to run:
+    - Any new timeout: target *= timeout_penalty_factor (at most once
+      per timeout_cooldown_s), and the success streak restarts
+    - Every growth_success_interval successes without a timeout: target += 1
+    
+    The target always stays within [min_workers, max_workers].
+    
+    Usage:
+        scaler = AdaptiveScaler.from_config(config)
+        target = scaler.tick(successes_total, timeouts_total)
+    """
+    
+    def __init__(
+        self,
+        initial_workers: int,
+        min_workers: int = 1,
+        max_workers: int = 5,
+        timeout_penalty_factor: float = 0.75,
+        growth_success_interval: int = 20,
+        timeout_cooldown_s: float = 30.0,
+    ):
+        self.min_workers = max(0, min_workers)
+        self.max_workers = max(self.min_workers, max_workers)
+        self.timeout_penalty_factor = timeout_penalty_factor
+        self.growth_success_interval = max(1, growth_success_interval)
+        self.timeout_cooldown_s = timeout_cooldown_s
+        
+        self.target = min(max(initial_workers, self.min_workers), self.max_workers)
+        
+        # Successes since the last timeout or growth step
+        self._success_streak = 0
+        # Last cumulative counts seen, to turn totals into deltas
+        self._last_successes = 0
+        self._last_timeouts = 0
+        self._last_shrink: Optional[float] = None
+    
+    @classmethod
+    def from_config(cls, config: OrchestratorConfig) -> "AdaptiveScaler":
+        """Create a scaler for the PDF worker pool of an orchestrator config."""
+        return cls(
+            initial_workers=config.workers.pdf_workers,
+            min_workers=config.scaling.min_workers,
+            max_workers=config.scaling.max_workers,
+            timeout_penalty_factor=config.scaling.timeout_penalty_factor,
+            growth_success_interval=config.scaling.growth_success_interval,
+            timeout_cooldown_s=config.scaling.timeout_cooldown_s,
+        )
+    
+    def tick(
+        self,
+        successes_total: int,
+        timeouts_total: int,
+        now: Optional[float] = None,
+    ) -> int:
+        """
+        Update the target from cumulative counters.
+        
+        Totals may drop when workers are replaced; that is treated as a
+        counter reset rather than negative progress.
+        
+        Args:
+            successes_total: PDFs processed so far across current workers
+            timeouts_total: PDF timeouts so far across current workers
+            now: Monotonic time (defaults to time.monotonic())
+        
+        Returns:
+            Number of PDF workers to run
+        """
+        if now is None:
+            now = time.monotonic()
+        
+        successes = max(0, successes_total - self._last_successes)
+        timeouts = max(0, timeouts_total - self._last_timeouts)
+        self._last_successes = successes_total
+        self._last_timeouts = timeouts_total
+        
+        if timeouts:
+            self._success_streak = 0
+            if self._last_shrink is None or now - self._last_shrink >= self.timeout_cooldown_s:
+                self._last_shrink = now
+                shrunk = max(self.min_workers, int(self.target * self.timeout_penalty_factor))
+                if shrunk < self.target:
+                    logger.info(
+                        f"Adaptive scaling: {timeouts} PDF timeouts, "
+                        f"PDF workers {self.target} -> {shrunk}"
+                    )
+                    self.target = shrunk
+            return self.target
+        
+        self._success_streak += successes
+        if self._success_streak >= self.growth_success_interval:
+            self._success_streak = 0
+            if self.target < self.max_workers:
+                logger.info(
+                    f"Adaptive scaling: stable processing, "
+                    f"PDF workers {self.target} -> {self.target + 1}"
+                )
+                self.target += 1
+        
+        return self.target
@@ -7,6 +7,7 @@ from app.orchestrator.workers.crawler import CrawlerWorker
 from app.orchestrator.workers.processor import ProcessorWorker
 from app.orchestrator.workers.ocr import OcrWorker
 from app.orchestrator.workers.storage import StorageWorker
+from app.orchestrator.workers.failure import FailureHandlerWorker
 from app.orchestrator.workers.recovery import WorkerHealthMonitor, WorkerTimeout
 
 __all__ = [
@@ -15,6 +16,7 @@ __all__ = [
     "ProcessorWorker",
     "OcrWorker",
     "StorageWorker",
+    "FailureHandlerWorker",
     "WorkerHealthMonitor",
     "WorkerTimeout",
 ]
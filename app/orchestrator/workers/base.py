@@ -93,6 +93,15 @@ class BaseWorker(ABC):
         """
         pass
     
+    async def task_finished(self, task):
+        """
+        Called after each task, whether it succeeded or failed.
+        
+        Args:
+            task: Task object that was processed
+        """
+        pass
+    
     async def startup(self):
         """Initialize worker resources."""
         logger.info(f"[{self.worker_id}] Starting {self.worker_type} worker")
@@ -151,6 +160,7 @@ class BaseWorker(ABC):
                         else:
                             self.tasks_failed += 1
                     finally:
+                        await self.task_finished(task)
                         # Mark as idle after processing
                         self._is_busy = False
                         self.current_task = None
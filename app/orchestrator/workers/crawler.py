@@ -4,13 +4,14 @@ Crawler Worker
 Crawls websites and pushes discovered pages to the processing queue.
 """
 
+import contextlib
 import uuid
 from typing import Optional
 from datetime import datetime
 
 from app.config import get_logger
 from app.orchestrator.workers.base import BaseWorker
-from app.orchestrator.queues import QueueManager
+from app.orchestrator.queues import QueueManager, FailureEvent
 from app.orchestrator.models.task import CrawlTask, ProcessTask, TaskPriority
 from app.crawling.stages.crawler import CrawlerStage
 from app.crawling.models.document import Document
@@ -18,6 +19,9 @@ from app.crawling.models.config import PipelineConfig
 
 logger = get_logger(__name__)
 
+# Pages collected before handing them to the processing queue
+ENQUEUE_BATCH_SIZE = 32
+
 
 class CrawlerWorker(BaseWorker):
     """
@@ -84,6 +88,8 @@ class CrawlerWorker(BaseWorker):
             f"(max_pages={task.max_pages}, max_depth={task.max_depth})"
         )
         
+        # Crawled pages not yet handed to the processing queue
+        batch = []
         try:
             # Create document for crawling
             document = Document(
@@ -93,40 +99,44 @@ class CrawlerWorker(BaseWorker):
                 max_pages=task.max_pages,
             )
             
-            # Run crawler (this will discover and download pages)
-            document = await self.crawler_stage.process(document)
+            # Run crawler, queueing pages for processing as they are downloaded
+            task.pages_discovered = 0
+            task.pages_crawled = 0
+            pages_queued = 0
+            async with contextlib.aclosing(self.crawler_stage.stream(document)) as pages:
+                async for page in pages:
+                    # Update task progress
+                    task.pages_discovered += 1
+                    
+                    # Only queue pages with content
+                    if page.html_content or page.pdf_path or page.dom_text:
+                        task.pages_crawled += 1
+                        batch.append(ProcessTask(
+                            task_id=f"{task.task_id}_page_{page.url_hash}",
+                            page=page,
+                            website_url=task.website_url,
+                            crawl_session_id=task.crawl_session_id,
+                            priority=task.priority,
+                        ))
+                        if len(batch) >= ENQUEUE_BATCH_SIZE:
+                            pages_queued += await self.queue_manager.put_crawled_pages(task.task_id, batch)
+                            batch = []
             
-            # Update task progress
-            task.pages_discovered = len(document.pages)
-            task.pages_crawled = len([p for p in document.pages if p.html_content or p.pdf_path])
+            if batch:
+                pages_queued += await self.queue_manager.put_crawled_pages(task.task_id, batch)
+                batch = []
             
             logger.info(
                 f"[{self.worker_id}] Crawled {task.pages_crawled}/{task.pages_discovered} pages "
                 f"from {task.website_url}"
             )
-            
-            # Push each page to processing queue
-            pages_queued = 0
-            for page in document.pages:
-                # Only queue pages with content
-                if page.html_content or page.pdf_path or page.dom_text:
-                    process_task = ProcessTask(
-                        task_id=f"{task.task_id}_page_{page.url_hash}",
-                        page=page,
-                        website_url=task.website_url,
-                        crawl_session_id=task.crawl_session_id,
-                        priority=task.priority,
-                    )
-                    
-                    await self.queue_manager.put_process_task(process_task)
-                    pages_queued += 1
-            
             logger.info(
                 f"[{self.worker_id}] Queued {pages_queued} pages for processing"
             )
             
             # Mark task complete
             task.mark_completed()
+            self.queue_manager.forget_crawled_pages(task.task_id)
             return True
             
         except Exception as e:
@@ -135,16 +145,27 @@ class CrawlerWorker(BaseWorker):
                 exc_info=True
             )
             
-            # Move to dead letter queue if max retries exceeded
+            # Queue pages crawled before the failure; a retry skips them
+            if batch:
+                try:
+                    await self.queue_manager.put_crawled_pages(task.task_id, batch)
+                except Exception as flush_error:
+                    logger.error(
+                        f"[{self.worker_id}] Failed to queue {len(batch)} crawled pages "
+                        f"from {task.website_url}: {flush_error}"
+                    )
             if task.retry_count >= task.max_retries:
-                await self.queue_manager.put_dead_letter(
-                    task,
-                    f"Max retries exceeded: {e}"
-                )
-            else:
-                # Requeue for retry
-                task.mark_failed(str(e))
-                await self.queue_manager.put_crawl_task(task)
-                logger.info(f"[{self.worker_id}] Requeued task (retry {task.retry_count}/{task.max_retries})")
+                # Will be dead-lettered, not retried
+                self.queue_manager.forget_crawled_pages(task.task_id)
+            
+            # Retry or dead-letter in the background; keep crawling meanwhile
+            event = FailureEvent(
+                task=task,
+                error=str(e),
+                requeue=self.queue_manager.put_crawl_task,
+            )
+            if not self.queue_manager.report_failure(event):
+                # Failure handler is backed up; never drop the task
+                await self.queue_manager.handle_failure(event)
             
             return False
@@ -0,0 +1,62 @@
+"""
+Failure Handler Worker
+
+Takes failed tasks off the failure queue and either requeues them for
+retry or moves them to the dead letter queue, so the workers that hit
+the failure never wait on that bookkeeping.
+"""
+
+from typing import Optional
+
+from app.config import get_logger
+from app.orchestrator.workers.base import BaseWorker
+from app.orchestrator.queues import QueueManager, FailureEvent
+
+logger = get_logger(__name__)
+
+
+class FailureHandlerWorker(BaseWorker):
+    """
+    Failure handler worker - retries or dead-letters failed tasks.
+    
+    Responsibilities:
+    - Pull FailureEvent from failure_queue
+    - Dead-letter the task if it is out of retries
+    - Otherwise mark it failed and requeue it via the event's requeue
+    """
+    
+    def __init__(
+        self,
+        worker_id: str,
+        queue_manager: QueueManager,
+    ):
+        super().__init__(worker_id, queue_manager)
+    
+    @property
+    def worker_type(self) -> str:
+        return "failure"
+    
+    async def get_next_task(self) -> Optional[FailureEvent]:
+        """Get next failure event from queue."""
+        return await self.queue_manager.get_failure(timeout=1.0)
+    
+    async def process_task(self, event: FailureEvent) -> bool:
+        """
+        Retry or dead-letter a failed task.
+        
+        Args:
+            event: FailureEvent with the failed task and its error
+        
+        Returns:
+            True if the failure was handled
+        """
+        try:
+            await self.queue_manager.handle_failure(event)
+            return True
+        
+        except Exception as e:
+            logger.error(
+                f"[{self.worker_id}] Failed to handle failure of task {event.task.task_id}: {e}",
+                exc_info=True
+            )
+            return False
@@ -13,11 +13,14 @@ from typing import Optional
 from PIL import Image
 
 from app.crawling.models.document import Page, PageContent, OCRAction, ContentSource
-from app.services.gpu_manager import get_surya_predictors
+from app.services.gpu_manager import get_surya_predictors, run_ocr_model
 from app.config import get_logger, OCR_MAX_BBOXES_PER_PAGE
 
 logger = get_logger(__name__)
 
+# Grayscale -> black/white lookup table (threshold 200)
+_BINARIZE_LUT = [255 if p > 200 else 0 for p in range(256)]
+
 
 async def process_page_ocr(
     page: Page,
@@ -75,9 +78,9 @@ async def _run_full_page_ocr(pdf_path: Path) -> str:
         for page_num in range(len(doc)):
             page = doc[page_num]
             # Lower DPI from 150 to 96 for speed/noise reduction
-            pix = page.get_pixmap(dpi=96)
-            img_data = pix.tobytes("png")
-            img = Image.open(io.BytesIO(img_data))
+            pix = page.get_pixmap(dpi=96, alpha=False)
+            # Wrap the raw RGB samples; no PNG encode/decode round-trip
+            img = Image.frombuffer("RGB", (pix.width, pix.height), pix.samples, "raw", "RGB", pix.stride, 1)
             images.append(img)
         
         doc.close()
@@ -89,7 +92,7 @@ async def _run_full_page_ocr(pdf_path: Path) -> str:
             # Convert to grayscale
             img = img.convert('L') 
             # Binarize - threshold 200 to reduce noise
-            img = img.point(lambda p: 255 if p > 200 else 0)
+            img = img.point(_BINARIZE_LUT)
             processed_images.append(img.convert('RGB'))
         
         # Run Detection first
@@ -99,6 +102,7 @@ async def _run_full_page_ocr(pdf_path: Path) -> str:
         loop = asyncio.get_event_loop()
         det_predictions = await loop.run_in_executor(
             None,
+            run_ocr_model,
             det_predictor,
             processed_images
         )
@@ -160,7 +164,7 @@ async def _run_full_page_ocr(pdf_path: Path) -> str:
         logger.debug("Running recognition pass...")
         rec_predictions = await loop.run_in_executor(
             None,
-            lambda: rec_predictor(final_images_to_recognize, polygons=polygons_to_recognize)
+            lambda: run_ocr_model(rec_predictor, final_images_to_recognize, polygons=polygons_to_recognize)
         )
         
         # Extract text from predictions
@@ -238,7 +242,7 @@ async def _run_images_only_ocr(pdf_path: Path) -> str:
         
         # Run detection and recognition
         loop = asyncio.get_event_loop()
-        det_predictions = await loop.run_in_executor(None, det_predictor, images)
+        det_predictions = await loop.run_in_executor(None, run_ocr_model, det_predictor, images)
         
         # Prepare polygons
         polygons = []
@@ -254,7 +258,7 @@ async def _run_images_only_ocr(pdf_path: Path) -> str:
         
         rec_predictions = await loop.run_in_executor(
             None,
-            lambda: rec_predictor(images, polygons=polygons)
+            lambda: run_ocr_model(rec_predictor, images, polygons=polygons)
         )
         
         # Extract text
@@ -4,12 +4,15 @@ Text processing helpers for page-level operations.
 Extracted from pipeline stages to work on individual pages in the worker system.
 """
 
-import re
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Sequence, Tuple, List, Dict, Any
 
 from app.crawling.models.document import (
     Page, PageContent, ContentSource, OCRAction, ImageInfo
 )
+from app.crawling.stages.chunker import split_into_sentences
+from app.crawling.stages.text_extractor import (
+    STRIPPED_TAGS, build_image_infos, clean_dom_text
+)
 from app.config import get_logger
 
 logger = get_logger(__name__)
@@ -33,27 +36,18 @@ def extract_page_text(page: Page, min_chars: int = 100, min_words: int = 20) ->
     """
     # Try DOM text first (fastest)
     if page.dom_text:
-        cleaned = _clean_dom_text(page.dom_text)
+        cleaned = clean_dom_text(page.dom_text)
         content = PageContent.from_text(cleaned, ContentSource.DOM)
         
         # Add images if available
         if page.scraped_images:
-            content.images = [
-                ImageInfo(
-                    width=img.get("width", 0),
-                    height=img.get("height", 0),
-                    aspect_ratio=img.get("width", 0) / img.get("height", 1) if img.get("height", 0) > 0 else 0,
-                    image_type="unknown",
-                    area=img.get("width", 0) * img.get("height", 0)
-                )
-                for img in page.scraped_images
-            ]
+            content.images = build_image_infos(page.scraped_images)
         return content
     
     # Try HTML content
     if page.html_content:
         text = _extract_from_html(page.html_content)
-        cleaned = _clean_dom_text(text)
+        cleaned = clean_dom_text(text)
         return PageContent.from_text(cleaned, ContentSource.DOM)
     
     # No text available
@@ -65,58 +59,24 @@ def extract_page_text(page: Page, min_chars: int = 100, min_words: int = 20) ->
     )
 
 
-def _clean_dom_text(raw_text: str) -> str:
-    """
-    Clean extracted DOM text.
-    
-    Removes:
-    - Excessive whitespace
-    - Navigation noise
-    - Cookie banners
-    """
-    if not raw_text:
-        return ""
-    
-    # Normalize whitespace
-    text = re.sub(r"\s+", " ", raw_text)
-    
-    # Remove common noise patterns
-    noise_patterns = [
-        r"Accept\s+cookies?",
-        r"Cookie\s+policy",
-        r"Privacy\s+policy",
-        r"Terms\s+of\s+service",
-        r"Skip\s+to\s+content",
-        r"Toggle\s+navigation",
-        r"Loading\.\.\.",
-    ]
-    
-    for pattern in noise_patterns:
-        text = re.sub(pattern, "", text, flags=re.IGNORECASE)
-    
-    # Remove very short lines (likely buttons/links)
-    lines = text.split("\n")
-    cleaned_lines = [
-        line.strip() for line in lines
-        if len(line.strip()) > 20 or "." in line
-    ]
-    
-    return "\n".join(cleaned_lines).strip()
-
-
 def _extract_from_html(html: str) -> str:
-    """Extract text from HTML using BeautifulSoup."""
+    """Extract text from HTML using selectolax (Lexbor C parser)."""
+    # No markup or entities: nothing for the parser to do
+    if not html or ("<" not in html and "&" not in html):
+        return (html or "").strip()
+    
     try:
-        from bs4 import BeautifulSoup
+        from selectolax.lexbor import LexborHTMLParser
         
-        soup = BeautifulSoup(html, "html.parser")
+        tree = LexborHTMLParser(html)
         
-        # Remove script and style elements
-        for element in soup(["script", "style", "nav", "footer", "header"]):
-            element.decompose()
+        # Remove script and style elements (with their contents)
+        tree.strip_tags(STRIPPED_TAGS)
         
         # Get text
-        text = soup.get_text(separator="\n", strip=True)
+        if tree.root is None:
+            return ""
+        text = tree.root.text(separator="\n", strip=True)
         return text
         
     except Exception as e:
@@ -144,10 +104,10 @@ def decide_ocr_for_page(
         return OCRAction.FULL_PAGE_OCR, "No content extracted"
     
     word_count = content.word_count
-    text_bearing_images = len([
-        img for img in content.images
+    text_bearing_images = sum(
+        1 for img in content.images
         if _is_text_bearing(img, min_text_bearing_images)
-    ])
+    )
     total_images = len(content.images)
     
     # Calculate ratios
@@ -241,10 +201,12 @@ def chunk_page_text(
         return []
     
     text = page.content.text
+    page_url = page.url
+    source = page.content.source.value
     doc_id = _get_doc_id_from_page(page)
     
     # Split into sentences
-    sentences = _split_into_sentences(text)
+    sentences = split_into_sentences(text)
     
     # Group into semantic chunks with overlap
     chunk_texts = _group_sentences(sentences, min_words, max_words, overlap_words)
@@ -258,44 +220,29 @@ def chunk_page_text(
         # Filter non-English chunks if enabled
         if filter_language and not _is_english(chunk_text):
             filtered_count += 1
-            logger.debug(f"Filtered non-English chunk from {page.url}")
+            logger.debug(f"Filtered non-English chunk from {page_url}")
             continue
         
         chunk = {
             "id": chunk_id,
             "text": chunk_text.strip(),
             "doc_id": doc_id,
-            "url": page.url,
+            "url": page_url,
             "chunk_index": len(chunks),  # Use actual index after filtering
             "word_count": len(chunk_text.split()),
             "char_count": len(chunk_text),
-            "source": page.content.source.value,
+            "source": source,
         }
         chunks.append(chunk)
     
     if filtered_count > 0:
-        logger.info(f"Filtered {filtered_count} non-English chunks from {page.url}, kept {len(chunks)} English chunks")
+        logger.info(f"Filtered {filtered_count} non-English chunks from {page_url}, kept {len(chunks)} English chunks")
     
     return chunks
 
 
-def _split_into_sentences(text: str) -> List[str]:
-    """Split text into sentences."""
-    # Handle common abbreviations
-    text = re.sub(r'\b(Dr|Mr|Mrs|Ms|Prof|Inc|Ltd|Jr|Sr)\.',
-                  r'\1<PERIOD>', text)
-    
-    # Split on sentence endings
-    sentences = re.split(r'(?<=[.!?])\s+', text)
-    
-    # Restore abbreviations
-    sentences = [s.replace('<PERIOD>', '.') for s in sentences]
-    
-    return [s.strip() for s in sentences if s.strip()]
-
-
 def _group_sentences(
-    sentences: List[str],
+    sentences: Sequence[str],
     min_words: int,
     max_words: int,
     overlap: int,
@@ -303,22 +250,28 @@ def _group_sentences(
     """Group sentences into chunks."""
     chunks = []
     current_chunk = []
+    current_counts = []
     current_words = 0
     
-    for sentence in sentences:
-        sentence_words = len(sentence.split())
-        
+    # Count words once per sentence
+    word_counts = [len(s.split()) for s in sentences]
+    
+    for sentence, sentence_words in zip(sentences, word_counts):
         # Check if adding this sentence exceeds max
         if current_words + sentence_words > max_words and current_words >= min_words:
             # Save current chunk
             chunks.append(" ".join(current_chunk))
             
             # Start new chunk with overlap
-            overlap_text = _get_overlap(current_chunk, overlap)
+            overlap_text, overlap_words = _get_overlap(
+                current_chunk, current_counts, overlap
+            )
             current_chunk = [overlap_text] if overlap_text else []
-            current_words = len(overlap_text.split()) if overlap_text else 0
+            current_counts = [overlap_words] if overlap_text else []
+            current_words = overlap_words
         
         current_chunk.append(sentence)
+        current_counts.append(sentence_words)
         current_words += sentence_words
     
     # Don't forget the last chunk
@@ -328,23 +281,24 @@ def _group_sentences(
     return chunks
 
 
-def _get_overlap(sentences: List[str], target_words: int) -> str:
-    """Get overlap text from end of sentences."""
+def _get_overlap(
+    sentences: List[str], word_counts: List[int], target_words: int
+) -> Tuple[str, int]:
+    """Get overlap text and its word count from end of sentences."""
     if not sentences:
-        return ""
+        return "", 0
     
     overlap_sentences = []
     word_count = 0
     
-    for sentence in reversed(sentences):
-        words = len(sentence.split())
+    for sentence, words in zip(reversed(sentences), reversed(word_counts)):
         if word_count + words <= target_words:
             overlap_sentences.insert(0, sentence)
             word_count += words
         else:
             break
     
-    return " ".join(overlap_sentences)
+    return " ".join(overlap_sentences), word_count
 
 
 def _get_doc_id_from_page(page: Page) -> str:
@@ -57,6 +57,7 @@ class PdfProcessorWorker(BaseWorker):
         self.total_processing_time = 0.0
         self.pdfs_processed = 0
         self.pdfs_failed = 0
+        self.pdf_timeouts = 0
     
     @property
     def worker_type(self) -> str:
@@ -168,6 +169,7 @@ class PdfProcessorWorker(BaseWorker):
             
         except asyncio.TimeoutError:
             processing_time = time.time() - start_time
+            self.pdf_timeouts += 1
             logger.warning(
                 f"[{self.worker_id}] PDF processing timeout ({self.timeout_seconds}s) "
                 f"for {page.url} - marking for OCR"
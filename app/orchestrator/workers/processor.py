@@ -6,6 +6,7 @@ CPU-intensive worker.
 """
 
 import json
+from collections import deque
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -23,6 +24,9 @@ from app.crawling.models.document import OCRAction, Page
 
 logger = get_logger(__name__)
 
+# Most process tasks a worker takes from the queue at once
+PROCESS_BATCH_SIZE = 8
+
 
 class ProcessorWorker(BaseWorker):
     """
@@ -50,14 +54,39 @@ class ProcessorWorker(BaseWorker):
         self.max_chunk_words = max_chunk_words
         self.overlap_words = overlap_words
         self.enable_ocr = enable_ocr
+        # Tasks taken from the queue in the last batch, not yet processed
+        self._pending: deque = deque()
     
     @property
     def worker_type(self) -> str:
         return "processor"
     
+    async def shutdown(self):
+        """Return unprocessed batched tasks to the queue, then cleanup."""
+        if self._pending:
+            pending = list(self._pending)
+            self._pending.clear()
+            try:
+                await self.queue_manager.requeue_process_tasks(pending)
+            except Exception as e:
+                logger.error(
+                    f"[{self.worker_id}] Failed to requeue {len(pending)} batched tasks: {e}"
+                )
+        await super().shutdown()
+    
+    async def task_finished(self, task):
+        """Release the task's processing credit."""
+        await self.queue_manager.release_process_slots()
+    
     async def get_next_task(self) -> Optional[ProcessTask]:
-        """Get next process task from queue."""
-        return await self.queue_manager.get_process_task(timeout=1.0)
+        """Get next process task, pulling a batch from the queue when none are left."""
+        if not self._pending:
+            self._pending.extend(
+                await self.queue_manager.get_process_task_batch(
+                    max_items=PROCESS_BATCH_SIZE, timeout=1.0
+                )
+            )
+        return self._pending.popleft() if self._pending else None
     
     async def process_task(self, task: ProcessTask) -> bool:
         """
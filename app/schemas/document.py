@@ -18,6 +18,92 @@ class DocumentStatus(str, Enum):
     STORED = "stored"             # Stored only, no chunking needed (direct PDF downloads)
 
 
+# PdfDocument field -> MongoDB key, with the from_mongo_dict default
+# (callable defaults are called)
+_PDF_DOCUMENT_FIELDS = (
+    ("file_id", "fileId", ""),
+    ("original_file", "originalFile", ""),
+    ("source_url", "sourceUrl", ""),
+    ("file_path", "filePath", ""),
+    ("status", "status", DocumentStatus.PENDING),
+    ("vector_count", "vectorCount", 0),
+    ("file_size", "fileSize", 0),
+    ("page_count", "pageCount", 0),
+    ("mime_type", "mimeType", "application/pdf"),
+    ("crawl_session_id", "crawlSessionId", ""),
+    ("crawl_depth", "crawlDepth", 0),
+    ("is_deleted", "isDeleted", False),
+    ("is_crawled", "isCrawled", "0"),
+    ("is_vectorized", "isVectorized", "0"),
+    ("is_ocr_required", "isOcrRequired", "0"),
+    ("is_ocr_completed", "isOcrCompleted", "0"),
+    ("total_pages", "totalPages", 0),
+    ("pages_with_text", "pagesWithText", 0),
+    ("pages_needing_ocr", "pagesNeedingOcr", 0),
+    ("created_at", "createdAt", datetime.utcnow),
+    ("updated_at", "updatedAt", datetime.utcnow),
+)
+
+
+# CrawledDocument field -> MongoDB key, with the from_mongo_dict default
+# (callable defaults are called)
+_CRAWLED_DOCUMENT_FIELDS = (
+    ("file_id", "fileId", ""),
+    ("original_file", "originalFile", ""),
+    ("source_url", "sourceUrl", ""),
+    ("file_path", "filePath", ""),
+    ("status", "status", DocumentStatus.PENDING.value),
+    ("vector_count", "vectorCount", 0),
+    ("error_message", "errorMessage", None),
+    ("file_size", "fileSize", 0),
+    ("page_count", "pageCount", 0),
+    ("mime_type", "mimeType", "application/pdf"),
+    ("crawl_session_id", "crawlSessionId", ""),
+    ("crawl_depth", "crawlDepth", 0),
+    ("is_deleted", "isDeleted", False),
+    # Pipeline tracking
+    ("is_crawled", "isCrawled", "0"),
+    ("is_vectorized", "isVectorized", "0"),
+    ("is_ocr_required", "isOcrRequired", "0"),
+    ("is_ocr_completed", "isOcrCompleted", "0"),
+    # Timestamps
+    ("crawl_started_at", "crawlStartedAt", None),
+    ("crawl_completed_at", "crawlCompletedAt", None),
+    ("ocr_started_at", "ocrStartedAt", None),
+    ("ocr_completed_at", "ocrCompletedAt", None),
+    ("vectorization_started_at", "vectorizationStartedAt", None),
+    ("vectorization_completed_at", "vectorizationCompletedAt", None),
+    # Statistics
+    ("total_pages", "totalPages", 0),
+    ("pages_with_text", "pagesWithText", 0),
+    ("pages_needing_ocr", "pagesNeedingOcr", 0),
+    # Worker tracking
+    ("crawled_by_worker", "crawledByWorker", None),
+    ("processed_by_worker", "processedByWorker", None),
+    # Audit
+    ("created_at", "createdAt", datetime.utcnow),
+    ("updated_at", "updatedAt", datetime.utcnow),
+    ("created_by", "createdBy", "crawler"),
+    ("updated_by", "updatedBy", "crawler"),
+)
+
+
+def _to_mongo(model: BaseModel, fields: tuple) -> dict:
+    """Build a camelCase MongoDB dict straight from model attributes."""
+    return {key: getattr(model, name) for name, key, _ in fields}
+
+
+def _from_mongo_kwargs(data: dict, fields: tuple) -> dict:
+    """Constructor kwargs from a MongoDB document, filling in defaults."""
+    kwargs = {}
+    for name, key, default in fields:
+        if key in data:
+            kwargs[name] = data[key]
+        else:
+            kwargs[name] = default() if callable(default) else default
+    return kwargs
+
+
 class PdfDocument(BaseModel):
     """
     Individual PDF document nested within a visited URL.
@@ -63,55 +149,12 @@ class PdfDocument(BaseModel):
     
     def to_mongo_dict(self) -> dict:
         """Convert to MongoDB-compatible dictionary."""
-        data = self.model_dump()
-        data["fileId"] = data.pop("file_id")
-        data["originalFile"] = data.pop("original_file")
-        data["sourceUrl"] = data.pop("source_url")
-        data["filePath"] = data.pop("file_path")
-        data["vectorCount"] = data.pop("vector_count")
-        data["fileSize"] = data.pop("file_size")
-        data["pageCount"] = data.pop("page_count")
-        data["mimeType"] = data.pop("mime_type")
-        data["crawlSessionId"] = data.pop("crawl_session_id")
-        data["crawlDepth"] = data.pop("crawl_depth")
-        data["isDeleted"] = data.pop("is_deleted")
-        data["isCrawled"] = data.pop("is_crawled")
-        data["isVectorized"] = data.pop("is_vectorized")
-        data["isOcrRequired"] = data.pop("is_ocr_required")
-        data["isOcrCompleted"] = data.pop("is_ocr_completed")
-        data["totalPages"] = data.pop("total_pages")
-        data["pagesWithText"] = data.pop("pages_with_text")
-        data["pagesNeedingOcr"] = data.pop("pages_needing_ocr")
-        data["createdAt"] = data.pop("created_at")
-        data["updatedAt"] = data.pop("updated_at")
-        return data
+        return _to_mongo(self, _PDF_DOCUMENT_FIELDS)
     
     @classmethod
     def from_mongo_dict(cls, data: dict) -> "PdfDocument":
         """Create from MongoDB document."""
-        return cls(
-            file_id=data.get("fileId", ""),
-            original_file=data.get("originalFile", ""),
-            source_url=data.get("sourceUrl", ""),
-            file_path=data.get("filePath", ""),
-            status=data.get("status", DocumentStatus.PENDING),
-            vector_count=data.get("vectorCount", 0),
-            file_size=data.get("fileSize", 0),
-            page_count=data.get("pageCount", 0),
-            mime_type=data.get("mimeType", "application/pdf"),
-            crawl_session_id=data.get("crawlSessionId", ""),
-            crawl_depth=data.get("crawlDepth", 0),
-            is_deleted=data.get("isDeleted", False),
-            is_crawled=data.get("isCrawled", "0"),
-            is_vectorized=data.get("isVectorized", "0"),
-            is_ocr_required=data.get("isOcrRequired", "0"),
-            is_ocr_completed=data.get("isOcrCompleted", "0"),
-            total_pages=data.get("totalPages", 0),
-            pages_with_text=data.get("pagesWithText", 0),
-            pages_needing_ocr=data.get("pagesNeedingOcr", 0),
-            created_at=data.get("createdAt", datetime.utcnow()),
-            updated_at=data.get("updatedAt", datetime.utcnow()),
-        )
+        return cls(**_from_mongo_kwargs(data, _PDF_DOCUMENT_FIELDS))
 
 
 class VisitedUrl(BaseModel):
@@ -238,85 +281,14 @@ class CrawledDocument(BaseModel):
     
     def to_mongo_dict(self) -> dict:
         """Convert to MongoDB-compatible dictionary."""
-        data = self.model_dump()
-        # Rename file_id to fileId for MongoDB convention
-        data["fileId"] = data.pop("file_id")
-        data["originalFile"] = data.pop("original_file")
-        data["sourceUrl"] = data.pop("source_url")
-        data["filePath"] = data.pop("file_path")
-        data["vectorCount"] = data.pop("vector_count")
-        data["errorMessage"] = data.pop("error_message")
-        data["fileSize"] = data.pop("file_size")
-        data["pageCount"] = data.pop("page_count")
-        data["mimeType"] = data.pop("mime_type")
-        data["crawlSessionId"] = data.pop("crawl_session_id")
-        data["crawlDepth"] = data.pop("crawl_depth")
-        data["isDeleted"] = data.pop("is_deleted")
-        # Pipeline tracking
-        data["isCrawled"] = data.pop("is_crawled")
-        data["isVectorized"] = data.pop("is_vectorized")
-        data["isOcrRequired"] = data.pop("is_ocr_required")
-        data["isOcrCompleted"] = data.pop("is_ocr_completed")
-        # Timestamps
-        data["crawlStartedAt"] = data.pop("crawl_started_at")
-        data["crawlCompletedAt"] = data.pop("crawl_completed_at")
-        data["ocrStartedAt"] = data.pop("ocr_started_at")
-        data["ocrCompletedAt"] = data.pop("ocr_completed_at")
-        data["vectorizationStartedAt"] = data.pop("vectorization_started_at")
-        data["vectorizationCompletedAt"] = data.pop("vectorization_completed_at")
-        # Statistics
-        data["totalPages"] = data.pop("total_pages")
-        data["pagesWithText"] = data.pop("pages_with_text")
-        data["pagesNeedingOcr"] = data.pop("pages_needing_ocr")
-        # Worker tracking
-        data["crawledByWorker"] = data.pop("crawled_by_worker")
-        data["processedByWorker"] = data.pop("processed_by_worker")
-        # Audit
-        data["createdAt"] = data.pop("created_at")
-        data["updatedAt"] = data.pop("updated_at")
-        data["createdBy"] = data.pop("created_by")
-        data["updatedBy"] = data.pop("updated_by")
-        return data
+        return _to_mongo(self, _CRAWLED_DOCUMENT_FIELDS)
     
     @classmethod
     def from_mongo_dict(cls, data: dict) -> "CrawledDocument":
-        """Create from MongoDB document."""
-        return cls(
-            file_id=data.get("fileId", ""),
-            original_file=data.get("originalFile", ""),
-            source_url=data.get("sourceUrl", ""),
-            file_path=data.get("filePath", ""),
-            status=data.get("status", DocumentStatus.PENDING),
-            vector_count=data.get("vectorCount", 0),
-            error_message=data.get("errorMessage"),
-            file_size=data.get("fileSize", 0),
-            page_count=data.get("pageCount", 0),
-            mime_type=data.get("mimeType", "application/pdf"),
-            crawl_session_id=data.get("crawlSessionId", ""),
-            crawl_depth=data.get("crawlDepth", 0),
-            is_deleted=data.get("isDeleted", False),
-            # Pipeline tracking
-            is_crawled=data.get("isCrawled", "0"),
-            is_vectorized=data.get("isVectorized", "0"),
-            is_ocr_required=data.get("isOcrRequired", "0"),
-            is_ocr_completed=data.get("isOcrCompleted", "0"),
-            # Timestamps
-            crawl_started_at=data.get("crawlStartedAt"),
-            crawl_completed_at=data.get("crawlCompletedAt"),
-            ocr_started_at=data.get("ocrStartedAt"),
-            ocr_completed_at=data.get("ocrCompletedAt"),
-            vectorization_started_at=data.get("vectorizationStartedAt"),
-            vectorization_completed_at=data.get("vectorizationCompletedAt"),
-            # Statistics
-            total_pages=data.get("totalPages", 0),
-            pages_with_text=data.get("pagesWithText", 0),
-            pages_needing_ocr=data.get("pagesNeedingOcr", 0),
-            # Worker tracking
-            crawled_by_worker=data.get("crawledByWorker"),
-            processed_by_worker=data.get("processedByWorker"),
-            # Audit
-            created_at=data.get("createdAt", datetime.utcnow()),
-            updated_at=data.get("updatedAt", datetime.utcnow()),
-            created_by=data.get("createdBy", "crawler"),
-            updated_by=data.get("updatedBy", "crawler"),
-        )
+        """
+        Create from MongoDB document.
+        
+        Stored documents were written from validated models, so they are
+        constructed without re-running validation (bulk reads stay cheap).
+        """
+        return cls.model_construct(**_from_mongo_kwargs(data, _CRAWLED_DOCUMENT_FIELDS))
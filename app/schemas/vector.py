@@ -7,7 +7,7 @@ from typing import List, Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class VectorMetaData:
     """Metadata for vectors stored in Qdrant."""
     file_id: str
@@ -25,7 +25,7 @@ class VectorMetaData:
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentMetadata:
     """Metadata for a document."""
     file_id: str
@@ -5,8 +5,8 @@ Provides CRUD operations for crawled PDF documents.
 """
 
 from datetime import datetime
-from typing import List, Optional
-from pymongo import MongoClient, ASCENDING
+from typing import List, Optional, Tuple
+from pymongo import MongoClient, ASCENDING, UpdateOne
 from pymongo.collection import Collection
 from pymongo.database import Database
 
@@ -44,6 +44,7 @@ class DocumentStore:
         self._database_name = database_name
         self._db: Optional[Database] = None
         self._collection: Optional[Collection] = None
+        self._websites_collection: Optional[Collection] = None
     
     def _get_client(self) -> MongoClient:
         """Get or create MongoDB client with connection pooling."""
@@ -68,14 +69,16 @@ class DocumentStore:
     
     def _get_websites_collection(self) -> Collection:
         """Get the websites collection for nested structure."""
-        client = self._get_client()
-        if self._db is None:
-            self._db = client[self._database_name]
-        websites_collection = self._db["websites"]
-        # Ensure indexes for websites collection
-        websites_collection.create_index([("websiteUrl", ASCENDING), ("crawlSessionId", ASCENDING)], unique=True)
-        websites_collection.create_index([("crawlSessionId", ASCENDING)])
-        return websites_collection
+        if self._websites_collection is None:
+            client = self._get_client()
+            if self._db is None:
+                self._db = client[self._database_name]
+            websites_collection = self._db["websites"]
+            # Ensure indexes for websites collection (once, not per call)
+            websites_collection.create_index([("websiteUrl", ASCENDING), ("crawlSessionId", ASCENDING)], unique=True)
+            websites_collection.create_index([("crawlSessionId", ASCENDING)])
+            self._websites_collection = websites_collection
+        return self._websites_collection
     
     def _ensure_indexes(self) -> None:
         """Create indexes for efficient queries."""
@@ -459,6 +462,82 @@ class DocumentStore:
         
         return False
     
+    def add_pdfs_to_website(
+        self,
+        website_url: str,
+        crawl_session_id: str,
+        pdfs: List[Tuple[str, int, PdfDocument]],
+    ) -> int:
+        """
+        Add many PDFs to a website in one bulk write.
+        
+        Batched form of add_pdf_to_website(). PDFs are grouped by visited
+        URL; URLs already on the website get their PDFs pushed, new URLs
+        are pushed as whole entries (creating the website if needed).
+        PDFs are assumed to have fresh file IDs, so the per-PDF
+        duplicate lookup is skipped.
+        
+        Args:
+            website_url: Base URL of the website
+            crawl_session_id: Session ID for this crawl
+            pdfs: (visited_url, crawl_depth, pdf_document) tuples
+            
+        Returns:
+            Number of PDFs written
+        """
+        if not pdfs:
+            return 0
+        
+        collection = self._get_websites_collection()
+        website_filter = {"websiteUrl": website_url, "crawlSessionId": crawl_session_id}
+        
+        # Group PDFs by visited URL (first crawl depth seen wins)
+        visited_urls: dict[str, VisitedUrl] = {}
+        for visited_url, crawl_depth, pdf_document in pdfs:
+            entry = visited_urls.get(visited_url)
+            if entry is None:
+                visited_urls[visited_url] = VisitedUrl(
+                    url=visited_url, crawl_depth=crawl_depth, pdfs=[pdf_document]
+                )
+            else:
+                entry.pdfs.append(pdf_document)
+        
+        existing = collection.find_one(website_filter, {"visitedUrls.url": 1})
+        existing_urls = {
+            url.get("url") for url in existing.get("visitedUrls", [])
+        } if existing else set()
+        
+        now = datetime.utcnow()
+        operations = []
+        new_urls = []
+        for url, entry in visited_urls.items():
+            if url in existing_urls:
+                operations.append(UpdateOne(
+                    {**website_filter, "visitedUrls.url": url},
+                    {
+                        "$push": {"visitedUrls.$.pdfs": {"$each": [pdf.to_mongo_dict() for pdf in entry.pdfs]}},
+                        "$set": {"updatedAt": now}
+                    }
+                ))
+            else:
+                new_urls.append(entry.to_mongo_dict())
+        
+        if new_urls:
+            operations.append(UpdateOne(
+                website_filter,
+                {
+                    "$push": {"visitedUrls": {"$each": new_urls}},
+                    "$set": {"updatedAt": now},
+                    "$setOnInsert": {"createdAt": now}
+                },
+                upsert=True
+            ))
+        
+        collection.bulk_write(operations, ordered=False)
+        
+        logger.info(f"Added {len(pdfs)} PDFs to {website_url} in {len(operations)} operations")
+        return len(pdfs)
+    
     def get_website_by_session(self, crawl_session_id: str) -> List[WebsiteCrawl]:
         """Get all websites from a crawl session."""
         collection = self._get_websites_collection()
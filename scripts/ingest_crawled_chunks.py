@@ -1,5 +1,6 @@
 
 import asyncio
+import gzip
 import json
 import logging
 from pathlib import Path
@@ -19,15 +20,22 @@ logging.basicConfig(level=logging.INFO)
 logger = get_logger("ingest_script")
 
 async def ingest_chunks():
-    """Ingest chunks from all_chunks.json into Qdrant."""
+    """Ingest chunks from all_chunks.json(.gz) into Qdrant."""
     
-    chunks_file = Path("outputs/scraped/all_chunks.json")
+    # Pipeline writes gzip-compressed output; plain JSON is from older runs
+    chunks_file = Path("outputs/scraped/all_chunks.json.gz")
+    if not chunks_file.exists():
+        chunks_file = Path("outputs/scraped/all_chunks.json")
     if not chunks_file.exists():
         logger.error(f"Chunks file not found: {chunks_file}")
         return
 
     logger.info(f"Reading chunks from {chunks_file}...")
-    data = json.loads(chunks_file.read_text(encoding="utf-8"))
+    if chunks_file.suffix == ".gz":
+        with gzip.open(chunks_file, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+    else:
+        data = json.loads(chunks_file.read_text(encoding="utf-8"))
     
     parents = data.get("parents", [])
     children = data.get("children", [])